@@ -0,0 +1,59 @@
+import io
+import tracemalloc
+from argparse import ArgumentParser
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.parser import Parser
+
+from benchmark.generator import generate_program
+from error.error_manager import ErrorManager
+from lexer.lexer_for_parser import RegexLexerForParser
+
+
+def count_nodes(node: Node) -> int:
+    """Counts nodes of tree reachable from given node"""
+    count = 1
+    for cls in type(node).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            for child in _children(getattr(node, name, None)):
+                count += count_nodes(child)
+    return count
+
+
+def _children(value: object) -> list[Node]:
+    """Returns nodes held in attribute value"""
+    if isinstance(value, Node):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, Node)]
+    return []
+
+
+def measure(source: str) -> tuple[Program, int]:
+    """Parses source, returns tree and memory allocated for it"""
+    error_manager = ErrorManager()
+    lexer = RegexLexerForParser(io.StringIO(source), error_manager)
+    tracemalloc.start()
+    program = Parser(lexer, error_manager).parse_program()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return program, memory
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument(
+        "-f", "--functions", type=int, default=2000, help="number of functions"
+    )
+    args = arg_parser.parse_args()
+
+    program, memory = measure(generate_program(args.functions))
+    nodes = count_nodes(program)
+    print(
+        f"{nodes} nodes, {memory / 2**20:.1f} MiB, "
+        f"{memory / nodes:.1f} B/node"
+    )
+
+
+if __name__ == "__main__":
+    main()
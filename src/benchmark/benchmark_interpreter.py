@@ -0,0 +1,321 @@
+import contextlib
+import io
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from parser.parser import Parser
+
+from error.error_manager import ErrorManager
+from interpreter.bytecode_interpreter import BytecodeInterpreter
+from interpreter.closure_interpreter import ClosureInterpreter
+from interpreter.interpreter import Interpreter
+from interpreter.optimizer import OptimizingParser
+from interpreter.python_interpreter import PythonInterpreter
+from interpreter.visitor import Visitor
+from lexer.lexer_for_parser import LexerForParser
+
+ENGINES: dict[str, type[Visitor]] = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "python": PythonInterpreter,
+    "bytecode": BytecodeInterpreter,
+}
+
+SCRIPTS: dict[str, str] = {
+    "while loop": """
+def main(){
+    int counter = 0;
+    int total = 0;
+    while (counter < 20000) {
+        total = total + counter * 2;
+        counter = counter + 1;
+    }
+    print(total);
+}
+""",
+    "nested blocks": """
+def main(){
+    int counter = 0;
+    int total = 0;
+    while (counter < 5000) {
+        if (True) {
+            if (True) {
+                if (True) {
+                    if (True) {
+                        total = total + counter;
+                    }
+                }
+            }
+        }
+        counter = counter + 1;
+    }
+    print(total);
+}
+""",
+    "arithmetic": """
+def main(){
+    int counter = 0;
+    dec total = 0.0;
+    while (counter < 5000) {
+        dec x = (dec) counter;
+        total = total + x * 2.0 - x / 4.0 + (dec) (counter * 3 - 1);
+        counter = counter + 1;
+    }
+    print((int) total);
+}
+""",
+    "guards": """
+def bool expensive(int n){
+    int i = 0;
+    while (i < 20) {
+        i = i + 1;
+    }
+    return n > i;
+}
+
+def main(){
+    int counter = 0;
+    int hits = 0;
+    while (counter < 2000) {
+        if (counter < 1000 or expensive(counter)) {
+            hits = hits + 1;
+        }
+        if (counter > 1500 and expensive(counter)) {
+            hits = hits + 1;
+        }
+        counter = counter + 1;
+    }
+    print(hits);
+}
+""",
+    "constants": """
+def main(){
+    int counter = 0;
+    dec total = 0.0;
+    while (counter < 5000) {
+        if (1 == 1) {
+            total = total + 2.0 * 4.0 - 3.0 / 2.0 + (dec) (3 * 2);
+        } else {
+            total = total - 1.0;
+        }
+        if (2 * 3 > 7) {
+            total = total - 1.0;
+        }
+        counter = counter + 1;
+    }
+    print(total);
+}
+""",
+    "invariants": """
+def main(){
+    Circle circle = Circle(0.0, 0.0, 2.0);
+    Canvas canvas = Canvas();
+    int counter = 0;
+    while (counter < 1000) {
+        canvas.push(Square(0.0, 0.0, 1.0));
+        counter = counter + 1;
+    }
+    dec total = 0.0;
+    for (Shape shape : canvas) {
+        total = total + shape.area() * circle.area() / circle.perimeter();
+    }
+    while (total < circle.area() * 500.0) {
+        total = total + circle.r() * circle.d();
+    }
+    print(total);
+}
+""",
+    "gasket": """
+def Square gasket(dec x, dec y, dec dim, Canvas c){
+    if (dim < 2.0) {
+        Square square = Square(x, y, dim);
+        c.push(square);
+        return square;
+    } else {
+        dec new_dim = dim / 2.0;
+        gasket(x, y, new_dim, c);
+        gasket(x + new_dim, y, new_dim, c);
+        gasket(x + new_dim, y + new_dim, new_dim, c);
+    }
+}
+
+def main(){
+    Canvas c = Canvas();
+    c.push(gasket(0.0, 0.0, 256.0, c));
+    dec total = 0.0;
+    for (Shape shape : c) {
+        total = total + shape.area();
+    }
+    print(total);
+}
+""",
+    "canvas": """
+def main(){
+    Canvas c = Canvas();
+    dec x = 0.0;
+    while (x < 20000.0) {
+        c.push(Circle(x, x + 0.5, x + 1.0));
+        c.push(Rectangle(x, x + 0.5, x + 1.0, x + 2.0));
+        x = x + 1.0;
+    }
+    dec total = 0.0;
+    for (Shape shape : c) {
+        total = total + shape.perimeter();
+    }
+    print(total);
+}
+""",
+    "method calls": """
+def main(){
+    Canvas c = Canvas();
+    c.push(Circle(0.0, 0.0, 1.0));
+    c.push(Square(0.0, 0.0, 1.0));
+    dec total = 0.0;
+    dec dx = 3.0;
+    int i = 0;
+    while (i < 4000) {
+        for (Shape shape : c) {
+            shape.move(dx, 10.0);
+            total = total + shape.area();
+        }
+        i = i + 1;
+    }
+    print(total);
+}
+""",
+    "function calls": """
+def int fib(int n){
+    if (n < 2) {
+        return n;
+    } else {
+        return fib(n - 1) + fib(n - 2);
+    }
+}
+
+def main(){
+    print(fib(18));
+}
+""",
+    "memoization": """
+def dec gasketArea(dec dim){
+    if (dim < 2.0) {
+        return Triangle(0.0, 0.0, dim, dim, 60.0).area();
+    } else {
+        dec half = dim / 2.0;
+        return gasketArea(half) + gasketArea(half) + gasketArea(half);
+    }
+}
+
+def main(){
+    dec total = 0.0;
+    dec dim = 16.0;
+    while (dim < 256.0) {
+        int counter = 0;
+        while (counter < 5) {
+            total = total + gasketArea(dim);
+            counter = counter + 1;
+        }
+        dim = dim * 2.0;
+    }
+    print(total);
+}
+""",
+}
+
+
+def measure(
+    source: str,
+    engine: type[Visitor],
+    short_circuit: bool = False,
+    optimize: bool = False,
+    memo_size: int = 0,
+) -> tuple[str, float]:
+    """Interprets source with engine, returns its output and elapsed time"""
+    output = io.StringIO()
+    with io.StringIO(source) as stream, contextlib.redirect_stdout(output):
+        error_manager = ErrorManager()
+        parser = Parser(LexerForParser(stream, error_manager), error_manager)
+        if optimize:
+            parser = OptimizingParser(parser)
+        start = time.perf_counter()
+        engine(
+            parser, short_circuit=short_circuit, memo_size=memo_size
+        ).interpret()
+        return output.getvalue(), time.perf_counter() - start
+
+
+def measure_memory(source: str, engine: type[Visitor]) -> int:
+    """Interprets source with engine traced by tracemalloc, returns peak
+    size of memory allocated during interpretation"""
+    with io.StringIO(source) as stream, contextlib.redirect_stdout(
+        io.StringIO()
+    ):
+        error_manager = ErrorManager()
+        parser = Parser(LexerForParser(stream, error_manager), error_manager)
+        tracemalloc.start()
+        try:
+            engine(parser).interpret()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="number of repetitions"
+    )
+    arg_parser.add_argument(
+        "-sc",
+        "--short_circuit",
+        action="store_true",
+        help="interpret scripts with short-circuit or/and",
+    )
+    arg_parser.add_argument(
+        "-O",
+        "--optimize",
+        action="store_true",
+        help="fold constants and hoist loop invariants of scripts",
+    )
+    arg_parser.add_argument(
+        "-mc",
+        "--memo_cache",
+        type=int,
+        default=0,
+        help="memoize pure functions of scripts in caches of given size",
+    )
+    arg_parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="report peak memory traced by tracemalloc",
+    )
+    args = arg_parser.parse_args()
+
+    for name, source in SCRIPTS.items():
+        for engine_name, engine in ENGINES.items():
+            output, elapsed = min(
+                (
+                    measure(
+                        source,
+                        engine,
+                        args.short_circuit,
+                        args.optimize,
+                        args.memo_cache,
+                    )
+                    for _ in range(args.repeat)
+                ),
+                key=lambda result: result[1],
+            )
+            memory = ""
+            if args.memory:
+                peak = measure_memory(source, engine)
+                memory = f", peak {peak / 1024:.1f} KiB"
+            print(
+                f"{name:<14} {engine_name:<8} {elapsed:.3f} s, "
+                f"output {output.strip()!r}{memory}"
+            )
+
+
+if __name__ == "__main__":
+    main()
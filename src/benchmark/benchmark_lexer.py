@@ -0,0 +1,65 @@
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+
+from benchmark.generator import generate_scene
+from error.error_manager import ErrorManager
+from lexer.lexer import Lexer
+from lexer.regex_lexer import RegexLexer
+from lexer.token_manager import TokenType
+from utility.utility import LEXER_BUFFER_SIZE
+
+LEXER_MODES: dict[str, tuple[type[Lexer], int]] = {
+    "character": (Lexer, 0),
+    "buffered": (Lexer, LEXER_BUFFER_SIZE),
+    "whole file": (Lexer, -1),
+    "regex": (RegexLexer, LEXER_BUFFER_SIZE),
+}
+
+
+def measure(
+    path: str, lexer_type: type[Lexer], buffer_size: int
+) -> tuple[int, float]:
+    """Lexes whole file, returns number of tokens and elapsed time"""
+    with open(path, "r") as file:
+        start = time.perf_counter()
+        lexer = lexer_type(file, ErrorManager(), buffer_size=buffer_size)
+        tokens = 1
+        while lexer.next_token().token_type != TokenType.EOF:
+            tokens += 1
+        return tokens, time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument(
+        "-s", "--shapes", type=int, default=20000, help="number of shapes"
+    )
+    arg_parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="number of repetitions"
+    )
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "scene.txt")
+        with open(path, "w") as file:
+            file.write(generate_scene(args.shapes))
+        print(f"source size: {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        for name, (lexer_type, buffer_size) in LEXER_MODES.items():
+            tokens, elapsed = min(
+                (
+                    measure(path, lexer_type, buffer_size)
+                    for _ in range(args.repeat)
+                ),
+                key=lambda result: result[1],
+            )
+            print(
+                f"{name:<12} {tokens} tokens in {elapsed:.3f} s "
+                f"({tokens / elapsed:,.0f} tokens/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+from benchmark.generator import generate_scene
+from error.error_manager import ErrorManager
+from lexer.lexer import Lexer
+from lexer.mmap_lexer import MmapLexer
+from lexer.regex_lexer import RegexLexer
+from lexer.token_manager import TokenType
+from utility.utility import LEXER_BUFFER_SIZE
+
+LEXER_MODES: dict[str, tuple[type[Lexer], int]] = {
+    "whole file": (RegexLexer, -1),
+    "buffered": (RegexLexer, LEXER_BUFFER_SIZE),
+    "mmap": (MmapLexer, LEXER_BUFFER_SIZE),
+}
+
+
+def peak_rss() -> int:
+    """Returns peak resident memory of current process in KiB"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def lex(path: str, mode: str) -> None:
+    """Lexes whole file, prints elapsed time and peak resident memory"""
+    lexer_type, buffer_size = LEXER_MODES[mode]
+    file_mode = "rb" if issubclass(lexer_type, MmapLexer) else "r"
+    with open(path, file_mode) as file:
+        start = time.perf_counter()
+        lexer = lexer_type(file, ErrorManager(), buffer_size=buffer_size)
+        while lexer.next_token().token_type != TokenType.EOF:
+            pass
+        elapsed = time.perf_counter() - start
+    print(elapsed, peak_rss())
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument(
+        "-s",
+        "--shapes",
+        type=int,
+        nargs="+",
+        default=[20000, 80000],
+        help="numbers of shapes",
+    )
+    arg_parser.add_argument(
+        "--lex",
+        nargs=2,
+        metavar=("PATH", "MODE"),
+        help="lex single file in child process",
+    )
+    args = arg_parser.parse_args()
+    if args.lex:
+        lex(*args.lex)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        for shapes in args.shapes:
+            path = os.path.join(directory, f"scene_{shapes}.txt")
+            with open(path, "w") as file:
+                file.write(generate_scene(shapes))
+            size = os.path.getsize(path) / 2**20
+            for mode in LEXER_MODES:
+                output = subprocess.run(
+                    [sys.executable, "-m", __spec__.name, "--lex", path, mode],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+                elapsed, peak = output.split()
+                print(
+                    f"{size:6.1f} MiB {mode:<12} {float(elapsed):.3f} s, "
+                    f"peak RSS {int(peak) / 2**10:.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
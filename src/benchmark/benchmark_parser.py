@@ -0,0 +1,38 @@
+import io
+import time
+from argparse import ArgumentParser
+from parser.parser import Parser
+
+from benchmark.generator import generate_program
+from error.error_manager import ErrorManager
+from lexer.lexer_for_parser import RegexLexerForParser
+
+
+def measure(source: str) -> float:
+    """Parses source pulling tokens from lexer, returns time of lexing and
+    parsing"""
+    error_manager = ErrorManager()
+    start = time.perf_counter()
+    lexer = RegexLexerForParser(io.StringIO(source), error_manager)
+    Parser(lexer, error_manager).parse_program()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument(
+        "-f", "--functions", type=int, default=2000, help="number of functions"
+    )
+    arg_parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="number of repetitions"
+    )
+    args = arg_parser.parse_args()
+    source = generate_program(args.functions)
+    print(f"source size: {len(source) / 2**20:.1f} MiB")
+
+    elapsed = min(measure(source) for _ in range(args.repeat))
+    print(f"lexing and parsing {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import io
+import tracemalloc
+from argparse import ArgumentParser
+from typing import Callable, Union
+
+from benchmark.generator import generate_scene
+from error.error_manager import ErrorManager
+from lexer.regex_lexer import RegexLexer
+from lexer.token_manager import Token, TokenTape, TokenType
+
+
+def read_list(source: str) -> list[Token]:
+    """Reads all tokens of source into list"""
+    lexer = RegexLexer(io.StringIO(source), ErrorManager())
+    tokens = [lexer.next_token()]
+    while tokens[-1].token_type != TokenType.EOF:
+        tokens.append(lexer.next_token())
+    return tokens
+
+
+def read_tape(source: str) -> TokenTape:
+    """Reads all tokens of source into token tape"""
+    lexer = RegexLexer(io.StringIO(source), ErrorManager())
+    return TokenTape.from_lexer(lexer)
+
+
+def measure(
+    source: str, read: Callable[[str], Union[list[Token], TokenTape]]
+) -> tuple[int, int]:
+    """Returns number of tokens and memory allocated for them"""
+    tracemalloc.start()
+    tokens = read(source)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(tokens), memory
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument(
+        "-s", "--shapes", type=int, default=5000, help="number of shapes"
+    )
+    args = arg_parser.parse_args()
+    source = generate_scene(args.shapes)
+
+    for name, read in (("list", read_list), ("tape", read_tape)):
+        tokens, memory = measure(source, read)
+        print(
+            f"{name:<5} {tokens} tokens, {memory / 2**20:.1f} MiB, "
+            f"{memory / tokens:.1f} B/token"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+SHAPES: list[tuple[str, str]] = [
+    ("Circle", "{x}, {y}, 2.5"),
+    ("Square", "{x}, {y}, 4.0"),
+    ("Rectangle", "{x}, {y}, 3.0, 6.5"),
+    ("Triangle", "{x}, {y}, 3.0, 4.0, 55.0"),
+    ("Rhomb", "{x}, {y}, 4.0, 60.0"),
+    ("Polygon", "{x}, {y}, 5.0, 6"),
+]
+
+
+def generate_scene(shapes: int) -> str:
+    """Generates scene script declaring and pushing given number of shapes"""
+    lines = ["def main(){", "    Canvas scene_canvas = Canvas();"]
+    for index in range(shapes):
+        name, arguments = SHAPES[index % len(SHAPES)]
+        arguments = arguments.format(x=f"{index}.0", y=f"{index % 97}.5")
+        variable = f"{name.lower()}_number_{index}"
+        lines.append(f"    # {name} placed on the scene, number {index}")
+        lines.append(f"    {name} {variable} = {name}({arguments});")
+        lines.append(f"    scene_canvas.push({variable});")
+        lines.append(f'    print("{name} area: ", {variable}.area());')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_program(functions: int) -> str:
+    """Generates program with given number of arithmetic functions called
+    from main"""
+    lines = []
+    for index in range(functions):
+        lines += [
+            f"def int compute_{index}(int limit, int step) {{",
+            "    # sums shifted multiples of step below limit",
+            "    int total = 0;",
+            "    int counter = 0;",
+            "    while (counter < limit) {",
+            f"        if (counter * step > {index % 7} and "
+            "not (counter == 3)) {",
+            f"            total = total + counter * step - {index % 5};",
+            "        } else {",
+            "            total = total - (1 + counter) * 2;",
+            "        }",
+            "        counter = counter + 1;",
+            "    }",
+            "    return total;",
+            "}",
+        ]
+    lines.append("def main(){")
+    lines.append("    int result = 0;")
+    for index in range(functions):
+        call = f"compute_{index}(10, {index % 9})"
+        lines.append(f"    result = result + {call};")
+    lines.append('    print("result: ", result);')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
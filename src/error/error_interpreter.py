@@ -1,4 +1,3 @@
-from copy import deepcopy
 from parser.objects.type import Type
 
 from utility.utility import ALL_TYPES, Position
@@ -6,7 +5,7 @@ from utility.utility import ALL_TYPES, Position
 
 class InterpreterError(Exception):
     def __init__(self, message: str, position: Position) -> None:
-        self.position = deepcopy(position)
+        self.position = position
         self.message = message
 
     def __str__(self) -> str:
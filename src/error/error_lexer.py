@@ -1,11 +1,9 @@
-from copy import deepcopy
-
 from utility.utility import Position
 
 
 class LexerError(Exception):
     def __init__(self, message: str, position: Position) -> None:
-        self.position = deepcopy(position)
+        self.position = position
         self.message = message
 
     def __str__(self) -> str:
@@ -1,12 +1,10 @@
-from copy import deepcopy
-
 from lexer.token_manager import TokenType
 from utility.utility import Position
 
 
 class ParserError(Exception):
     def __init__(self, message: str, position: Position) -> None:
-        self.position = deepcopy(position)
+        self.position = position
         self.message = message
 
     def __str__(self) -> str:
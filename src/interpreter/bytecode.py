@@ -0,0 +1,895 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from functools import partial
+from parser.objects.block import Block
+from parser.objects.expression import (BooleanExpression, CallExpression,
+                                       CastExpression, DecimalExpression,
+                                       Expression, IdentifierExpression,
+                                       IntegerExpression, InvariantExpression,
+                                       LogicalExpression, NegatedExpression,
+                                       StringExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from parser.objects.type import Shape, Type
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+from error.error_interpreter import (InvalidIterableTypeError,
+                                     MissingAssignmentValueError,
+                                     MissingDeclarationValueError,
+                                     MissingForConditionError,
+                                     MissingIfConditionError,
+                                     MissingMainFunctionError,
+                                     MissingReturnValueError,
+                                     MissingVariableDeclarationError,
+                                     MissingWhileConditionError,
+                                     NumberOfArgumentError, RedeclarationError)
+from interpreter.runtime import (CAST_FUNCTIONS, SHORT_CIRCUIT_OPERATORS,
+                                 binary_type, cast, check_left_operand,
+                                 check_right_operand, negate)
+from interpreter.visitor import Visitor
+from lexer.token_manager import TokenType
+from utility.utility import (LITERAL_TYPES, OBJECT_PARAMETERS, OBJECT_TYPES,
+                             Position)
+
+
+class Opcode(IntEnum):
+    """Instructions of virtual machine, operands are given in comments as
+    registers (r), constants (k), instruction indices (i) and counts (n)"""
+
+    MOVE = 0  # r[a] = r[b]
+    ADD = 1  # r[a] = r[b] + r[c]
+    SUBTRACT = 2  # r[a] = r[b] - r[c]
+    MULTIPLY = 3  # r[a] = r[b] * r[c]
+    DIVIDE = 4  # r[a] = r[b] / r[c]
+    EQUAL = 5  # r[a] = r[b] == r[c]
+    NOT_EQUAL = 6  # r[a] = r[b] != r[c]
+    GREATER = 7  # r[a] = r[b] > r[c]
+    LESS = 8  # r[a] = r[b] < r[c]
+    GREATER_EQUAL = 9  # r[a] = r[b] >= r[c]
+    LESS_EQUAL = 10  # r[a] = r[b] <= r[c]
+    OR = 11  # r[a] = r[b] or r[c]
+    AND = 12  # r[a] = r[b] and r[c]
+    NEGATE = 13  # r[a] = -r[b]
+    NOT = 14  # r[a] = not r[b]
+    CAST = 15  # r[a] = k[c](r[b])
+    JUMP = 16  # go to i[a]
+    JUMP_IF_FALSE = 17  # if not r[a] go to i[b]
+    JUMP_IF_TRUE = 18  # if r[a] go to i[b]
+    CHECK_DECLARATION = 19  # check that r[a] has type k[b]
+    CHECK_ASSIGNMENT = 20  # check that r[a] has type k[b]
+    RAISE = 21  # raise k[a]
+    CALL = 22  # r[a] = function k[b] called with r[c]...
+    RETURN = 23  # return r[a]
+    RETURN_LAST = 24  # return value returned by last finished call
+    PRINT = 25  # print r[a]...r[a + n[b] - 1]
+    CREATE = 26  # r[a] = object of class k[b] created from n[d] r[c]...
+    CREATE_INVALID = 27  # raise wrong number of arguments of CREATE
+    GET_METHOD = 28  # r[a] = method k[c] of r[b]
+    INVOKE = 29  # r[a] = r[b] called with n[d] r[c]...
+    DYNAMIC_METHOD = 30  # r[a] = method named by r[c] called on r[b]
+    GET_ITERATOR = 31  # r[a] = iterator over shapes of canvas r[b]
+    FOR_ITER = 32  # r[b] = next of r[a], go to i[c] when exhausted
+    JUMP_IF_SET = 33  # if r[a] is not None go to i[b]
+    TAIL_CALL = 34  # return function k[b] called with r[c]... in place
+    CHECK_ARGUMENT = 35  # check that r[a] is argument k[b] of function k[c]
+
+
+BINARY_OPCODES: dict[str, Opcode] = {
+    TokenType.ADD.value: Opcode.ADD,
+    TokenType.SUBTRACT.value: Opcode.SUBTRACT,
+    TokenType.MULTIPLY.value: Opcode.MULTIPLY,
+    TokenType.DIVIDE.value: Opcode.DIVIDE,
+    TokenType.EQUAL.value: Opcode.EQUAL,
+    TokenType.NOT_EQUAL.value: Opcode.NOT_EQUAL,
+    TokenType.GREATER.value: Opcode.GREATER,
+    TokenType.LESS.value: Opcode.LESS,
+    TokenType.GREATER_EQUAL.value: Opcode.GREATER_EQUAL,
+    TokenType.LESS_EQUAL.value: Opcode.LESS_EQUAL,
+    TokenType.OR.value: Opcode.OR,
+    TokenType.AND.value: Opcode.AND,
+}
+
+Instruction = tuple[int, int, int, int, int]
+
+
+class Slot(NamedTuple):
+    """Register of variable with type used in its runtime checks and type
+    its value is known to have"""
+
+    register: int
+    type: Union[type, Type]
+    value_type: Optional[type]
+
+
+class Resumption(NamedTuple):
+    """Block holding compiled statement, which statements from index on
+    follow it, or loop containing it with registers of its iterator and
+    variable, depth is number of scopes seen by them"""
+
+    node: Node
+    index: int
+    depth: int
+    iterator: int = 0
+    variable: int = 0
+
+
+class Code:
+    """Compiled function, its registers hold parameters, variables and
+    temporary values followed by literal values of function"""
+
+    name: str
+    instructions: list[Instruction]
+    positions: list[Position]
+    constants: list[Any]
+    registers: list[Any]
+    parameters: list[tuple[type, Type]]
+    return_type: Optional[type]
+
+    def __init__(self, name: str, return_type: Optional[type]) -> None:
+        self.name = name
+        self.instructions = []
+        self.positions = []
+        self.constants = []
+        self.registers = []
+        self.parameters = []
+        self.return_type = return_type
+
+    def __str__(self) -> str:
+        output = f"Code({self.name})"
+        for index, (opcode, *operands) in enumerate(self.instructions):
+            output += f"\n{index:>5} {Opcode(opcode).name:<18}"
+            output += " ".join(f"{operand:>4}" for operand in operands)
+        return output
+
+
+class BytecodeCompiler(Visitor):
+    """Compiles program into codes of its functions"""
+
+    short_circuit: bool = False
+    functions: dict[str, tuple[Code, Function]]
+    code: Code
+    instructions: list[list[int]]
+    literals: dict[Any, int]
+    literal_values: list[Any]
+    scopes: list[dict[str, Slot]]
+    invariants: dict[InvariantExpression, int]
+    resumptions: list[Resumption]
+    returned: bool
+    target: Optional[int]
+    next_register: int
+    register_count: int
+
+    def compile(self, program: Program) -> Code:
+        """Compiles program into code calling its main function"""
+        self.functions = {}
+        self.invariants = {}
+        for function in program.objects:
+            if isinstance(function, Function):
+                return_type = function.declaration_type
+                if return_type in LITERAL_TYPES:
+                    return_type = LITERAL_TYPES[return_type]
+                code = Code(function.name, return_type)
+                code.parameters = [
+                    (
+                        LITERAL_TYPES.get(parameter_type, parameter_type),
+                        parameter_type,
+                    )
+                    for parameter_type, _ in function.argument_list
+                ]
+                self.functions[function.name] = (code, function)
+
+        for code, function in self.functions.values():
+            self._start(code)
+            self.scopes = [{}]
+            for (value_type, parameter_type), (_, identifier) in zip(
+                code.parameters, function.argument_list
+            ):
+                self.scopes[0][identifier] = Slot(
+                    self._register(), parameter_type, value_type
+                )
+            self._statement(function.block)
+            self._emit(Opcode.RETURN_LAST, function.position)
+            self._finish()
+
+        code = Code("", None)
+        self._start(code)
+        self.scopes = [{}]
+        for object in program.objects:
+            if not isinstance(object, Function):
+                self._statement(object)
+        if "main" in self.functions:
+            main = self.functions["main"][1]
+            self._expression(
+                CallExpression(main.position, None, main.name, [])
+            )
+        else:
+            self._raise(MissingMainFunctionError, Position(0, 0))
+        self._emit(Opcode.RETURN_LAST, Position(0, 0))
+        self._finish()
+        return code
+
+    def _start(self, code: Code) -> None:
+        self.code = code
+        self.instructions = []
+        self.literals = {}
+        self.literal_values = []
+        self.next_register = 0
+        self.register_count = 0
+        self.resumptions = []
+        self.returned = False
+        self.target = None
+
+    def _finish(self) -> None:
+        """Places literals after other registers and stores instructions"""
+        base = self.register_count
+        self.code.instructions = [
+            tuple(
+                operand if operand >= 0 else base - operand - 1
+                for operand in instruction
+            )
+            for instruction in self.instructions
+        ]
+        self.code.registers = [None] * base + self.literal_values
+
+    def _emit(
+        self,
+        opcode: Opcode,
+        position: Position,
+        a: int = 0,
+        b: int = 0,
+        c: int = 0,
+        d: int = 0,
+    ) -> int:
+        self.instructions.append([int(opcode), a, b, c, d])
+        self.code.positions.append(position)
+        return len(self.instructions) - 1
+
+    def _patch(self, index: int, operand: int) -> None:
+        """Sets operand of jump instruction to next instruction"""
+        self.instructions[index][operand] = len(self.instructions)
+
+    def _constant(self, value: Any) -> int:
+        self.code.constants.append(value)
+        return len(self.code.constants) - 1
+
+    def _literal(self, value: Any, key: Any = None) -> int:
+        """Returns register holding literal value, values with equal keys
+        are stored in one register"""
+        key = (type(value), value) if key is None else key
+        if key not in self.literals:
+            self.literal_values.append(value)
+            self.literals[key] = -len(self.literal_values)
+        return self.literals[key]
+
+    def _register(self) -> int:
+        register = self.next_register
+        self.next_register += 1
+        self.register_count = max(self.register_count, self.next_register)
+        return register
+
+    def _raise(
+        self, error: Callable[..., Any], position: Position, *arguments: Any
+    ) -> None:
+        """Compiles raising of error created when instruction is reached"""
+        self._emit(
+            Opcode.RAISE,
+            position,
+            self._constant(partial(error, position, *arguments)),
+        )
+
+    def _find(self, identifier: str) -> Optional[Slot]:
+        for scope in reversed(self.scopes):
+            if identifier in scope:
+                return scope[identifier]
+        return None
+
+    def invalid_visit(self, node: Node) -> tuple[int, Optional[type]]:
+        error = f"No visit_{node.__class__.__name__} method defined"
+        self._emit(
+            Opcode.RAISE,
+            Position(0, 0),
+            self._constant(partial(Exception, error)),
+        )
+        return self._literal(None), None
+
+    def _statement(self, statement: Node) -> None:
+        """Compiles statement, releasing its temporary registers"""
+        next_register = self.next_register
+        self.target = None
+        if isinstance(statement, Block):
+            self.scopes.append({})
+            for index, block_statement in enumerate(statement.statements, 1):
+                self.resumptions.append(
+                    Resumption(statement, index, len(self.scopes))
+                )
+                self._statement(block_statement)
+                self.resumptions.pop()
+            self.scopes.pop()
+            self.next_register = next_register
+        elif isinstance(statement, DeclarationStatement):
+            self.visit(statement)
+        else:
+            self.visit(statement)
+            self.next_register = next_register
+
+    def _expression(
+        self, expression: Expression, target: Optional[int] = None
+    ) -> tuple[int, Optional[type]]:
+        """Compiles expression, returns register holding its value (target
+        if given) and its type if it is known"""
+        self.target = target
+        register, value_type = self.visit(expression)
+        if target is not None and register != target:
+            self._emit(Opcode.MOVE, expression.position, target, register)
+            register = target
+        return register, value_type
+
+    def _target(self) -> int:
+        """Returns register requested for value of compiled expression, it
+        has to be taken before subexpressions are compiled"""
+        target, self.target = self.target, None
+        return self._register() if target is None else target
+
+    def _arguments(self, arguments: list[Expression]) -> int:
+        """Compiles arguments into consecutive registers, returns first"""
+        start = self.next_register
+        registers = [self._register() for _ in arguments]
+        for argument, register in zip(arguments, registers):
+            self._expression(argument, register)
+        return start
+
+    def _condition(self, condition: Expression) -> Optional[int]:
+        """Compiles condition, returns its register or None when it is
+        always true as every variable is"""
+        if isinstance(condition, IdentifierExpression) and self._find(
+            condition.identifier
+        ):
+            return None
+        return self._expression(condition)[0]
+
+    def _invariants(
+        self, loop: Union[WhileStatement, IterateStatement]
+    ) -> None:
+        """Compiles clearing of registers of invariants of loop on its
+        entry"""
+        for invariant in loop.invariants:
+            register = self._register()
+            self.invariants[invariant] = register
+            self._emit(
+                Opcode.MOVE, loop.position, register, self._literal(None)
+            )
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> None:
+        position = if_statement.position
+        if if_statement.condition is None:
+            self._raise(MissingIfConditionError, position)
+            return
+        condition = self._condition(if_statement.condition)
+        jump = None
+        if condition is not None:
+            jump = self._emit(Opcode.JUMP_IF_FALSE, position, condition)
+        self._statement(if_statement.block)
+        if if_statement.else_block:
+            end = self._emit(Opcode.JUMP, position)
+            if jump is not None:
+                self._patch(jump, 2)
+            self._statement(if_statement.else_block)
+            self._patch(end, 1)
+        elif jump is not None:
+            self._patch(jump, 2)
+
+    def _visit_WhileStatement(self, while_statement: WhileStatement) -> None:
+        position = while_statement.position
+        if while_statement.condition is None:
+            self._raise(MissingWhileConditionError, position)
+            return
+        self._invariants(while_statement)
+        jump = self._emit(Opcode.JUMP, position)
+        start = len(self.instructions)
+        self.resumptions.append(
+            Resumption(while_statement, 0, len(self.scopes))
+        )
+        self._statement(while_statement.block)
+        self.resumptions.pop()
+        self._patch(jump, 1)
+        condition = self._condition(while_statement.condition)
+        if condition is None:
+            self._emit(Opcode.JUMP, position, start)
+        else:
+            self._emit(Opcode.JUMP_IF_TRUE, position, condition, start)
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> None:
+        position = iterate_statement.position
+        if iterate_statement.expression is None:
+            self._raise(MissingForConditionError, position)
+            return
+        if iterate_statement.type != Shape:
+            self._raise(
+                InvalidIterableTypeError,
+                position,
+                iterate_statement.type,
+                Shape,
+            )
+            return
+
+        canvas, _ = self._expression(iterate_statement.expression)
+        iterator = self._register()
+        variable = self._register()
+        self._emit(Opcode.GET_ITERATOR, position, iterator, canvas)
+        self.scopes.append(
+            {
+                iterate_statement.identifier: Slot(
+                    variable, iterate_statement.type, None
+                )
+            }
+        )
+        self._invariants(iterate_statement)
+        start = self._emit(Opcode.FOR_ITER, position, iterator, variable)
+        self.resumptions.append(
+            Resumption(
+                iterate_statement, 0, len(self.scopes), iterator, variable
+            )
+        )
+        self._statement(iterate_statement.block)
+        self.resumptions.pop()
+        self._emit(Opcode.JUMP, position, start)
+        self._patch(start, 3)
+        self.scopes.pop()
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> None:
+        position = return_statement.position
+        if return_statement.expression is None:
+            self._raise(MissingReturnValueError, position)
+            return
+        if not self._resumes():
+            if self._is_tail_call(return_statement.expression):
+                self._tail_call(return_statement.expression)
+                return
+            register, _ = self._expression(return_statement.expression)
+            self._emit(Opcode.RETURN, position, register)
+            return
+        register = self._register()
+        self._expression(return_statement.expression, register)
+        self._resume(register)
+        self._emit(Opcode.RETURN, position, register)
+
+    def _resumes(self) -> bool:
+        """Checks that execution goes on after compiled return statement,
+        that is it is followed by return statement in one of its blocks or
+        it is in loop"""
+        return any(
+            not isinstance(node, Block)
+            or any(
+                isinstance(statement, ReturnStatement)
+                for statement in node.statements[index:]
+            )
+            for node, index, *_ in self.resumptions
+        )
+
+    def _resume(self, register: int) -> None:
+        """Compiles execution going on after return statement until end of
+        function, only return statements following it in its blocks are
+        run, loops containing it keep iterating over return statements of
+        their bodies and calls evaluate to None, value is kept in
+        register"""
+        scopes = self.scopes
+        self.returned = True
+        for node, index, depth, iterator, variable in reversed(
+            self.resumptions
+        ):
+            self.scopes = scopes[:depth]
+            if isinstance(node, Block):
+                self._returns(node.statements[index:], register)
+                continue
+            position = node.position
+            if isinstance(node, IterateStatement):
+                start = self._emit(
+                    Opcode.FOR_ITER, position, iterator, variable
+                )
+                self._returns(node.block.statements, register)
+                self._emit(Opcode.JUMP, position, start)
+                self._patch(start, 3)
+                continue
+            start = len(self.instructions)
+            condition = self._condition(node.condition)
+            jump = None
+            if condition is not None:
+                jump = self._emit(Opcode.JUMP_IF_FALSE, position, condition)
+            self._returns(node.block.statements, register)
+            self._emit(Opcode.JUMP, position, start)
+            if jump is not None:
+                self._patch(jump, 2)
+        self.scopes = scopes
+        self.returned = False
+
+    def _returns(self, statements: list[Node], register: int) -> None:
+        """Compiles return statements among statements into setting
+        register"""
+        for statement in statements:
+            if not isinstance(statement, ReturnStatement):
+                continue
+            if statement.expression is None:
+                self._raise(MissingReturnValueError, statement.position)
+            else:
+                self._expression(statement.expression, register)
+
+    def _is_tail_call(self, expression: Expression) -> bool:
+        """Checks that expression calls function with matching number of
+        arguments, which value needs no check of return type of compiled
+        function"""
+        if not (
+            isinstance(expression, CallExpression)
+            and expression.root_expression is None
+            and expression.called_expression in self.functions
+        ):
+            return False
+        code, function = self.functions[expression.called_expression]
+        return len(expression.arguments) == len(
+            function.argument_list
+        ) and self.code.return_type in [None, code.return_type]
+
+    def _tail_call(self, function_call: CallExpression) -> None:
+        """Compiles call replacing compiled function, so that its value is
+        returned directly to the caller"""
+        code, _ = self.functions[function_call.called_expression]
+        start = self._checked_arguments(function_call)
+        self._emit(
+            Opcode.TAIL_CALL,
+            function_call.position,
+            0,
+            self._constant(code),
+            start,
+        )
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> None:
+        position = declaration_statement.position
+        identifier = declaration_statement.identifier
+        if declaration_statement.expression is None:
+            self._raise(MissingDeclarationValueError, position)
+            return
+
+        declaration_type = declaration_statement.type
+        if declaration_type in LITERAL_TYPES:
+            declaration_type = LITERAL_TYPES[declaration_type]
+        variable = self._register()
+        _, value_type = self._expression(
+            declaration_statement.expression, variable
+        )
+        self.next_register = variable + 1
+        if value_type != declaration_type:
+            self._emit(
+                Opcode.CHECK_DECLARATION,
+                position,
+                variable,
+                self._constant(declaration_type),
+            )
+        if self._find(identifier) is not None:
+            self._raise(RedeclarationError, position, identifier)
+        self.scopes[-1][identifier] = Slot(
+            variable, declaration_type, declaration_type
+        )
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> None:
+        position = assignment_statement.position
+        if assignment_statement.expression is None:
+            self._raise(MissingAssignmentValueError, position)
+            return
+
+        target = assignment_statement.identifier
+        slot = None
+        if isinstance(target, IdentifierExpression):
+            slot = self._find(target.identifier)
+        if slot is None:
+            self._expression(assignment_statement.expression)
+            if isinstance(target, IdentifierExpression):
+                self._raise(
+                    MissingVariableDeclarationError,
+                    position,
+                    target.identifier,
+                )
+            else:
+                self._emit(
+                    Opcode.RAISE,
+                    position,
+                    self._constant(partial(getattr, target, "identifier")),
+                )
+            return
+
+        _, value_type = self._expression(
+            assignment_statement.expression, slot.register
+        )
+        if value_type != slot.type:
+            self._emit(
+                Opcode.CHECK_ASSIGNMENT,
+                position,
+                slot.register,
+                self._constant(slot.type),
+            )
+
+    def _visit_CallExpression(
+        self, call_expression: CallExpression
+    ) -> tuple[int, Optional[type]]:
+        if self.returned:
+            return self._literal(None), None
+        if call_expression.root_expression is not None:
+            return self._variable_call(call_expression)
+        if call_expression.called_expression in self.functions:
+            return self._function_call(call_expression)
+        return self._method_call(call_expression)
+
+    def _function_call(
+        self, function_call: CallExpression
+    ) -> tuple[int, Optional[type]]:
+        """Compiles call of function defined in program"""
+        position = function_call.position
+        code, function = self.functions[function_call.called_expression]
+        if len(function_call.arguments) != len(function.argument_list):
+            self._raise(
+                NumberOfArgumentError,
+                position,
+                function.name,
+                function_call.arguments,
+                function.argument_list,
+            )
+            return self._literal(None), None
+
+        target = self._target()
+        start = self._checked_arguments(function_call)
+        self._emit(
+            Opcode.CALL, position, target, self._constant(code), start
+        )
+        return target, code.return_type
+
+    def _checked_arguments(self, function_call: CallExpression) -> int:
+        """Compiles arguments of function call into consecutive registers,
+        checking type of each one before next one is evaluated, returns
+        first register"""
+        code, _ = self.functions[function_call.called_expression]
+        name = self._constant(code.name)
+        start = self.next_register
+        registers = [self._register() for _ in function_call.arguments]
+        for argument, register, parameter in zip(
+            function_call.arguments, registers, code.parameters
+        ):
+            _, value_type = self._expression(argument, register)
+            if value_type != parameter[0]:
+                self._emit(
+                    Opcode.CHECK_ARGUMENT,
+                    function_call.position,
+                    register,
+                    self._constant(parameter),
+                    name,
+                )
+        return start
+
+    def _method_call(
+        self, method_call: CallExpression
+    ) -> tuple[int, Optional[type]]:
+        """Compiles call of print, object constructor or method name"""
+        position = method_call.position
+        name = method_call.called_expression
+        arguments = method_call.arguments
+        if name == "print":
+            start = self._arguments(arguments)
+            self._emit(Opcode.PRINT, position, start, len(arguments))
+            return self._literal(None), None
+
+        if name in OBJECT_TYPES:
+            object_type = OBJECT_TYPES[name]
+            target = self._target()
+            start = self._arguments(arguments)
+            opcode = Opcode.CREATE
+            if len(arguments) != len(OBJECT_PARAMETERS[object_type]):
+                opcode = Opcode.CREATE_INVALID
+            self._emit(
+                opcode,
+                position,
+                target,
+                self._constant(object_type),
+                start,
+                len(arguments),
+            )
+            return target, object_type
+
+        return self._literal((name, arguments), id(method_call)), tuple
+
+    def _variable_call(
+        self, variable_call: CallExpression
+    ) -> tuple[int, Optional[type]]:
+        """Compiles call of method on value of root expression"""
+        position = variable_call.position
+        target = self._target()
+        receiver, _ = self._expression(variable_call.root_expression)
+        called_expression = variable_call.called_expression
+        if (
+            isinstance(called_expression, CallExpression)
+            and called_expression.root_expression is None
+            and called_expression.called_expression != "print"
+            and called_expression.called_expression not in OBJECT_TYPES
+            and called_expression.called_expression not in self.functions
+        ):
+            method = self._register()
+            self._emit(
+                Opcode.GET_METHOD,
+                position,
+                method,
+                receiver,
+                self._constant(called_expression.called_expression),
+            )
+            start = self._arguments(called_expression.arguments)
+            self._emit(
+                Opcode.INVOKE,
+                position,
+                target,
+                method,
+                start,
+                len(called_expression.arguments),
+            )
+            return target, None
+
+        called, _ = self._expression(called_expression)
+        self._emit(Opcode.DYNAMIC_METHOD, position, target, receiver, called)
+        return target, None
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> tuple[int, Optional[type]]:
+        slot = self._find(identifier_expression.identifier)
+        if slot is None:
+            self._raise(
+                MissingVariableDeclarationError,
+                identifier_expression.position,
+                identifier_expression.identifier,
+            )
+            return self._literal(None), None
+        return slot.register, slot.value_type
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> tuple[int, Optional[type]]:
+        """Value is kept in register of invariant, it is computed only if
+        the register is not set since entry of loop"""
+        if self.returned:
+            return self.visit(invariant_expression.expression)
+        self.target = None
+        register = self.invariants[invariant_expression]
+        jump = self._emit(
+            Opcode.JUMP_IF_SET, invariant_expression.position, register
+        )
+        _, value_type = self._expression(
+            invariant_expression.expression, register
+        )
+        self._patch(jump, 2)
+        return register, value_type
+
+    def _visit_CastExpression(
+        self, cast_expression: CastExpression
+    ) -> tuple[int, Optional[type]]:
+        target = self._target()
+        register, _ = self._expression(cast_expression.expression)
+        cast_type = cast_expression.cast_type
+        function = CAST_FUNCTIONS.get(cast_type, partial(cast, cast_type))
+        self._emit(
+            Opcode.CAST,
+            cast_expression.position,
+            target,
+            register,
+            self._constant(function),
+        )
+        return target, LITERAL_TYPES.get(cast_type)
+
+    def _visit_IntegerExpression(
+        self, integer_expression: IntegerExpression
+    ) -> tuple[int, Optional[type]]:
+        return self._literal(int(integer_expression.value)), int
+
+    def _visit_DecimalExpression(
+        self, decimal_expression: DecimalExpression
+    ) -> tuple[int, Optional[type]]:
+        return self._literal(float(decimal_expression.value)), float
+
+    def _visit_BooleanExpression(
+        self, boolean_expression: BooleanExpression
+    ) -> tuple[int, Optional[type]]:
+        return self._literal(bool(boolean_expression.value)), bool
+
+    def _visit_StringExpression(
+        self, string_expression: StringExpression
+    ) -> tuple[int, Optional[type]]:
+        return self._literal(str(string_expression.value)), str
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> tuple[int, Optional[type]]:
+        operator = logical_expression.operator
+        if self.short_circuit and operator in SHORT_CIRCUIT_OPERATORS:
+            return self._short_circuit(logical_expression)
+        target = self._target()
+        left, left_type = self._expression(logical_expression.left)
+        right, right_type = self._expression(logical_expression.right)
+        self._emit(
+            BINARY_OPCODES[operator],
+            logical_expression.position,
+            target,
+            left,
+            right,
+        )
+        return target, binary_type(operator, left_type, right_type)
+
+    def _short_circuit(
+        self, logical_expression: LogicalExpression
+    ) -> tuple[int, Optional[type]]:
+        """Compiles or/and evaluating right operand only if left one is not
+        deciding value, result is computed in fresh register when target
+        is variable, which may be read by right operand"""
+        position = logical_expression.position
+        operator = logical_expression.operator
+        is_variable = self.target is not None
+        target = self._target()
+        result = self._register() if is_variable else target
+
+        _, left_type = self._expression(logical_expression.left, result)
+        if left_type != bool:
+            check = partial(check_left_operand, position, operator)
+            self._emit(
+                Opcode.CAST, position, result, result, self._constant(check)
+            )
+        jump = self._emit(
+            Opcode.JUMP_IF_TRUE
+            if operator == TokenType.OR.value
+            else Opcode.JUMP_IF_FALSE,
+            position,
+            result,
+        )
+        _, right_type = self._expression(logical_expression.right, result)
+        if right_type != bool:
+            check = partial(check_right_operand, position, operator)
+            self._emit(
+                Opcode.CAST, position, result, result, self._constant(check)
+            )
+        self._patch(jump, 2)
+        if result != target:
+            self._emit(Opcode.MOVE, position, target, result)
+        return target, bool
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> tuple[int, Optional[type]]:
+        target = self._target()
+        register, value_type = self._expression(negated_expression.expression)
+        position = negated_expression.position
+        operator = negated_expression.operator
+        if operator == "not":
+            self._emit(Opcode.NOT, position, target, register)
+            return target, bool if value_type == bool else None
+        elif operator == "-":
+            self._emit(Opcode.NEGATE, position, target, register)
+            return target, value_type if value_type in [int, float] else None
+        self._emit(
+            Opcode.CAST,
+            position,
+            target,
+            register,
+            self._constant(partial(negate, position, operator)),
+        )
+        return target, None
@@ -0,0 +1,336 @@
+from parser.objects.expression import Expression
+from parser.objects.type import Canvas
+from parser.parser import Parser
+from typing import Any, Callable, Optional
+
+from error.error_interpreter import (DivisionByZeroError,
+                                     InvalidAssignmentTypeError,
+                                     InvalidCallTypeError,
+                                     InvalidIterableTypeError,
+                                     InvalidReturnTypeError,
+                                     InvalidUnaryOperatorError,
+                                     MaximumRecursionDepthError,
+                                     MismatchedTypeError,
+                                     MissingFunctionDeclarationError,
+                                     MissingReturnTypeError)
+from interpreter.bytecode import (BINARY_OPCODES, BytecodeCompiler, Code,
+                                  Opcode)
+from interpreter.memoization import (FunctionCache, arguments_key,
+                                     create_caches)
+from interpreter.runtime import (MISSING, OPERATORS, check_argument,
+                                 check_declaration, create_invalid,
+                                 dynamic_method)
+from utility.utility import MAX_REC_DEPTH, Position
+
+OPERATOR_NAMES: dict[int, str] = {
+    opcode: operator for operator, opcode in BINARY_OPCODES.items()
+}
+
+BINARY_FUNCTIONS: dict[int, Callable[[Any, Any], Any]] = {
+    opcode: OPERATORS[operator]
+    for operator, opcode in BINARY_OPCODES.items()
+    if operator in OPERATORS
+}
+
+
+class Frame:
+    """Saved state of function waiting for value of called function, with
+    cache and key the value is stored under, if called function is
+    memoized"""
+
+    __slots__ = (
+        "code",
+        "registers",
+        "pc",
+        "target",
+        "position",
+        "depth",
+        "cache",
+        "key",
+    )
+
+    code: Code
+    registers: list[Any]
+    pc: int
+    target: int
+    position: Position
+    depth: int
+    cache: Optional[FunctionCache]
+    key: Optional[tuple]
+
+    def __init__(
+        self,
+        code: Code,
+        registers: list[Any],
+        pc: int,
+        target: int,
+        position: Position,
+        depth: int,
+        cache: Optional[FunctionCache],
+        key: Optional[tuple],
+    ) -> None:
+        self.code = code
+        self.registers = registers
+        self.pc = pc
+        self.target = target
+        self.position = position
+        self.depth = depth
+        self.cache = cache
+        self.key = key
+
+
+class BytecodeInterpreter(BytecodeCompiler):
+    """Interpreter compiling program into bytecode executed by register
+    based virtual machine, which keeps frames of calls on its own stack, so
+    recursion depth is limited only by max_rec_depth. Tail calls replace
+    frame of calling function, they count to recursion depth until the
+    value is returned, but take no memory. Memoized functions are never
+    called in place, so that their values can be stored"""
+
+    parser: Parser
+    max_rec_depth: int
+    memo_size: int
+    caches: dict[str, FunctionCache]
+
+    def __init__(
+        self,
+        parser: Parser,
+        max_rec_depth: int = MAX_REC_DEPTH,
+        short_circuit: bool = False,
+        memo_size: int = 0,
+    ) -> None:
+        self.parser = parser
+        self.max_rec_depth = max_rec_depth
+        self.short_circuit = short_circuit
+        self.memo_size = memo_size
+        self.caches = {}
+
+    def interpret(self):
+        tree = self.parser.parse_program()
+        self.caches = create_caches(tree, self.memo_size)
+        self.execute(self.compile(tree))
+
+    def _is_tail_call(self, expression: Expression) -> bool:
+        return (
+            super()._is_tail_call(expression)
+            and expression.called_expression not in self.caches
+        )
+
+    def execute(self, code: Code) -> Any:
+        """Runs code until it returns, returns its value"""
+        MOVE, DIVIDE, AND, NEGATE, NOT, CAST = (
+            Opcode.MOVE,
+            Opcode.DIVIDE,
+            Opcode.AND,
+            Opcode.NEGATE,
+            Opcode.NOT,
+            Opcode.CAST,
+        )
+        JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE = (
+            Opcode.JUMP,
+            Opcode.JUMP_IF_FALSE,
+            Opcode.JUMP_IF_TRUE,
+        )
+        CHECK_DECLARATION, CHECK_ASSIGNMENT, CHECK_ARGUMENT, RAISE = (
+            Opcode.CHECK_DECLARATION,
+            Opcode.CHECK_ASSIGNMENT,
+            Opcode.CHECK_ARGUMENT,
+            Opcode.RAISE,
+        )
+        CALL, TAIL_CALL, RETURN, RETURN_LAST, PRINT = (
+            Opcode.CALL,
+            Opcode.TAIL_CALL,
+            Opcode.RETURN,
+            Opcode.RETURN_LAST,
+            Opcode.PRINT,
+        )
+        CREATE, CREATE_INVALID, GET_METHOD, INVOKE, DYNAMIC_METHOD = (
+            Opcode.CREATE,
+            Opcode.CREATE_INVALID,
+            Opcode.GET_METHOD,
+            Opcode.INVOKE,
+            Opcode.DYNAMIC_METHOD,
+        )
+        GET_ITERATOR, FOR_ITER = Opcode.GET_ITERATOR, Opcode.FOR_ITER
+        JUMP_IF_SET = Opcode.JUMP_IF_SET
+        binary_functions = BINARY_FUNCTIONS
+        max_rec_depth = self.max_rec_depth
+        caches = self.caches
+
+        frames: list[Frame] = []
+        position = Position(0, 0)
+        depth = 0
+        returned = None
+        key = None
+        instructions = code.instructions
+        positions = code.positions
+        constants = code.constants
+        registers = code.registers[:]
+        pc = 0
+        while True:
+            opcode, a, b, c, d = instructions[pc]
+            pc += 1
+            if opcode == MOVE:
+                registers[a] = registers[b]
+            elif opcode <= AND:
+                left = registers[b]
+                right = registers[c]
+                if type(left) is not type(right):
+                    raise MismatchedTypeError(
+                        positions[pc - 1],
+                        type(left),
+                        type(right),
+                        OPERATOR_NAMES[opcode],
+                    )
+                if opcode == DIVIDE:
+                    if right == 0:
+                        raise DivisionByZeroError(positions[pc - 1])
+                    registers[a] = left / right
+                else:
+                    registers[a] = binary_functions[opcode](left, right)
+            elif opcode == JUMP_IF_TRUE:
+                if registers[a]:
+                    pc = b
+            elif opcode == JUMP_IF_FALSE:
+                if not registers[a]:
+                    pc = b
+            elif opcode == JUMP:
+                pc = a
+            elif opcode == JUMP_IF_SET:
+                if registers[a] is not None:
+                    pc = b
+            elif opcode == CHECK_ASSIGNMENT:
+                value = registers[a]
+                if type(value) is not constants[b]:
+                    raise InvalidAssignmentTypeError(
+                        positions[pc - 1], type(value), constants[b]
+                    )
+            elif opcode == CHECK_ARGUMENT:
+                value = registers[a]
+                value_type, parameter_type = constants[b]
+                if type(value) is not value_type:
+                    check_argument(
+                        positions[pc - 1], value, parameter_type, constants[c]
+                    )
+            elif opcode == CHECK_DECLARATION:
+                check_declaration(
+                    positions[pc - 1], registers[a], constants[b]
+                )
+            elif opcode == CALL or opcode == TAIL_CALL:
+                callee = constants[b]
+                callee_registers = callee.registers[:]
+                call_position = positions[pc - 1]
+                count = len(callee.parameters)
+                callee_registers[:count] = registers[c : c + count]
+                cache = caches.get(callee.name) if caches else None
+                if cache is not None:
+                    key = arguments_key(callee_registers[:count])
+                    value = cache.get(key)
+                    if value is not MISSING:
+                        returned = registers[a] = value
+                        continue
+                depth += 1
+                if depth > max_rec_depth:
+                    raise MaximumRecursionDepthError(
+                        call_position, max_rec_depth, callee.name
+                    )
+                if opcode == CALL:
+                    frames.append(
+                        Frame(
+                            code,
+                            registers,
+                            pc,
+                            a,
+                            position,
+                            depth - 1,
+                            cache,
+                            key,
+                        )
+                    )
+                returned = None
+                code = callee
+                instructions = code.instructions
+                positions = code.positions
+                constants = code.constants
+                registers = callee_registers
+                position = call_position
+                pc = 0
+            elif opcode == RETURN or opcode == RETURN_LAST:
+                value = registers[a] if opcode == RETURN else returned
+                return_type = code.return_type
+                if return_type is not None:
+                    if value is None:
+                        raise MissingReturnTypeError(position, return_type)
+                    elif type(value) is not return_type:
+                        raise InvalidReturnTypeError(
+                            position, type(value), return_type
+                        )
+                returned = value
+                if not frames:
+                    return value
+                frame = frames.pop()
+                if frame.cache is not None:
+                    frame.cache.put(frame.key, value)
+                depth = frame.depth
+                code = frame.code
+                instructions = code.instructions
+                positions = code.positions
+                constants = code.constants
+                registers = frame.registers
+                registers[frame.target] = value
+                position = frame.position
+                pc = frame.pc
+            elif opcode == GET_METHOD:
+                method = getattr(registers[b], constants[c], MISSING)
+                if method is MISSING:
+                    raise MissingFunctionDeclarationError(
+                        positions[pc - 1], constants[c]
+                    )
+                registers[a] = method
+            elif opcode == INVOKE:
+                try:
+                    registers[a] = registers[b](*registers[c : c + d])
+                except Exception as e:
+                    raise InvalidCallTypeError(positions[pc - 1], e)
+            elif opcode == FOR_ITER:
+                value = next(registers[a], MISSING)
+                if value is MISSING:
+                    pc = c
+                else:
+                    registers[b] = value
+            elif opcode == GET_ITERATOR:
+                value = registers[b]
+                if type(value) != Canvas:
+                    raise InvalidIterableTypeError(
+                        positions[pc - 1], type(value), Canvas
+                    )
+                registers[a] = iter(value.shapes)
+            elif opcode == CREATE:
+                try:
+                    registers[a] = constants[b](*registers[c : c + d])
+                except Exception as e:
+                    raise InvalidCallTypeError(positions[pc - 1], e)
+            elif opcode == PRINT:
+                print("".join(str(value) for value in registers[a : a + b]))
+            elif opcode == NEGATE:
+                value = registers[b]
+                if type(value) is not int and type(value) is not float:
+                    raise InvalidUnaryOperatorError(positions[pc - 1], "-")
+                registers[a] = -value
+            elif opcode == NOT:
+                value = registers[b]
+                if type(value) is not bool:
+                    raise InvalidUnaryOperatorError(positions[pc - 1], "not")
+                registers[a] = not value
+            elif opcode == CAST:
+                registers[a] = constants[c](registers[b])
+            elif opcode == RAISE:
+                raise constants[a]()
+            elif opcode == CREATE_INVALID:
+                create_invalid(
+                    positions[pc - 1], constants[b], *registers[c : c + d]
+                )
+            elif opcode == DYNAMIC_METHOD:
+                registers[a] = dynamic_method(
+                    positions[pc - 1], registers[b], registers[c]
+                )
@@ -0,0 +1,749 @@
+from parser.objects.block import Block
+from parser.objects.expression import (BooleanExpression, CallExpression,
+                                       CastExpression, DecimalExpression,
+                                       Expression, IdentifierExpression,
+                                       IntegerExpression, InvariantExpression,
+                                       LogicalExpression, NegatedExpression,
+                                       StringExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from parser.objects.type import Canvas, Shape, Type
+from parser.parser import Parser
+from typing import Any, Callable
+
+from error.error_interpreter import (DivisionByZeroError,
+                                     InvalidAssignmentTypeError,
+                                     InvalidCallTypeError,
+                                     InvalidDeclarationTypeError,
+                                     InvalidIterableTypeError,
+                                     InvalidReturnTypeError,
+                                     InvalidUnaryOperatorError,
+                                     MaximumRecursionDepthError,
+                                     MismatchedCallTypeError,
+                                     MismatchedTypeError,
+                                     MissingAssignmentValueError,
+                                     MissingDeclarationValueError,
+                                     MissingForConditionError,
+                                     MissingFunctionDeclarationError,
+                                     MissingIfConditionError,
+                                     MissingMainFunctionError,
+                                     MissingReturnTypeError,
+                                     MissingReturnValueError,
+                                     MissingVariableDeclarationError,
+                                     MissingWhileConditionError,
+                                     NumberOfArgumentError, RedeclarationError)
+from interpreter.environment import Environment
+from interpreter.memoization import (FunctionCache, arguments_key,
+                                     create_caches)
+from interpreter.resolver import Resolver
+from interpreter.runtime import (CAST_FUNCTIONS, MISSING, OPERATORS,
+                                 SHORT_CIRCUIT_OPERATORS, check_left_operand,
+                                 check_right_operand)
+from interpreter.variable import Variable
+from interpreter.visitor import Visitor
+from lexer.token_manager import TokenType
+from utility.utility import (ALL_TYPES, LITERAL_TYPES, MAX_REC_DEPTH,
+                             OBJECT_PARAMETERS, OBJECT_TYPES, Position)
+
+Closure = Callable[[], Any]
+
+
+class ClosureInterpreter(Visitor):
+    """Interpreter compiling every node once into a closure that runs it"""
+
+    parser: Parser
+    environment: Environment
+    resolver: Resolver
+    bodies: dict[str, Closure]
+    return_value: Type
+    is_return: bool
+    max_rec_depth: int
+    short_circuit: bool
+    memo_size: int
+    caches: dict[str, FunctionCache]
+
+    def __init__(
+        self,
+        parser: Parser,
+        max_rec_depth: int = MAX_REC_DEPTH,
+        short_circuit: bool = False,
+        memo_size: int = 0,
+    ) -> None:
+        self.parser = parser
+        self.bodies = {}
+        self.return_value = None
+        self.is_return = False
+        self.max_rec_depth = max_rec_depth
+        self.short_circuit = short_circuit
+        self.memo_size = memo_size
+        self.caches = {}
+
+    def interpret(self):
+        tree = self.parser.parse_program()
+        self.environment = Environment()
+        self.resolver = Resolver()
+        self.resolver.resolve(tree)
+        self.caches = create_caches(tree, self.memo_size)
+        self.visit(tree)()
+
+    def invalid_visit(self, node: Node) -> Closure:
+        def run_invalid():
+            return Visitor.invalid_visit(self, node)
+
+        return run_invalid
+
+    def _value(self, expression: Expression) -> Closure:
+        """Compiles expression to closure returning value of variables
+        instead of variables themselves"""
+        if not isinstance(expression, IdentifierExpression):
+            return self.visit(expression)
+        variable = self._variable(expression)
+
+        def run_value():
+            return variable().value
+
+        return run_value
+
+    def _variable(
+        self, identifier_expression: IdentifierExpression
+    ) -> Closure:
+        """Compiles identifier to closure returning variable from its slot"""
+        environment = self.environment
+        position = identifier_expression.position
+        name = identifier_expression.identifier
+        slot = self.resolver.get_slot(identifier_expression)
+        if slot is None:
+
+            def run_missing_variable():
+                raise MissingVariableDeclarationError(position, name)
+
+            return run_missing_variable
+
+        depth, index = slot
+
+        def run_variable():
+            variable = environment.frames[depth][index]
+            if variable is None:
+                raise MissingVariableDeclarationError(position, name)
+            return variable
+
+        return run_variable
+
+    def _visit_Program(self, program: Program) -> Closure:
+        for object in program.objects:
+            self.visit(object)()
+        for object in program.objects:
+            if isinstance(object, Function):
+                self.bodies[object.name] = self.visit(object.block)
+
+        if not self.environment.has_function("main"):
+
+            def run_missing_main():
+                raise MissingMainFunctionError(Position(0, 0))
+
+            return run_missing_main
+
+        main = self.environment.get_function("main")
+        return self.visit(CallExpression(main.position, None, main.name, []))
+
+    def _visit_Function(self, function: Function) -> Closure:
+        environment = self.environment
+
+        def run_function():
+            environment.add_function(function)
+
+        return run_function
+
+    def _visit_Block(self, block: Block) -> Closure:
+        environment = self.environment
+        size = self.resolver.frame_sizes.get(block)
+        statements = tuple(
+            self.visit(statement) for statement in block.statements
+        )
+
+        def run_statements():
+            for statement in statements:
+                statement()
+
+        if size is None:
+            return run_statements
+
+        def run_block():
+            environment.create_frame(size)
+            for statement in statements:
+                statement()
+            environment.destroy_frame()
+
+        return run_block
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> Closure:
+        position = if_statement.position
+        if if_statement.condition is None:
+
+            def run_missing_condition():
+                if self.is_return:
+                    return
+                raise MissingIfConditionError(position)
+
+            return run_missing_condition
+
+        condition = self.visit(if_statement.condition)
+        block = self.visit(if_statement.block)
+        else_block = None
+        if if_statement.else_block:
+            else_block = self.visit(if_statement.else_block)
+
+        def run_if():
+            if self.is_return:
+                return
+            if condition():
+                block()
+            elif else_block is not None:
+                else_block()
+
+        return run_if
+
+    def _visit_WhileStatement(
+        self, while_statement: WhileStatement
+    ) -> Closure:
+        position = while_statement.position
+        if while_statement.condition is None:
+
+            def run_missing_condition():
+                if self.is_return:
+                    return
+                raise MissingWhileConditionError(position)
+
+            return run_missing_condition
+
+        environment = self.environment
+        condition = self.visit(while_statement.condition)
+        block = self.visit(while_statement.block)
+        size = self.resolver.frame_sizes.get(while_statement)
+
+        def run_while():
+            if self.is_return:
+                return
+            while condition():
+                block()
+
+        if size is None:
+            return run_while
+
+        def run_invariant_while():
+            if self.is_return:
+                return
+            environment.create_frame(size)
+            while condition():
+                block()
+            environment.destroy_frame()
+
+        return run_invariant_while
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> Closure:
+        environment = self.environment
+        position = iterate_statement.position
+        shape_type = iterate_statement.type
+        identifier = iterate_statement.identifier
+        if iterate_statement.expression is None or shape_type != Shape:
+
+            def run_invalid_iterate():
+                if self.is_return:
+                    return
+                if iterate_statement.expression is None:
+                    raise MissingForConditionError(position)
+                raise InvalidIterableTypeError(position, shape_type, Shape)
+
+            return run_invalid_iterate
+
+        expression = self._value(iterate_statement.expression)
+        block = self.visit(iterate_statement.block)
+        size = self.resolver.frame_sizes[iterate_statement]
+        index = self.resolver.get_slot(iterate_statement).index
+
+        def run_iterate():
+            if self.is_return:
+                return
+            value = expression()
+            if type(value) != Canvas:
+                raise InvalidIterableTypeError(position, type(value), Canvas)
+            shapes = getattr(value, "shapes")
+            variable = Variable(shape_type, identifier, None)
+            environment.create_frame(size)[index] = variable
+            for shape in shapes:
+                variable.value = shape
+                block()
+            environment.destroy_frame()
+
+        return run_iterate
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> Closure:
+        position = return_statement.position
+        if return_statement.expression is None:
+
+            def run_missing_value():
+                raise MissingReturnValueError(position)
+
+            return run_missing_value
+
+        expression = self.visit(return_statement.expression)
+
+        def run_return():
+            self.return_value = expression()
+            self.is_return = True
+
+        return run_return
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> Closure:
+        environment = self.environment
+        position = declaration_statement.position
+        identifier = declaration_statement.identifier
+        if declaration_statement.expression is None:
+
+            def run_missing_value():
+                if self.is_return:
+                    return
+                raise MissingDeclarationValueError(position)
+
+            return run_missing_value
+
+        expression = self._value(declaration_statement.expression)
+        declaration_type = declaration_statement.type
+        if declaration_type in LITERAL_TYPES:
+            declaration_type = LITERAL_TYPES[declaration_type]
+        is_redeclaration = (
+            declaration_statement in self.resolver.redeclarations
+        )
+        slot = self.resolver.get_slot(declaration_statement)
+
+        def run_declaration():
+            if self.is_return:
+                return
+            value = expression()
+            if value is None:
+                raise InvalidDeclarationTypeError(
+                    position, None, declaration_type
+                )
+            elif type(value) == tuple:
+                raise MissingFunctionDeclarationError(position, value[0])
+            elif declaration_type != type(value):
+                raise InvalidDeclarationTypeError(
+                    position, type(value), declaration_type
+                )
+            if is_redeclaration:
+                raise RedeclarationError(position, identifier)
+            environment.frames[slot.depth][slot.index] = Variable(
+                declaration_type, identifier, value
+            )
+
+        return run_declaration
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> Closure:
+        environment = self.environment
+        position = assignment_statement.position
+        if assignment_statement.expression is None:
+
+            def run_missing_value():
+                if self.is_return:
+                    return
+                raise MissingAssignmentValueError(position)
+
+            return run_missing_value
+
+        expression = self._value(assignment_statement.expression)
+        target = assignment_statement.identifier
+        slot = self.resolver.get_slot(target)
+
+        def run_assignment():
+            if self.is_return:
+                return
+            value = expression()
+            name = target.identifier
+            variable = None
+            if slot is not None:
+                variable = environment.frames[slot.depth][slot.index]
+            if variable is None:
+                raise MissingVariableDeclarationError(position, name)
+            if variable.type != type(value):
+                raise InvalidAssignmentTypeError(
+                    position, type(value), variable.type
+                )
+            variable.value = value
+
+        return run_assignment
+
+    def _visit_CallExpression(
+        self, call_expression: CallExpression
+    ) -> Closure:
+        if call_expression.root_expression is not None:
+            return self._variable_call(call_expression)
+        if self.environment.has_function(call_expression.called_expression):
+            return self._function_call(call_expression)
+        return self._method_call(call_expression)
+
+    def _function_call(self, function_call: CallExpression) -> Closure:
+        """Compiles call of function defined in program"""
+        environment = self.environment
+        bodies = self.bodies
+        max_rec_depth = self.max_rec_depth
+        position = function_call.position
+        name = function_call.called_expression
+        function = environment.get_function(name)
+
+        return_type = function.declaration_type
+        if return_type in LITERAL_TYPES:
+            return_type = LITERAL_TYPES[return_type]
+
+        if len(function_call.arguments) != len(function.argument_list):
+
+            def run_invalid_call():
+                if self.is_return:
+                    return
+                raise NumberOfArgumentError(
+                    position,
+                    function.name,
+                    function_call.arguments,
+                    function.argument_list,
+                )
+
+            return run_invalid_call
+
+        parameters = tuple(
+            (self._value(argument), parameter[0], parameter[1])
+            for argument, parameter in zip(
+                function_call.arguments, function.argument_list
+            )
+        )
+
+        def run_function_call():
+            if self.is_return:
+                return
+            variables = []
+            for argument, parameter_type, parameter_name in parameters:
+                value = argument()
+                if ALL_TYPES[type(value)] != ALL_TYPES[parameter_type]:
+                    raise MismatchedCallTypeError(
+                        position, type(value), parameter_type, function.name
+                    )
+                variables.append(
+                    Variable(parameter_type, parameter_name, value)
+                )
+            return run_call(variables)
+
+        def run_call(variables):
+            environment.create_function_frame(variables)
+            if environment.recursion_depth > max_rec_depth:
+                raise MaximumRecursionDepthError(position, max_rec_depth, name)
+
+            self.return_value = None
+            bodies[name]()
+
+            return_value = self.return_value
+            if isinstance(return_value, Variable):
+                return_value = return_value.value
+            self.is_return = False
+            if return_value is None and return_type is not None:
+                raise MissingReturnTypeError(position, return_type)
+            elif (
+                type(return_value) != return_type
+                and return_type is not None
+                and return_value is not None
+            ):
+                raise InvalidReturnTypeError(
+                    position, type(return_value), return_type
+                )
+
+            environment.destroy_function_frame()
+            return return_value
+
+        cache = self.caches.get(name)
+        if cache is None:
+            return run_function_call
+
+        def run_memoized_call():
+            if self.is_return:
+                return
+            values = []
+            for argument, parameter_type, _ in parameters:
+                value = argument()
+                if ALL_TYPES[type(value)] != ALL_TYPES[parameter_type]:
+                    raise MismatchedCallTypeError(
+                        position, type(value), parameter_type, function.name
+                    )
+                values.append(value)
+            key = arguments_key(values)
+            return_value = cache.get(key)
+            if return_value is MISSING:
+                variables = [
+                    Variable(parameter_type, parameter_name, value)
+                    for value, (_, parameter_type, parameter_name) in zip(
+                        values, parameters
+                    )
+                ]
+                return_value = run_call(variables)
+                cache.put(key, return_value)
+            else:
+                self.return_value = return_value
+            return return_value
+
+        return run_memoized_call
+
+    def _method_call(self, method_call: CallExpression) -> Closure:
+        """Compiles call of print, object constructor or method name"""
+        position = method_call.position
+        name = method_call.called_expression
+        arguments = tuple(
+            self._value(argument) for argument in method_call.arguments
+        )
+
+        if name == "print":
+
+            def run_print():
+                if self.is_return:
+                    return
+                print("".join(str(argument()) for argument in arguments))
+
+            return run_print
+
+        if name in OBJECT_TYPES:
+            object_type = OBJECT_TYPES[name]
+            parameters = OBJECT_PARAMETERS[object_type]
+
+            def run_create_object():
+                if self.is_return:
+                    return
+                argument_values = [argument() for argument in arguments]
+                if len(argument_values) != len(parameters):
+                    raise NumberOfArgumentError(
+                        position,
+                        object_type.__name__,
+                        argument_values,
+                        parameters,
+                    )
+                try:
+                    return object_type(*argument_values)
+                except Exception as e:
+                    raise InvalidCallTypeError(position, e)
+
+            return run_create_object
+
+        method = (name, method_call.arguments)
+
+        def run_method():
+            if self.is_return:
+                return
+            return method
+
+        return run_method
+
+    def _variable_call(self, variable_call: CallExpression) -> Closure:
+        """Compiles call of method on value of root expression"""
+        position = variable_call.position
+        root = self._value(variable_call.root_expression)
+        called_expression = variable_call.called_expression
+        if (
+            isinstance(called_expression, CallExpression)
+            and called_expression.root_expression is None
+            and called_expression.called_expression != "print"
+            and called_expression.called_expression not in OBJECT_TYPES
+            and not self.environment.has_function(
+                called_expression.called_expression
+            )
+        ):
+            name = called_expression.called_expression
+            arguments = tuple(
+                self._value(argument)
+                for argument in called_expression.arguments
+            )
+
+            def run_variable_call():
+                if self.is_return:
+                    return
+                function = getattr(root(), name, MISSING)
+                if function is MISSING:
+                    raise MissingFunctionDeclarationError(position, name)
+                argument_values = [argument() for argument in arguments]
+                try:
+                    return function(*argument_values)
+                except Exception as e:
+                    raise InvalidCallTypeError(position, e)
+
+            return run_variable_call
+
+        called = self.visit(called_expression)
+
+        def run_dynamic_call():
+            if self.is_return:
+                return
+            receiver = root()
+            name, arguments = called()
+            function = getattr(receiver, name, MISSING)
+            if function is MISSING:
+                raise MissingFunctionDeclarationError(position, name)
+            argument_values = [
+                self._value(argument)() for argument in arguments
+            ]
+            try:
+                return function(*argument_values)
+            except Exception as e:
+                raise InvalidCallTypeError(position, e)
+
+        return run_dynamic_call
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> Closure:
+        return self._variable(identifier_expression)
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> Closure:
+        environment = self.environment
+        expression = self._value(invariant_expression.expression)
+        depth, index = self.resolver.get_invariant_slot(invariant_expression)
+
+        def run_invariant():
+            if self.is_return:
+                return expression()
+            frame = environment.frames[depth]
+            value = frame[index]
+            if value is None:
+                value = frame[index] = expression()
+            return value
+
+        return run_invariant
+
+    def _visit_CastExpression(
+        self, cast_expression: CastExpression
+    ) -> Closure:
+        expression = self._value(cast_expression.expression)
+        cast_type = cast_expression.cast_type
+        if cast_type not in CAST_FUNCTIONS:
+
+            def run_invalid_cast():
+                return CAST_FUNCTIONS[cast_type](expression())
+
+            return run_invalid_cast
+
+        cast_function = CAST_FUNCTIONS[cast_type]
+
+        def run_cast():
+            return cast_function(expression())
+
+        return run_cast
+
+    def _constant(self, value: Any) -> Closure:
+        """Compiles literal value known ahead of execution"""
+
+        def run_constant():
+            return value
+
+        return run_constant
+
+    def _visit_IntegerExpression(
+        self, integer_expression: IntegerExpression
+    ) -> Closure:
+        return self._constant(int(integer_expression.value))
+
+    def _visit_DecimalExpression(
+        self, decimal_expression: DecimalExpression
+    ) -> Closure:
+        return self._constant(float(decimal_expression.value))
+
+    def _visit_BooleanExpression(
+        self, boolean_expression: BooleanExpression
+    ) -> Closure:
+        return self._constant(bool(boolean_expression.value))
+
+    def _visit_StringExpression(
+        self, string_expression: StringExpression
+    ) -> Closure:
+        return self._constant(str(string_expression.value))
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> Closure:
+        position = logical_expression.position
+        left = self._value(logical_expression.left)
+        right = self._value(logical_expression.right)
+        operator = logical_expression.operator
+
+        if self.short_circuit and operator in SHORT_CIRCUIT_OPERATORS:
+            deciding_value = operator == TokenType.OR.value
+
+            def run_short_circuit():
+                left_value = left()
+                if (
+                    check_left_operand(position, operator, left_value)
+                    == deciding_value
+                ):
+                    return left_value
+                return check_right_operand(position, operator, right())
+
+            return run_short_circuit
+
+        if operator == TokenType.DIVIDE.value:
+
+            def run_divide():
+                left_value = left()
+                right_value = right()
+                if type(left_value) != type(right_value):
+                    raise MismatchedTypeError(
+                        position, type(left_value), type(right_value), operator
+                    )
+                if right_value == 0:
+                    raise DivisionByZeroError(position)
+                return left_value / right_value
+
+            return run_divide
+
+        function = OPERATORS[operator]
+
+        def run_operator():
+            left_value = left()
+            right_value = right()
+            if type(left_value) != type(right_value):
+                raise MismatchedTypeError(
+                    position, type(left_value), type(right_value), operator
+                )
+            return function(left_value, right_value)
+
+        return run_operator
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> Closure:
+        position = negated_expression.position
+        expression = self._value(negated_expression.expression)
+        operator = negated_expression.operator
+
+        def run_negated():
+            value = expression()
+            if operator == "not":
+                if type(value) == bool:
+                    return not value
+            elif operator == "-":
+                if type(value) in [int, float]:
+                    return -value
+            raise InvalidUnaryOperatorError(position, operator)
+
+        return run_negated
@@ -1,19 +1,25 @@
+from collections import defaultdict
 from parser.objects.function import Function
+from typing import Optional
 
 from interpreter.scope import Scope
 from interpreter.variable import Variable
 
+Frame = list[Optional[Variable]]
+
 
 class Environment:
     function_scope: Scope
-    local_scope: Scope
-    last_scope: list[Scope]
+    frames: list[Frame]
+    last_frames: list[list[Frame]]
+    free_frames: defaultdict[int, list[Frame]]
     recursion_depth: int
 
     def __init__(self) -> None:
         self.function_scope: Scope = Scope()
-        self.local_scope: Scope = Scope()
-        self.last_scope: list[Scope] = []
+        self.frames: list[Frame] = []
+        self.last_frames: list[list[Frame]] = []
+        self.free_frames: defaultdict[int, list[Frame]] = defaultdict(list)
         self.recursion_depth: int = 0
 
     def add_function(self, function: Function) -> None:
@@ -25,37 +31,35 @@ class Environment:
     def get_function(self, name: str) -> Variable:
         return self.function_scope.get_variable(name)
 
-    def create_local_scope(self) -> None:
-        self.local_scope = Scope(self.local_scope)
-
-    def destroy_local_scope(self) -> None:
-        self.local_scope = self.local_scope.parent_scope
-
-    def create_function_local_scope(self, variables: list[Variable]) -> None:
-        self.last_scope.append(self.local_scope)
-        self.local_scope = Scope()
-        for variable in variables:
-            self.local_scope.add_variable(variable)
+    def create_frame(self, size: int) -> Frame:
+        """Pushes empty frame, reusing one of destroyed frames of the same
+        size if there is any"""
+        free_frames = self.free_frames[size]
+        frame = free_frames.pop() if free_frames else [None] * size
+        self.frames.append(frame)
+        return frame
+
+    def destroy_frame(self) -> None:
+        """Pops frame, its variables are cleared before it is reused"""
+        frame = self.frames.pop()
+        for index in range(len(frame)):
+            frame[index] = None
+        self.free_frames[len(frame)].append(frame)
+
+    def create_function_frame(self, variables: list[Variable]) -> None:
+        self.last_frames.append(self.frames)
+        self.frames = [variables]
         self.recursion_depth += 1
 
-    def destroy_function_local_scope(self) -> None:
-        self.local_scope = self.last_scope.pop()
+    def destroy_function_frame(self) -> None:
+        self.frames = self.last_frames.pop()
         self.recursion_depth -= 1
 
     def get_recursion_depth(self) -> int:
         return self.recursion_depth
 
-    def add_variable(self, variable: Variable) -> None:
-        self.local_scope.add_variable(variable)
-
-    def has_variable(self, name: str) -> bool:
-        return self.local_scope.has_variable(name)
-
-    def get_variable(self, name: str) -> Variable:
-        return self.local_scope.get_variable(name)
-
-    def set_type(self, name: str, type) -> None:
-        self.local_scope.set_type(name, type)
+    def get_variable(self, depth: int, index: int) -> Optional[Variable]:
+        return self.frames[depth][index]
 
-    def set_value(self, name: str, value: any) -> None:
-        self.local_scope.set_value(name, value)
+    def set_variable(self, depth: int, index: int, variable: Variable) -> None:
+        self.frames[depth][index] = variable
@@ -1,14 +1,15 @@
-from inspect import signature
+from functools import partial
+from inspect import getattr_static, isfunction
 from parser.objects.block import Block
 from parser.objects.expression import (AndExpression, BooleanExpression,
                                        CallExpression, CastExpression,
                                        DecimalExpression, Expression,
                                        IdentifierExpression, IntegerExpression,
-                                       LogicalExpression, MulExpression,
+                                       InvariantExpression, LogicalExpression,
                                        NegatedExpression, OrExpression,
-                                       RelativeExpression, StringExpression,
-                                       SumExpression)
+                                       StringExpression)
 from parser.objects.function import Function
+from parser.objects.node import Node
 from parser.objects.program import Program
 from parser.objects.statement import (AssignmentStatement,
                                       DeclarationStatement, IfStatement,
@@ -16,6 +17,7 @@ from parser.objects.statement import (AssignmentStatement,
                                       WhileStatement)
 from parser.objects.type import Canvas, Dec, Int, Shape, Type
 from parser.parser import Parser
+from typing import Any, Callable, Optional
 
 from error.error_interpreter import (DivisionByZeroError,
                                      InvalidAssignmentTypeError,
@@ -25,7 +27,6 @@ from error.error_interpreter import (DivisionByZeroError,
                                      InvalidReturnTypeError,
                                      InvalidUnaryOperatorError,
                                      MaximumRecursionDepthError,
-                                     MismatchedCallTypeError,
                                      MismatchedTypeError,
                                      MissingAssignmentValueError,
                                      MissingDeclarationValueError,
@@ -39,33 +40,207 @@ from error.error_interpreter import (DivisionByZeroError,
                                      MissingWhileConditionError,
                                      NumberOfArgumentError, RedeclarationError)
 from interpreter.environment import Environment
+from interpreter.memoization import (FunctionCache, arguments_key,
+                                     create_caches)
+from interpreter.resolver import Resolver, Slot
+from interpreter.runtime import (MISSING, OPERATORS, check_argument,
+                                 check_left_operand, check_right_operand,
+                                 divide)
+from interpreter.type_checker import TypeChecker
+from interpreter.type_inference import TypeInferrer
 from interpreter.variable import Variable
 from interpreter.visitor import Visitor
 from lexer.token_manager import TokenType
-from utility.utility import (ALL_TYPES, LITERAL_TYPES, MAX_REC_DEPTH,
+from utility.utility import (LITERAL_TYPES, MAX_REC_DEPTH, OBJECT_PARAMETERS,
                              OBJECT_TYPES, Position)
 
+OPERATOR_HANDLERS: dict[str, str] = {
+    TokenType.OR.value: "_accept_or",
+    TokenType.AND.value: "_accept_and",
+    TokenType.EQUAL.value: "_accept_equal",
+    TokenType.NOT_EQUAL.value: "_accept_not_equal",
+    TokenType.GREATER.value: "_accept_greater",
+    TokenType.LESS.value: "_accept_less",
+    TokenType.GREATER_EQUAL.value: "_accept_greater_equal",
+    TokenType.LESS_EQUAL.value: "_accept_less_equal",
+    TokenType.ADD.value: "_accept_add",
+    TokenType.SUBTRACT.value: "_accept_sub",
+    TokenType.MULTIPLY.value: "_accept_mul",
+    TokenType.DIVIDE.value: "_accept_div",
+}
+
+CAST_HANDLERS: dict[Type, str] = {
+    Int: "_accept_int",
+    Dec: "_accept_dec",
+}
+
+
+class CallTarget:
+    """Function bound to its call expressions, with type its value has to
+    have, types its arguments are checked against, cache of its values if
+    it is memoized and frames of parameters of finished calls, which are
+    reused by next calls"""
+
+    __slots__ = (
+        "function",
+        "return_type",
+        "value_types",
+        "cache",
+        "free_frames",
+    )
+
+    function: Function
+    return_type: Optional[type]
+    value_types: tuple[Any, ...]
+    cache: Optional[FunctionCache]
+    free_frames: list[list[Variable]]
+
+    def __init__(
+        self, function: Function, cache: Optional[FunctionCache]
+    ) -> None:
+        self.function = function
+        return_type = function.declaration_type
+        self.return_type = LITERAL_TYPES.get(return_type, return_type)
+        self.value_types = tuple(
+            LITERAL_TYPES.get(parameter_type, parameter_type)
+            for parameter_type, _ in function.argument_list
+        )
+        self.cache = cache
+        self.free_frames = []
+
+
+class CallSite:
+    """Call expression bound to target of called function, with slots of
+    arguments, which are variables"""
+
+    __slots__ = ("target", "slots")
+
+    target: CallTarget
+    slots: tuple[Optional[Slot], ...]
+
+    def __init__(
+        self, target: CallTarget, slots: tuple[Optional[Slot], ...]
+    ) -> None:
+        self.target = target
+        self.slots = slots
+
+
+class MethodSite:
+    """Call of method on value of root expression bound to name of method,
+    with slots of root and arguments, which are variables, and functions of
+    method found in classes of values it was called on, None for classes
+    where method has to be looked up on value"""
+
+    __slots__ = ("name", "root_slot", "slots", "functions")
+
+    name: str
+    root_slot: Optional[Slot]
+    slots: tuple[Optional[Slot], ...]
+    functions: dict[type, Optional[Callable[..., Any]]]
+
+    def __init__(
+        self,
+        name: str,
+        root_slot: Optional[Slot],
+        slots: tuple[Optional[Slot], ...],
+    ) -> None:
+        self.name = name
+        self.root_slot = root_slot
+        self.slots = slots
+        self.functions = {}
+
 
 class Interpreter(Visitor):
     praser: Parser
     environment: Environment
+    resolver: Resolver
+    handlers: dict[Expression, Callable[..., Any]]
+    call_sites: dict[CallExpression, Optional[CallSite]]
+    targets: dict[str, CallTarget]
+    method_sites: dict[CallExpression, Optional[MethodSite]]
+    typed_handlers: dict[
+        LogicalExpression,
+        tuple[Callable[[Any, Any], Any], Optional[Slot], Optional[Slot]],
+    ]
     return_value: Type
     is_return: bool
     max_rec_depth: int
+    short_circuit: bool
+    type_check: bool
+    verified: set[Node]
+    memo_size: int
+    caches: dict[str, FunctionCache]
 
     def __init__(
-        self, parser: Parser, max_rec_depth: int = MAX_REC_DEPTH
+        self,
+        parser: Parser,
+        max_rec_depth: int = MAX_REC_DEPTH,
+        short_circuit: bool = False,
+        type_check: bool = False,
+        memo_size: int = 0,
     ) -> None:
         self.parser = parser
+        self.handlers = {}
+        self.call_sites = {}
+        self.targets = {}
+        self.method_sites = {}
         self.return_value = None
         self.is_return = False
         self.max_rec_depth = max_rec_depth
+        self.short_circuit = short_circuit
+        self.type_check = type_check
+        self.verified = set()
+        self.memo_size = memo_size
+        self.caches = {}
 
     def interpret(self):
+        """Executes parsed program, if type check is enabled program is
+        executed only if checker reports no errors, and runtime checks of
+        statements verified by it are skipped. Values of pure functions are
+        memoized in caches of memo_size, if it is positive"""
         tree = self.parser.parse_program()
         self.environment = Environment()
+        self.resolver = Resolver()
+        self.resolver.resolve(tree)
+        if self.type_check:
+            checker = TypeChecker(
+                self.resolver, self.parser.error_manager, self.short_circuit
+            )
+            if not checker.check(tree):
+                return
+            self.verified = checker.verified
+        self.caches = create_caches(tree, self.memo_size)
+        inferrer = TypeInferrer(self.resolver)
+        inferrer.infer(tree)
+        self.typed_handlers = {}
+        for expression in inferrer.types:
+            if isinstance(expression, LogicalExpression):
+                self._specialize(expression, inferrer)
         self.visit(tree)
 
+    def _specialize(
+        self, logical_expression: LogicalExpression, inferrer: TypeInferrer
+    ) -> None:
+        """Stores handler skipping type checks for expression, which
+        operands are both known to be int or both dec, with slots of its
+        operands which are variables"""
+        operand_type = inferrer.get_type(logical_expression.left)
+        if (
+            operand_type not in [int, float]
+            or inferrer.get_type(logical_expression.right) != operand_type
+        ):
+            return
+        operator = logical_expression.operator
+        if operator == TokenType.DIVIDE.value:
+            handler = partial(divide, logical_expression.position)
+        else:
+            handler = OPERATORS[operator]
+        self.typed_handlers[logical_expression] = (
+            handler,
+            self.resolver.get_slot(logical_expression.left),
+            self.resolver.get_slot(logical_expression.right),
+        )
+
     def _visit_Program(self, program: Program):
         for object in program.objects:
             self.visit(object)
@@ -98,10 +273,15 @@ class Interpreter(Visitor):
             return
         if while_statement.condition is None:
             raise MissingWhileConditionError(while_statement.position)
+        size = self.resolver.frame_sizes.get(while_statement)
+        if size is not None:
+            self.environment.create_frame(size)
         condition = self.visit(while_statement.condition)
         while condition:
             self.visit(while_statement.block)
             condition = self.visit(while_statement.condition)
+        if size is not None:
+            self.environment.destroy_frame()
 
     def _visit_IterateStatement(
         self, iterate_statement: IterateStatement
@@ -120,16 +300,17 @@ class Interpreter(Visitor):
                 iterate_statement.position, type(value), Canvas
             )
         shapes = getattr(value, "shapes")
-        self.environment.create_local_scope()
-        self.environment.add_variable(
-            Variable(
-                iterate_statement.type, iterate_statement.identifier, None
-            )
+        frame = self.environment.create_frame(
+            self.resolver.frame_sizes[iterate_statement]
+        )
+        variable = Variable(
+            iterate_statement.type, iterate_statement.identifier, None
         )
+        frame[self.resolver.get_slot(iterate_statement).index] = variable
         for shape in shapes:
-            self.environment.set_value(iterate_statement.identifier, shape)
+            variable.set_value(shape)
             self.visit(iterate_statement.block)
-        self.environment.destroy_local_scope()
+        self.environment.destroy_frame()
 
     def _visit_ReturnStatement(
         self, return_statement: ReturnStatement
@@ -144,6 +325,17 @@ class Interpreter(Visitor):
     ) -> None:
         if self.is_return:
             return
+        if declaration_statement in self.verified:
+            declaration_type = declaration_statement.type
+            variable = Variable(
+                LITERAL_TYPES.get(declaration_type, declaration_type),
+                declaration_statement.identifier,
+                self._get_value(self.visit(declaration_statement.expression)),
+            )
+            self.environment.set_variable(
+                *self.resolver.get_slot(declaration_statement), variable
+            )
+            return
         if declaration_statement.expression is None:
             raise MissingDeclarationValueError(declaration_statement.position)
 
@@ -169,14 +361,17 @@ class Interpreter(Visitor):
                 declaration_statement.position, type(value), declaration_type
             )
 
-        if self.environment.has_variable(declaration_statement.identifier):
+        if declaration_statement in self.resolver.redeclarations:
             raise RedeclarationError(
                 declaration_statement.position,
                 declaration_statement.identifier,
             )
 
-        self.environment.add_variable(
-            Variable(declaration_type, declaration_statement.identifier, value)
+        variable = Variable(
+            declaration_type, declaration_statement.identifier, value
+        )
+        self.environment.set_variable(
+            *self.resolver.get_slot(declaration_statement), variable
         )
 
     def _visit_AssignmentStatement(
@@ -184,80 +379,131 @@ class Interpreter(Visitor):
     ) -> None:
         if self.is_return:
             return
+        if assignment_statement in self.verified:
+            value = self._get_value(
+                self.visit(assignment_statement.expression)
+            )
+            self._get_variable(assignment_statement.identifier).set_value(
+                value
+            )
+            return
         if assignment_statement.expression is None:
             raise MissingAssignmentValueError(assignment_statement.position)
         value = self._get_value(self.visit(assignment_statement.expression))
         name = assignment_statement.identifier.identifier
 
-        if self.environment.has_variable(name):
-            variable: Variable = self.environment.get_variable(name)
-            if variable.type != type(value):
-                raise InvalidAssignmentTypeError(
-                    assignment_statement.position, type(value), variable.type
-                )
-            self.environment.set_value(name, value)
-        else:
+        variable = self._get_variable(assignment_statement.identifier)
+        if variable is None:
             raise MissingVariableDeclarationError(
                 assignment_statement.position, name
             )
-
-    def _visit_FunctionCall(self, function_call: CallExpression) -> None:
-        name = function_call.called_expression
-        function = self.environment.get_function(name)
-
-        return_type = function.declaration_type
-        if return_type in LITERAL_TYPES:
-            return_type = LITERAL_TYPES[return_type]
-
-        if len(function_call.arguments) != len(function.argument_list):
+        if variable.type != type(value):
+            raise InvalidAssignmentTypeError(
+                assignment_statement.position, type(value), variable.type
+            )
+        variable.set_value(value)
+
+    def _visit_FunctionCall(
+        self, function_call: CallExpression, call_site: CallSite
+    ) -> Any:
+        target = call_site.target
+        function = target.function
+        arguments = function_call.arguments
+        if len(arguments) != len(target.value_types):
             raise NumberOfArgumentError(
                 function_call.position,
                 function.name,
-                function_call.arguments,
+                arguments,
                 function.argument_list,
             )
 
-        variables = []
-        for argument, parameter in zip(
-            function_call.arguments, function.argument_list
+        free_frames = target.free_frames
+        if free_frames:
+            frame = free_frames.pop()
+        else:
+            frame = [
+                Variable(parameter_type, name, None)
+                for parameter_type, name in function.argument_list
+            ]
+        environment = self.environment
+        for variable, argument, slot, value_type in zip(
+            frame, arguments, call_site.slots, target.value_types
         ):
-            value = self._get_value(self.visit(argument))
-            if ALL_TYPES[type(value)] != ALL_TYPES[parameter[0]]:
-                raise MismatchedCallTypeError(
+            if slot is None:
+                value = self.visit(argument)
+                if type(value) is Variable:
+                    value = value.value
+            else:
+                value = self._get_slot_value(argument, slot)
+            if type(value) is not value_type:
+                check_argument(
                     function_call.position,
-                    type(value),
-                    parameter[0],
+                    value,
+                    variable.type,
                     function.name,
                 )
-            variables.append(Variable(parameter[0], parameter[1], value))
-
-        self.environment.create_function_local_scope(variables)
-
-        if self.environment.get_recursion_depth() > self.max_rec_depth:
+            variable.value = value
+
+        cache = target.cache
+        if cache is not None:
+            key = arguments_key(variable.value for variable in frame)
+            return_value = cache.get(key)
+            if return_value is not MISSING:
+                free_frames.append(frame)
+                self.return_value = return_value
+                return return_value
+
+        environment.create_function_frame(frame)
+        if environment.recursion_depth > self.max_rec_depth:
             raise MaximumRecursionDepthError(
-                function_call.position, self.max_rec_depth, name
+                function_call.position, self.max_rec_depth, function.name
             )
 
-        return_value = None
         self.return_value = None
         self.visit(function.block)
 
-        return_value = self._get_value(self.return_value)
+        return_value = self.return_value
+        if type(return_value) is Variable:
+            return_value = return_value.value
+            self.return_value = return_value
         self.is_return = False
-        if return_value is None and return_type is not None:
-            raise MissingReturnTypeError(function_call.position, return_type)
-        elif (
-            type(return_value) != return_type
-            and return_type is not None
-            and return_value is not None
-        ):
+        return_type = target.return_type
+        if return_type is not None and type(return_value) is not return_type:
+            if return_value is None:
+                raise MissingReturnTypeError(
+                    function_call.position, return_type
+                )
             raise InvalidReturnTypeError(
                 function_call.position, type(return_value), return_type
             )
 
-        self.environment.destroy_function_local_scope()
+        environment.destroy_function_frame()
+        free_frames.append(frame)
+        if cache is not None:
+            cache.put(key, return_value)
         return return_value
 
+    def _bind_call(self, call_expression: CallExpression) -> None:
+        """Binds call expression to target of function it calls, or to None
+        if it does not call function of program"""
+        name = call_expression.called_expression
+        target = self.targets.get(name)
+        if target is None:
+            if not self.environment.has_function(name):
+                self.call_sites[call_expression] = None
+                return
+            target = CallTarget(
+                self.environment.get_function(name), self.caches.get(name)
+            )
+            self.targets[name] = target
+        slots = tuple(
+            self.resolver.get_slot(argument)
+            if isinstance(argument, IdentifierExpression)
+            else None
+            for argument in call_expression.arguments
+        )
+        self.call_sites[call_expression] = CallSite(target, slots)
+
     def _visit_MethodCall(self, method_call: CallExpression) -> None:
         name = method_call.called_expression
         if name == "print":
@@ -268,7 +514,88 @@ class Interpreter(Visitor):
             )
         return (method_call.called_expression, method_call.arguments)
 
-    def _visit_VariableCall(self, variable_call: CallExpression) -> None:
+    def _visit_VariableCall(self, variable_call: CallExpression) -> Any:
+        method_site = self.method_sites.get(variable_call, MISSING)
+        if method_site is MISSING:
+            method_site = self._bind_method(variable_call)
+        if method_site is None:
+            return self._visit_DynamicCall(variable_call)
+
+        if method_site.root_slot is None:
+            root = self._get_value(self.visit(variable_call.root_expression))
+        else:
+            root = self._get_slot_value(
+                variable_call.root_expression, method_site.root_slot
+            )
+        receiver_type = type(root)
+        function = method_site.functions.get(receiver_type, MISSING)
+        if function is MISSING:
+            function = self._find_method(method_site, receiver_type)
+        if function is None:
+            function = getattr(root, method_site.name, MISSING)
+            if function is MISSING:
+                raise MissingFunctionDeclarationError(
+                    variable_call.position, method_site.name
+                )
+            argument_values = []
+        else:
+            argument_values = [root]
+        for argument, slot in zip(
+            variable_call.called_expression.arguments, method_site.slots
+        ):
+            if slot is None:
+                argument_values.append(self._get_value(self.visit(argument)))
+            else:
+                argument_values.append(self._get_slot_value(argument, slot))
+        try:
+            return function(*argument_values)
+        except Exception as e:
+            raise InvalidCallTypeError(variable_call.position, e)
+
+    def _bind_method(
+        self, variable_call: CallExpression
+    ) -> Optional[MethodSite]:
+        """Binds call of method to name of method, or to None if called
+        expression is not call of method, so that name is known only after
+        it is evaluated"""
+        called_expression = variable_call.called_expression
+        method_site = None
+        if (
+            isinstance(called_expression, CallExpression)
+            and called_expression.root_expression is None
+            and called_expression.called_expression != "print"
+            and called_expression.called_expression not in OBJECT_TYPES
+            and not self.environment.has_function(
+                called_expression.called_expression
+            )
+        ):
+            slots = tuple(
+                self.resolver.get_slot(expression)
+                if isinstance(expression, IdentifierExpression)
+                else None
+                for expression in [
+                    variable_call.root_expression,
+                    *called_expression.arguments,
+                ]
+            )
+            method_site = MethodSite(
+                called_expression.called_expression, slots[0], slots[1:]
+            )
+        self.method_sites[variable_call] = method_site
+        return method_site
+
+    def _find_method(
+        self, method_site: MethodSite, receiver_type: type
+    ) -> Optional[Callable[..., Any]]:
+        """Returns function defined for method in class of receiver and
+        stores it in call site, None if class has no such function"""
+        function = getattr_static(receiver_type, method_site.name, None)
+        if not isfunction(function):
+            function = None
+        method_site.functions[receiver_type] = function
+        return function
+
+    def _visit_DynamicCall(self, variable_call: CallExpression) -> Any:
         root = self._get_value(self.visit(variable_call.root_expression))
         name, arguments = self.visit(variable_call.called_expression)
         function = getattr(root, name, self._not_existing_function)
@@ -289,9 +616,12 @@ class Interpreter(Visitor):
         if self.is_return:
             return
         if call_expression.root_expression is None:
-            name = call_expression.called_expression
-            if self.environment.has_function(name):
-                return self._visit_FunctionCall(call_expression)
+            call_site = self.call_sites.get(call_expression, MISSING)
+            if call_site is MISSING:
+                self._bind_call(call_expression)
+                call_site = self.call_sites[call_expression]
+            if call_site is not None:
+                return self._visit_FunctionCall(call_expression, call_site)
             else:
                 return self._visit_MethodCall(call_expression)
         else:
@@ -300,28 +630,70 @@ class Interpreter(Visitor):
     def _visit_IdentifierExpression(
         self, identifier_expression: IdentifierExpression
     ) -> Variable:
-        if self.environment.has_variable(identifier_expression.identifier):
-            variable: Variable = self.environment.get_variable(
-                identifier_expression.identifier
+        variable = self._get_variable(identifier_expression)
+        if variable is None:
+            raise MissingVariableDeclarationError(
+                identifier_expression.position,
+                identifier_expression.identifier,
             )
-            return variable
-        else:
+        return variable
+
+    def _get_slot_value(
+        self, identifier_expression: IdentifierExpression, slot: Slot
+    ) -> any:
+        """Returns value of variable in slot resolved for identifier"""
+        variable = self.environment.frames[slot.depth][slot.index]
+        if variable is None:
             raise MissingVariableDeclarationError(
                 identifier_expression.position,
                 identifier_expression.identifier,
             )
+        return variable.value
+
+    def _get_variable(
+        self, identifier_expression: IdentifierExpression
+    ) -> Optional[Variable]:
+        """Returns variable in slot resolved for identifier, None if it is
+        not declared"""
+        slot = self.resolver.get_slot(identifier_expression)
+        if slot is None:
+            return None
+        return self.environment.get_variable(slot.depth, slot.index)
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> any:
+        """Value is kept in frame of loop, it is not kept after return
+        statement as calls evaluate to None then"""
+        expression = invariant_expression.expression
+        if self.is_return:
+            return self._get_value(self.visit(expression))
+        depth, index = self.resolver.get_invariant_slot(invariant_expression)
+        frame = self.environment.frames[depth]
+        value = frame[index]
+        if value is None:
+            value = self._get_value(self.visit(expression))
+            frame[index] = value
+        return value
 
     def _visit_CastExpression(self, cast_expression: CastExpression) -> any:
         variable = self._get_value(self.visit(cast_expression.expression))
-        cast_type = cast_expression.cast_type
-        new_value = self._get_cast_function(cast_type)(variable)
-        return new_value
+        cast_function = self.handlers.get(cast_expression)
+        if cast_function is None:
+            cast_function = self._get_cast_function(cast_expression.cast_type)
+            self.handlers[cast_expression] = cast_function
+        return cast_function(variable)
 
     def _visit_Block(self, block: Block) -> None:
-        self.environment.create_local_scope()
+        size = self.resolver.frame_sizes.get(block)
+        if size is None:
+            for statement in block.statements:
+                self.visit(statement)
+            return
+        self.environment.create_frame(size)
         for statement in block.statements:
             self.visit(statement)
-        self.environment.destroy_local_scope()
+        self.environment.destroy_frame()
 
     def _visit_IntegerExpression(
         self, integer_expression: IntegerExpression
@@ -346,6 +718,21 @@ class Interpreter(Visitor):
     def _visit_LogicalExpression(
         self, logical_expression: LogicalExpression
     ) -> bool:
+        typed_handler = self.typed_handlers.get(logical_expression)
+        if typed_handler is not None:
+            handler, left_slot, right_slot = typed_handler
+            if left_slot is None:
+                left = self.visit(logical_expression.left)
+            else:
+                left = self._get_slot_value(logical_expression.left, left_slot)
+            if right_slot is None:
+                right = self.visit(logical_expression.right)
+            else:
+                right = self._get_slot_value(
+                    logical_expression.right, right_slot
+                )
+            return handler(left, right)
+
         left = self._get_value(self.visit(logical_expression.left))
         right = self._get_value(self.visit(logical_expression.right))
         operator = logical_expression.operator
@@ -353,9 +740,15 @@ class Interpreter(Visitor):
             raise MismatchedTypeError(
                 logical_expression.position, type(left), type(right), operator
             )
-        return self._get_operator_function(operator)(
-            left, right, logical_expression
-        )
+        operator_function = self.handlers.get(logical_expression)
+        if operator_function is None:
+            operator_function = self._get_operator_function(operator)
+            self.handlers[logical_expression] = operator_function
+        return operator_function(left, right, logical_expression)
+
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
 
     def _execute_print(self, expressions: list) -> None:
         output = ""
@@ -369,12 +762,13 @@ class Interpreter(Visitor):
         argument_values = [
             self._get_value(self.visit(argument)) for argument in arguments
         ]
-        if len(argument_values) != len(signature(object_type).parameters):
+        parameters = OBJECT_PARAMETERS[object_type]
+        if len(argument_values) != len(parameters):
             raise NumberOfArgumentError(
                 expression.position,
                 object_type.__name__,
                 argument_values,
-                signature(object_type).parameters,
+                parameters,
             )
         try:
             return object_type(*argument_values)
@@ -382,21 +776,7 @@ class Interpreter(Visitor):
             raise InvalidCallTypeError(expression.position, e)
 
     def _get_operator_function(self, operator: str):
-        operator_functions = {
-            TokenType.OR.value: self._accept_or,
-            TokenType.AND.value: self._accept_and,
-            TokenType.EQUAL.value: self._accept_equal,
-            TokenType.NOT_EQUAL.value: self._accept_not_equal,
-            TokenType.GREATER.value: self._accept_greater,
-            TokenType.LESS.value: self._accept_less,
-            TokenType.GREATER_EQUAL.value: self._accept_greater_equal,
-            TokenType.LESS_EQUAL.value: self._accept_less_equal,
-            TokenType.ADD.value: self._accept_add,
-            TokenType.SUBTRACT.value: self._accept_sub,
-            TokenType.MULTIPLY.value: self._accept_mul,
-            TokenType.DIVIDE.value: self._accept_div,
-        }
-        return operator_functions[operator]
+        return getattr(self, OPERATOR_HANDLERS[operator])
 
     def _get_value(self, variable: any) -> any:
         if isinstance(variable, Variable):
@@ -405,28 +785,30 @@ class Interpreter(Visitor):
             return variable
 
     def _get_cast_function(self, cast_type: Type):
-        cast_functions = {
-            Int: self._accept_int,
-            Dec: self._accept_dec,
-        }
-        return cast_functions[cast_type]
+        return getattr(self, CAST_HANDLERS[cast_type])
 
     def _visit_OrExpression(self, or_expression: OrExpression) -> bool:
+        if self.short_circuit:
+            return self._short_circuit(or_expression, True)
         return self._visit_LogicalExpression(or_expression)
 
     def _visit_AndExpression(self, and_expression: AndExpression) -> bool:
+        if self.short_circuit:
+            return self._short_circuit(and_expression, False)
         return self._visit_LogicalExpression(and_expression)
 
-    def _visit_RelativeExpression(
-        self, relative_expression: RelativeExpression
+    def _short_circuit(
+        self, logical_expression: LogicalExpression, deciding_value: bool
     ) -> bool:
-        return self._visit_LogicalExpression(relative_expression)
-
-    def _visit_SumExpression(self, sum_expression: SumExpression) -> any:
-        return self._visit_LogicalExpression(sum_expression)
-
-    def _visit_MulExpression(self, mul_expression: MulExpression) -> any:
-        return self._visit_LogicalExpression(mul_expression)
+        """Evaluates right operand only if left one is not deciding value,
+        both operands have to be bool"""
+        position = logical_expression.position
+        operator = logical_expression.operator
+        left = self._get_value(self.visit(logical_expression.left))
+        if check_left_operand(position, operator, left) == deciding_value:
+            return left
+        right = self._get_value(self.visit(logical_expression.right))
+        return check_right_operand(position, operator, right)
 
     def _visit_NegatedExpression(
         self, negative_expression: NegatedExpression
@@ -0,0 +1,273 @@
+import sys
+from collections import OrderedDict
+from copy import copy
+from parser.objects.block import Block
+from parser.objects.expression import (CallExpression, CastExpression,
+                                       IdentifierExpression,
+                                       InvariantExpression, LiteralExpression,
+                                       LogicalExpression, NegatedExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from parser.objects.type import Shape
+from typing import Any, Iterable, Optional
+
+from interpreter.runtime import MISSING
+from interpreter.visitor import Visitor
+from utility.utility import LITERAL_TYPES, OBJECT_TYPES
+
+MUTATING_METHODS: list[str] = ["move", "display", "push", "pop"]
+
+
+def is_shape(value_type: Any) -> bool:
+    return isinstance(value_type, type) and issubclass(value_type, Shape)
+
+
+def arguments_key(arguments: Iterable[Any]) -> tuple:
+    """Returns key of cache for values of arguments, zero decimals are
+    keyed by their text, so that 0.0 and -0.0 are told apart"""
+    return tuple(
+        argument if argument or type(argument) is not float else str(argument)
+        for argument in arguments
+    )
+
+
+class FunctionCache:
+    """Bounded LRU cache of values returned by pure function, keyed by
+    values of its arguments. Shapes are copied when stored and when
+    returned, so that no caller gets object it could change in cache"""
+
+    __slots__ = ("name", "size", "copy", "values", "hits", "misses")
+
+    name: str
+    size: int
+    copy: bool
+    values: OrderedDict[tuple, Any]
+    hits: int
+    misses: int
+
+    def __init__(self, name: str, size: int, copy: bool = False) -> None:
+        self.name = name
+        self.size = size
+        self.copy = copy
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Any:
+        """Returns value stored for key, MISSING if there is none"""
+        value = self.values.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        self.values.move_to_end(key)
+        return copy(value) if self.copy else value
+
+    def put(self, key: tuple, value: Any) -> None:
+        """Stores value for key, evicting least recently used value when
+        cache is full"""
+        self.values[key] = copy(value) if self.copy else value
+        if len(self.values) > self.size:
+            self.values.popitem(last=False)
+
+
+class PurityAnalyzer(Visitor):
+    """Finds functions of program, which values can be memoized. Their
+    bodies do not print, call methods changing objects nor functions,
+    which are not pure, they return value of literal type or shape, take
+    no canvas and take shapes only when they return literal value"""
+
+    functions: dict[str, Function]
+    calls: set[str]
+
+    def __init__(self) -> None:
+        self.functions = {}
+        self.calls = set()
+
+    def memoizable(self, program: Program) -> list[str]:
+        """Returns names of functions, which values can be memoized"""
+        self.functions = {
+            object.name: object
+            for object in program.objects
+            if isinstance(object, Function)
+        }
+        calls = {}
+        for name, function in self.functions.items():
+            self.calls = set()
+            if self._is_pure(function.block):
+                calls[name] = self.calls
+        changed = True
+        while changed:
+            changed = False
+            for name in list(calls):
+                if not calls[name].issubset(calls):
+                    del calls[name]
+                    changed = True
+        return [
+            name
+            for name in calls
+            if self._has_memoizable_signature(self.functions[name])
+        ]
+
+    def invalid_visit(self, node: Node) -> bool:
+        return False
+
+    def _has_memoizable_signature(self, function: Function) -> bool:
+        return_type = function.declaration_type
+        if return_type in LITERAL_TYPES:
+            return all(
+                parameter_type in LITERAL_TYPES or is_shape(parameter_type)
+                for parameter_type, _ in function.argument_list
+            )
+        return is_shape(return_type) and all(
+            parameter_type in LITERAL_TYPES
+            for parameter_type, _ in function.argument_list
+        )
+
+    def _is_pure(self, node: Optional[Node]) -> bool:
+        return node is None or self.visit(node)
+
+    def _visit_Block(self, block: Block) -> bool:
+        return all(self._is_pure(statement) for statement in block.statements)
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> bool:
+        return (
+            self._is_pure(if_statement.condition)
+            and self._is_pure(if_statement.block)
+            and self._is_pure(if_statement.else_block)
+        )
+
+    def _visit_WhileStatement(self, while_statement: WhileStatement) -> bool:
+        return self._is_pure(while_statement.condition) and self._is_pure(
+            while_statement.block
+        )
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> bool:
+        return self._is_pure(iterate_statement.expression) and self._is_pure(
+            iterate_statement.block
+        )
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> bool:
+        return self._is_pure(return_statement.expression)
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> bool:
+        return self._is_pure(declaration_statement.expression)
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> bool:
+        return self._is_pure(assignment_statement.expression)
+
+    def _visit_CallExpression(self, call_expression: CallExpression) -> bool:
+        if not all(
+            self._is_pure(argument)
+            for argument in call_expression.arguments or []
+        ):
+            return False
+        if call_expression.root_expression is not None:
+            return self._is_pure(
+                call_expression.root_expression
+            ) and self._is_pure_method(call_expression.called_expression)
+        name = call_expression.called_expression
+        if name in self.functions:
+            self.calls.add(name)
+            return True
+        return name in OBJECT_TYPES
+
+    def _is_pure_method(self, called_expression: Any) -> bool:
+        """Checks that method call calls method, which does not change its
+        object, with pure arguments"""
+        if not (
+            isinstance(called_expression, CallExpression)
+            and called_expression.root_expression is None
+        ):
+            return False
+        name = called_expression.called_expression
+        return (
+            name not in self.functions
+            and name not in OBJECT_TYPES
+            and name not in MUTATING_METHODS
+            and name != "print"
+            and not name.startswith("_")
+            and all(
+                self._is_pure(argument)
+                for argument in called_expression.arguments or []
+            )
+        )
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> bool:
+        return self._is_pure(logical_expression.left) and self._is_pure(
+            logical_expression.right
+        )
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> bool:
+        return self._is_pure(negated_expression.expression)
+
+    def _visit_CastExpression(self, cast_expression: CastExpression) -> bool:
+        return self._is_pure(cast_expression.expression)
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> bool:
+        return self._is_pure(invariant_expression.expression)
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> bool:
+        return True
+
+    def _visit_LiteralExpression(
+        self, literal_expression: LiteralExpression
+    ) -> bool:
+        return True
+
+    _visit_IntegerExpression = _visit_LiteralExpression
+    _visit_DecimalExpression = _visit_LiteralExpression
+    _visit_BooleanExpression = _visit_LiteralExpression
+    _visit_StringExpression = _visit_LiteralExpression
+
+
+def create_caches(program: Program, size: int) -> dict[str, FunctionCache]:
+    """Returns caches of given size for memoizable functions of program,
+    no caches if size is not positive"""
+    if size <= 0:
+        return {}
+    analyzer = PurityAnalyzer()
+    return {
+        name: FunctionCache(
+            name,
+            size,
+            is_shape(analyzer.functions[name].declaration_type),
+        )
+        for name in analyzer.memoizable(program)
+    }
+
+
+def print_cache_statistics(caches: dict[str, FunctionCache]) -> None:
+    """Prints numbers of hits and misses of caches to standard error"""
+    for cache in caches.values():
+        print(
+            f"{cache.name}: {cache.hits} hits, {cache.misses} misses",
+            file=sys.stderr,
+        )
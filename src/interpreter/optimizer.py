@@ -0,0 +1,499 @@
+from parser.objects.block import Block
+from parser.objects.expression import (BooleanExpression, CallExpression,
+                                       CastExpression, DecimalExpression,
+                                       Expression, IdentifierExpression,
+                                       IntegerExpression, InvariantExpression,
+                                       LiteralExpression, LogicalExpression,
+                                       NegatedExpression, StringExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      Statement, WhileStatement)
+from parser.parser import Parser
+from typing import Any, Iterator, Optional, Union
+
+from error.error_interpreter import DivisionByZeroError, InterpreterError
+from error.error_manager import ErrorManager
+from interpreter.runtime import (CAST_FUNCTIONS, MISSING, OPERATORS, divide,
+                                 negate)
+from interpreter.visitor import Visitor
+from lexer.token_manager import TokenType
+from utility.utility import Position
+
+LITERAL_VALUES: dict[type[LiteralExpression], type] = {
+    IntegerExpression: int,
+    DecimalExpression: float,
+    BooleanExpression: bool,
+    StringExpression: str,
+}
+
+LITERAL_EXPRESSIONS: dict[type, type[LiteralExpression]] = {
+    value_type: expression_type
+    for expression_type, value_type in LITERAL_VALUES.items()
+}
+
+PURE_METHODS: list[str] = ["area", "perimeter", "d", "r", "R"]
+
+
+class Optimizer(Visitor):
+    """Folds expressions of literals into literals and removes branches of
+    if statements which conditions are literals, folded expressions have
+    the value they would be evaluated to"""
+
+    error_manager: ErrorManager
+
+    def __init__(self, error_manager: ErrorManager) -> None:
+        self.error_manager = error_manager
+
+    def optimize(self, program: Program) -> Program:
+        """Optimizes program in place, division of literal by zero is
+        reported to error manager and left to be raised at runtime"""
+        self.visit(program)
+        return program
+
+    def invalid_visit(self, node: Node) -> Node:
+        """Literals, identifiers and missing nodes are left unchanged"""
+        return node
+
+    def _value(self, expression: Expression) -> Any:
+        """Returns value of literal, MISSING for other expressions"""
+        value_type = LITERAL_VALUES.get(type(expression))
+        if value_type is None:
+            return MISSING
+        return value_type(expression.value)
+
+    def _literal(self, position: Position, value: Any) -> Expression:
+        return LITERAL_EXPRESSIONS[type(value)](position, value)
+
+    def _visit_Program(self, program: Program) -> Program:
+        for object in program.objects:
+            self.visit(object)
+        return program
+
+    def _visit_Function(self, function: Function) -> Function:
+        self.visit(function.block)
+        return function
+
+    def _visit_Block(self, block: Block) -> Block:
+        statements = []
+        for statement in block.statements:
+            statement = self.visit(statement)
+            if isinstance(statement, IfStatement):
+                statements += self._live_statements(statement)
+            else:
+                statements.append(statement)
+        block.statements = statements
+        return block
+
+    def _live_statements(self, if_statement: IfStatement) -> list[Statement]:
+        """Returns statements replacing if statement, branch chosen by
+        literal condition is inlined if it declares no variables and does
+        not return, otherwise it stays in if statement without else"""
+        condition = self._value(if_statement.condition)
+        if condition is MISSING:
+            return [if_statement]
+        block = if_statement.block if condition else if_statement.else_block
+        if block is None:
+            return []
+        if not any(
+            isinstance(statement, (DeclarationStatement, ReturnStatement))
+            for statement in block.statements
+        ):
+            return block.statements
+        position = if_statement.position
+        return [
+            IfStatement(
+                position, BooleanExpression(position, True), block, None
+            )
+        ]
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> IfStatement:
+        """Branch which literal condition does not choose is not folded, so
+        that errors are not reported for code removed as dead"""
+        if if_statement.condition is not None:
+            if_statement.condition = self.visit(if_statement.condition)
+        condition = self._value(if_statement.condition)
+        if condition is MISSING or condition:
+            self.visit(if_statement.block)
+        if if_statement.else_block and (condition is MISSING or not condition):
+            self.visit(if_statement.else_block)
+        return if_statement
+
+    def _visit_WhileStatement(
+        self, while_statement: WhileStatement
+    ) -> WhileStatement:
+        if while_statement.condition is not None:
+            while_statement.condition = self.visit(while_statement.condition)
+        condition = self._value(while_statement.condition)
+        if condition is MISSING or condition:
+            self.visit(while_statement.block)
+        return while_statement
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> IterateStatement:
+        if iterate_statement.expression is not None:
+            iterate_statement.expression = self.visit(
+                iterate_statement.expression
+            )
+        self.visit(iterate_statement.block)
+        return iterate_statement
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> ReturnStatement:
+        if return_statement.expression is not None:
+            return_statement.expression = self.visit(
+                return_statement.expression
+            )
+        return return_statement
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> DeclarationStatement:
+        if declaration_statement.expression is not None:
+            declaration_statement.expression = self.visit(
+                declaration_statement.expression
+            )
+        return declaration_statement
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> AssignmentStatement:
+        if assignment_statement.expression is not None:
+            assignment_statement.expression = self.visit(
+                assignment_statement.expression
+            )
+        return assignment_statement
+
+    def _visit_CallExpression(
+        self, call_expression: CallExpression
+    ) -> CallExpression:
+        if call_expression.root_expression is not None:
+            call_expression.root_expression = self.visit(
+                call_expression.root_expression
+            )
+        if isinstance(call_expression.called_expression, Node):
+            call_expression.called_expression = self.visit(
+                call_expression.called_expression
+            )
+        if call_expression.arguments:
+            call_expression.arguments = [
+                self.visit(argument) for argument in call_expression.arguments
+            ]
+        return call_expression
+
+    def _visit_CastExpression(
+        self, cast_expression: CastExpression
+    ) -> Expression:
+        cast_expression.expression = self.visit(cast_expression.expression)
+        value = self._value(cast_expression.expression)
+        if value is MISSING:
+            return cast_expression
+        try:
+            value = CAST_FUNCTIONS[cast_expression.cast_type](value)
+        except InterpreterError:
+            return cast_expression
+        return self._literal(cast_expression.position, value)
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> Expression:
+        negated_expression.expression = self.visit(
+            negated_expression.expression
+        )
+        value = self._value(negated_expression.expression)
+        if value is MISSING:
+            return negated_expression
+        try:
+            value = negate(
+                negated_expression.position, negated_expression.operator, value
+            )
+        except InterpreterError:
+            return negated_expression
+        return self._literal(negated_expression.position, value)
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> Expression:
+        """Operands of or and and are folded only if both are bool, so that
+        result does not depend on evaluation mode"""
+        logical_expression.left = self.visit(logical_expression.left)
+        logical_expression.right = self.visit(logical_expression.right)
+        position = logical_expression.position
+        operator = logical_expression.operator
+        left = self._value(logical_expression.left)
+        right = self._value(logical_expression.right)
+        if operator == TokenType.DIVIDE.value and right is not MISSING:
+            if right == 0:
+                self.error_manager.add_error(DivisionByZeroError(position))
+                return logical_expression
+        if left is MISSING or right is MISSING or type(left) != type(right):
+            return logical_expression
+        if (
+            operator in [TokenType.OR.value, TokenType.AND.value]
+            and type(left) != bool
+        ):
+            return logical_expression
+        try:
+            if operator == TokenType.DIVIDE.value:
+                value = divide(position, left, right)
+            else:
+                value = OPERATORS[operator](left, right)
+        except (TypeError, OverflowError):
+            return logical_expression
+        return self._literal(position, value)
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+
+class InvariantHoister(Visitor):
+    """Wraps loop invariant expressions calling methods of PURE_METHODS in
+    invariant expressions, which are evaluated at most once per entry of
+    their loop, where expression is evaluated first. Variables declared or
+    assigned in loop are not invariant, neither are receivers of other
+    methods, like move or push, and arguments of functions, which may
+    modify objects they refer to"""
+
+    functions: set[str]
+    variant: set[str]
+    invariants: list[InvariantExpression]
+
+    def hoist(self, program: Program) -> Program:
+        """Hoists invariants of loops of program in place, expression
+        invariant in nested loops belongs to the outermost of them"""
+        self.functions = {
+            object.name
+            for object in program.objects
+            if isinstance(object, Function)
+        }
+        self.visit(program)
+        return program
+
+    def invalid_visit(self, node: Node) -> None:
+        """Statements outside loops have no invariants"""
+
+    def _visit_Program(self, program: Program) -> None:
+        for object in program.objects:
+            self.visit(object)
+
+    def _visit_Function(self, function: Function) -> None:
+        self.visit(function.block)
+
+    def _visit_Block(self, block: Block) -> None:
+        for statement in block.statements:
+            self.visit(statement)
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> None:
+        self.visit(if_statement.block)
+        if if_statement.else_block:
+            self.visit(if_statement.else_block)
+
+    def _visit_WhileStatement(self, while_statement: WhileStatement) -> None:
+        if while_statement.condition is not None:
+            self._hoist(while_statement)
+        self.visit(while_statement.block)
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> None:
+        """Iterated expression is evaluated once per entry of loop already,
+        so only block is searched for invariants"""
+        self._hoist(iterate_statement)
+        self.visit(iterate_statement.block)
+
+    def _hoist(self, loop: Union[WhileStatement, IterateStatement]) -> None:
+        self.variant = self._variant_names(loop)
+        self.invariants = loop.invariants
+        if isinstance(loop, WhileStatement):
+            loop.condition = self._hoisted(loop.condition)
+        for statement in self._statements(loop.block):
+            if isinstance(statement, Expression):
+                self._hoist_nested(statement)
+            else:
+                field = self._field(statement)
+                expression = self._hoisted(getattr(statement, field))
+                setattr(statement, field, expression)
+
+    def _statements(self, block: Block) -> list[Statement]:
+        """Returns statements of block and of blocks nested in them"""
+        statements = []
+        for statement in block.statements:
+            statements.append(statement)
+            if isinstance(
+                statement, (IfStatement, WhileStatement, IterateStatement)
+            ):
+                statements += self._statements(statement.block)
+            if isinstance(statement, IfStatement) and statement.else_block:
+                statements += self._statements(statement.else_block)
+        return statements
+
+    def _field(self, statement: Statement) -> str:
+        """Returns name of field holding expression of statement"""
+        if isinstance(statement, (IfStatement, WhileStatement)):
+            return "condition"
+        return "expression"
+
+    def _expression(self, statement: Union[Statement, Expression]) -> Any:
+        """Returns expression of statement, expression statement itself"""
+        if isinstance(statement, Expression):
+            return statement
+        return getattr(statement, self._field(statement))
+
+    def _variant_names(
+        self, loop: Union[WhileStatement, IterateStatement]
+    ) -> set[str]:
+        """Returns names of variables, which may change in loop"""
+        names = set()
+        expressions = []
+        if isinstance(loop, WhileStatement):
+            expressions.append(loop.condition)
+        else:
+            names.add(loop.identifier)
+        for statement in self._statements(loop.block):
+            if isinstance(statement, (DeclarationStatement, IterateStatement)):
+                names.add(statement.identifier)
+            elif isinstance(statement, AssignmentStatement) and isinstance(
+                statement.identifier, IdentifierExpression
+            ):
+                names.add(statement.identifier.identifier)
+            expressions.append(self._expression(statement))
+
+        for expression in expressions:
+            for node in self._subexpressions(expression):
+                if not isinstance(node, CallExpression):
+                    continue
+                called = node.called_expression
+                if isinstance(node.root_expression, IdentifierExpression):
+                    if not self._is_pure_method(called):
+                        names.add(node.root_expression.identifier)
+                elif called in self.functions:
+                    names.update(
+                        argument.identifier
+                        for argument in node.arguments
+                        if isinstance(argument, IdentifierExpression)
+                    )
+        return names
+
+    def _subexpressions(self, expression: Node) -> Iterator[Node]:
+        """Yields expression and all expressions nested in it"""
+        if not isinstance(expression, Node):
+            return
+        yield expression
+        if isinstance(expression, LogicalExpression):
+            children = [expression.left, expression.right]
+        elif isinstance(
+            expression,
+            (CastExpression, NegatedExpression, InvariantExpression),
+        ):
+            children = [expression.expression]
+        elif isinstance(expression, CallExpression):
+            children = [
+                expression.root_expression,
+                expression.called_expression,
+                *(expression.arguments or []),
+            ]
+        else:
+            children = []
+        for child in children:
+            yield from self._subexpressions(child)
+
+    def _is_pure_method(self, called_expression: Any) -> bool:
+        """Checks that method call calls method of PURE_METHODS without
+        arguments"""
+        return (
+            isinstance(called_expression, CallExpression)
+            and called_expression.root_expression is None
+            and called_expression.called_expression in PURE_METHODS
+            and called_expression.called_expression not in self.functions
+            and not called_expression.arguments
+        )
+
+    def _pure_calls(self, expression: Expression) -> Optional[int]:
+        """Returns number of calls of pure methods in expression if it is
+        invariant, None otherwise"""
+        if isinstance(expression, LiteralExpression):
+            return 0
+        elif isinstance(expression, IdentifierExpression):
+            return None if expression.identifier in self.variant else 0
+        elif isinstance(expression, (CastExpression, NegatedExpression)):
+            return self._pure_calls(expression.expression)
+        elif isinstance(expression, LogicalExpression):
+            left = self._pure_calls(expression.left)
+            right = self._pure_calls(expression.right)
+            if left is None or right is None:
+                return None
+            return left + right
+        elif (
+            isinstance(expression, CallExpression)
+            and isinstance(expression.root_expression, IdentifierExpression)
+            and self._is_pure_method(expression.called_expression)
+        ):
+            if expression.root_expression.identifier in self.variant:
+                return None
+            return 1
+        return None
+
+    def _hoisted(self, expression: Expression) -> Expression:
+        """Returns expression with its greatest invariant subexpressions
+        calling pure methods replaced by invariant expressions"""
+        calls = self._pure_calls(expression)
+        if calls:
+            invariant = InvariantExpression(expression.position, expression)
+            self.invariants.append(invariant)
+            return invariant
+        elif calls is None:
+            self._hoist_nested(expression)
+        return expression
+
+    def _hoist_nested(self, expression: Expression) -> None:
+        """Hoists invariants from expressions nested in expression"""
+        if isinstance(expression, LogicalExpression):
+            expression.left = self._hoisted(expression.left)
+            expression.right = self._hoisted(expression.right)
+        elif isinstance(expression, (CastExpression, NegatedExpression)):
+            expression.expression = self._hoisted(expression.expression)
+        elif isinstance(expression, CallExpression):
+            if expression.root_expression is not None:
+                expression.root_expression = self._hoisted(
+                    expression.root_expression
+                )
+            if isinstance(expression.called_expression, CallExpression):
+                expression.called_expression = self._hoisted(
+                    expression.called_expression
+                )
+            if expression.arguments:
+                expression.arguments = [
+                    self._hoisted(argument)
+                    for argument in expression.arguments
+                ]
+
+
+class OptimizingParser:
+    """Parser returning programs optimized by Optimizer and InvariantHoister,
+    optionally printing optimized tree"""
+
+    parser: Parser
+    error_manager: ErrorManager
+    dump: bool
+
+    def __init__(self, parser: Parser, dump: bool = False) -> None:
+        self.parser = parser
+        self.error_manager = parser.error_manager
+        self.dump = dump
+
+    def parse_program(self) -> Program:
+        program = Optimizer(self.error_manager).optimize(
+            self.parser.parse_program()
+        )
+        InvariantHoister().hoist(program)
+        if self.dump:
+            print(program)
+        return program
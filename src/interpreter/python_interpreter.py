@@ -0,0 +1,814 @@
+from __future__ import annotations
+
+import math
+from parser.objects.block import Block
+from parser.objects.expression import (BooleanExpression, CallExpression,
+                                       CastExpression, DecimalExpression,
+                                       Expression, IdentifierExpression,
+                                       IntegerExpression, InvariantExpression,
+                                       LogicalExpression, NegatedExpression,
+                                       StringExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from parser.objects.type import Canvas, Dec, Int, Shape, Type
+from parser.parser import Parser
+from typing import Any, NamedTuple, NoReturn, Optional, Union
+
+from error import error_interpreter
+from interpreter import runtime
+from interpreter.memoization import (FunctionCache, arguments_key,
+                                     create_caches)
+from interpreter.runtime import (NUMERIC_TYPES, SHORT_CIRCUIT_OPERATORS,
+                                 binary_type)
+from interpreter.visitor import Visitor
+from lexer.token_manager import TokenType
+from utility.utility import (LITERAL_TYPES, MAX_REC_DEPTH, OBJECT_PARAMETERS,
+                             OBJECT_TYPES, Position)
+
+
+# Number of statically nested loops and levels of indentation allowed by
+# Python, statements nested deeper are translated into helper functions
+MAX_NESTED_LOOPS = 20
+MAX_INDENTATION = 99
+
+
+class Binding(NamedTuple):
+    """Python name of variable with type used in its runtime checks and
+    type its value is known to have"""
+
+    name: str
+    type: Union[type, Type]
+    value_type: Optional[type]
+
+
+class Resumption(NamedTuple):
+    """Block holding statement being translated, which statements from
+    index on follow it, or loop containing it with header of loop going on
+    after return statement, depth is number of scopes seen by them"""
+
+    node: Node
+    index: int
+    depth: int
+    header: str
+
+
+def _raise(error: Exception) -> NoReturn:
+    raise error
+
+
+RUNTIME: dict[str, Any] = {
+    **OBJECT_TYPES,
+    **{
+        name: error
+        for name, error in vars(error_interpreter).items()
+        if name.endswith("Error")
+    },
+    "_raise": _raise,
+    "_argument": runtime.argument,
+    "_check_declaration": runtime.check_declaration,
+    "_binary": runtime.binary,
+    "_divide": runtime.divide,
+    "_check_left_operand": runtime.check_left_operand,
+    "_check_right_operand": runtime.check_right_operand,
+    "_negate": runtime.negate,
+    "_cast": runtime.cast,
+    "_accept_int": runtime.accept_int,
+    "_accept_dec": runtime.accept_dec,
+    "_or": runtime.OPERATORS[TokenType.OR.value],
+    "_and": runtime.OPERATORS[TokenType.AND.value],
+    "_create": runtime.create,
+    "_create_invalid": runtime.create_invalid,
+    "_method": runtime.method,
+    "_invoke": runtime.invoke,
+    "_dynamic_method": runtime.dynamic_method,
+    "_arguments_key": arguments_key,
+    "_MISSING": runtime.MISSING,
+}
+
+
+class PythonInterpreter(Visitor):
+    """Interpreter translating program into Python source, which is
+    compiled and executed with checks of the language made explicit"""
+
+    parser: Parser
+    max_rec_depth: int
+    short_circuit: bool
+    memo_size: int
+    caches: dict[str, FunctionCache]
+    namespace: dict[str, Any]
+    scopes: list[dict[str, Binding]]
+    functions: dict[str, tuple[str, Function]]
+    invariants: dict[InvariantExpression, str]
+    resumptions: list[Resumption]
+    returned: bool
+    names: list[str]
+    helpers: list[tuple[str, list[str]]]
+    indentation: int
+    loops: int
+    return_type: Optional[type]
+    cache: Optional[str]
+    counter: int
+
+    def __init__(
+        self,
+        parser: Parser,
+        max_rec_depth: int = MAX_REC_DEPTH,
+        short_circuit: bool = False,
+        memo_size: int = 0,
+    ) -> None:
+        self.parser = parser
+        self.max_rec_depth = max_rec_depth
+        self.short_circuit = short_circuit
+        self.memo_size = memo_size
+        self.caches = {}
+
+    def interpret(self):
+        tree = self.parser.parse_program()
+        source = self.translate(tree)
+        exec(compile(source, "<program>", "exec"), self.namespace)
+
+    def translate(self, program: Program) -> str:
+        """Translates program into Python source executed in namespace"""
+        self.namespace = {
+            **RUNTIME,
+            "_depth": 0,
+            "_returned": None,
+            "_max_rec_depth": self.max_rec_depth,
+        }
+        self.scopes = []
+        self.functions = {}
+        self.invariants = {}
+        self.resumptions = []
+        self.returned = False
+        self.names = []
+        self.helpers = []
+        self.indentation = 1
+        self.loops = 0
+        self.caches = create_caches(program, self.memo_size)
+        self.return_type = None
+        self.cache = None
+        self.counter = 0
+        return "\n".join(self.visit(program)) + "\n"
+
+    def invalid_visit(self, node: Node) -> tuple[str, Optional[type]]:
+        error = f"No visit_{node.__class__.__name__} method defined"
+        return f"_raise(Exception({error!r}))", None
+
+    def _constant(self, value: Any) -> str:
+        """Stores value in namespace, returns name referring to it"""
+        self.counter += 1
+        name = f"_k{self.counter}"
+        self.namespace[name] = value
+        return name
+
+    def _name(self, prefix: str, identifier: str) -> str:
+        """Returns unique Python name for identifier of program"""
+        self.counter += 1
+        name = f"{prefix}{self.counter}"
+        if identifier.isidentifier():
+            name += f"_{identifier}"
+        self.names.append(name)
+        return name
+
+    def _type(self, value_type: Union[type, Type, None]) -> str:
+        """Returns code referring to type"""
+        if value_type in [int, float, bool, str]:
+            return value_type.__name__
+        if OBJECT_TYPES.get(getattr(value_type, "__name__", None)) is (
+            value_type
+        ):
+            return value_type.__name__
+        return self._constant(value_type)
+
+    def _find(self, identifier: str) -> Optional[Binding]:
+        for scope in reversed(self.scopes):
+            if identifier in scope:
+                return scope[identifier]
+        return None
+
+    def _statements(self, node: Node) -> list[str]:
+        """Translates statement or block into lines of code"""
+        if isinstance(node, Block):
+            self.scopes.append({})
+            lines = []
+            for index, statement in enumerate(node.statements, 1):
+                self.resumptions.append(
+                    Resumption(node, index, len(self.scopes), "")
+                )
+                lines.extend(self._statements(statement))
+                self.resumptions.pop()
+            self.scopes.pop()
+            return lines
+        if self._is_nested_too_deep(node):
+            return self._helper(node)
+        result = self.visit(node)
+        if isinstance(result, tuple):
+            return [result[0]]
+        return result
+
+    def _indent(self, lines: list[str]) -> list[str]:
+        return ["    " + line for line in lines]
+
+    def _body(self, node: Node) -> list[str]:
+        """Translates statement or block into indented body of compound
+        statement"""
+        self.indentation += 1
+        lines = self._indent(self._statements(node)) or ["    pass"]
+        self.indentation -= 1
+        return lines
+
+    def _is_nested_too_deep(self, node: Node) -> bool:
+        """Checks that compound statement exceeds limits of Python, when
+        its body has return statement, which adds loop to it"""
+        if not isinstance(
+            node, (IfStatement, WhileStatement, IterateStatement)
+        ):
+            return False
+        if self.indentation + 2 > MAX_INDENTATION:
+            return True
+        return (
+            not isinstance(node, IfStatement)
+            and self.loops + 2 > MAX_NESTED_LOOPS
+        )
+
+    def _helper(self, node: Node) -> list[str]:
+        """Translates compound statement into call of helper function
+        defined on start of translated function, which shares variables
+        with it and returns its value if return statement is reached"""
+        self.counter += 1
+        name = f"_h{self.counter}"
+        indentation, loops = self.indentation, self.loops
+        self.indentation, self.loops = 2, 0
+        self.helpers.append((name, self.visit(node)))
+        self.indentation, self.loops = indentation, loops
+        return [
+            f"_value = {name}()",
+            "if _value is not _MISSING:",
+            "    return _value",
+        ]
+
+    def _helpers(self, arguments: list[str]) -> list[str]:
+        """Returns definitions of helper functions of translated function,
+        its variables set only by helpers are set on its start"""
+        if not self.helpers:
+            return []
+        variables = [name for name in self.names if name not in arguments]
+        names = ", ".join([*self.names, "_value"])
+        lines = [" = ".join([*variables, "_value", "None"])]
+        for name, body in self.helpers:
+            lines += [
+                f"def {name}():",
+                "    global _depth, _returned",
+                f"    nonlocal {names}",
+                *self._indent(body),
+                "    return _MISSING",
+            ]
+        return lines
+
+    def _visit_Program(self, program: Program) -> list[str]:
+        for object in program.objects:
+            if isinstance(object, Function):
+                self.functions[object.name] = (
+                    self._name("_f", object.name),
+                    object,
+                )
+            else:
+                return [self.visit(object)[0]]
+
+        lines = []
+        for name, function in self.functions.values():
+            lines.extend(self._function(name, function))
+
+        if "main" not in self.functions:
+            position = self._constant(Position(0, 0))
+            lines.append(f"raise MissingMainFunctionError({position})")
+            return lines
+
+        main = self.functions["main"][1]
+        main_call = CallExpression(main.position, None, main.name, [])
+        lines.append(self.visit(main_call)[0])
+        return lines
+
+    def _function(self, name: str, function: Function) -> list[str]:
+        """Translates function into definition of Python function"""
+        self.return_type = function.declaration_type
+        if self.return_type in LITERAL_TYPES:
+            self.return_type = LITERAL_TYPES[self.return_type]
+        function_name = repr(function.name)
+
+        self.names = []
+        self.helpers = []
+        parameters = {}
+        arguments = ["_position"]
+        for parameter_type, identifier in function.argument_list:
+            value_type = LITERAL_TYPES.get(parameter_type, parameter_type)
+            binding = Binding(
+                self._name("_v", identifier), parameter_type, value_type
+            )
+            parameters[identifier] = binding
+            arguments.append(binding.name)
+
+        lookup = []
+        self.cache = None
+        if function.name in self.caches:
+            self.cache = self._constant(self.caches[function.name])
+            key = "".join(f"{argument}, " for argument in arguments[1:])
+            lookup = [
+                f"_key = _arguments_key(({key}))",
+                f"_value = {self.cache}.get(_key)",
+                "if _value is not _MISSING:",
+                "    _returned = _value",
+                "    return _value",
+            ]
+
+        self.scopes = [parameters]
+        body = self._statements(function.block)
+        self.scopes = []
+        return [
+            f"def {name}({', '.join(arguments)}):",
+            "    global _depth, _returned",
+            *self._indent(lookup),
+            *self._indent(self._helpers(arguments)),
+            "    _depth += 1",
+            "    if _depth > _max_rec_depth:",
+            "        raise MaximumRecursionDepthError("
+            f"_position, _max_rec_depth, {function_name})",
+            "    _returned = None",
+            *self._indent(body),
+            "    _value = _returned",
+            *self._indent(self._return(None)),
+            "",
+        ]
+
+    def _return(self, value_type: Optional[type]) -> list[str]:
+        """Returns lines checking type of _value and returning it"""
+        lines = []
+        if self.return_type is not None and value_type != self.return_type:
+            return_type = self._type(self.return_type)
+            lines = [
+                "if _value is None:",
+                f"    raise MissingReturnTypeError(_position, {return_type})",
+                f"elif type(_value) is not {return_type}:",
+                "    raise InvalidReturnTypeError("
+                f"_position, type(_value), {return_type})",
+            ]
+        if self.cache is not None:
+            lines.append(f"{self.cache}.put(_key, _value)")
+        return lines + ["_depth -= 1", "_returned = _value", "return _value"]
+
+    def _error(self, error: str, position: Position, *arguments: str) -> str:
+        """Returns expression raising error with given arguments"""
+        arguments = ", ".join([self._constant(position), *arguments])
+        return f"_raise({error}({arguments}))"
+
+    def _condition(self, condition: Expression) -> str:
+        """Translates condition, which is true for every variable"""
+        if not isinstance(condition, IdentifierExpression):
+            return self.visit(condition)[0]
+        if self._find(condition.identifier) is None:
+            return self.visit(condition)[0]
+        return "True"
+
+    def _invariants(
+        self, loop: Union[WhileStatement, IterateStatement]
+    ) -> list[str]:
+        """Names values of invariants of loop, returns lines clearing them
+        on entry of loop"""
+        lines = []
+        for invariant in loop.invariants:
+            name = self._name("_i", "")
+            self.invariants[invariant] = name
+            lines.append(f"{name} = None")
+        return lines
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> list[str]:
+        if if_statement.condition is None:
+            return [
+                self._error("MissingIfConditionError", if_statement.position)
+            ]
+        lines = [
+            f"if {self._condition(if_statement.condition)}:",
+            *self._body(if_statement.block),
+        ]
+        if if_statement.else_block:
+            lines += ["else:", *self._body(if_statement.else_block)]
+        return lines
+
+    def _visit_WhileStatement(
+        self, while_statement: WhileStatement
+    ) -> list[str]:
+        if while_statement.condition is None:
+            return [
+                self._error(
+                    "MissingWhileConditionError", while_statement.position
+                )
+            ]
+        lines = [
+            *self._invariants(while_statement),
+            f"while {self._condition(while_statement.condition)}:",
+        ]
+        self.resumptions.append(
+            Resumption(while_statement, 0, len(self.scopes), "")
+        )
+        self.loops += 1
+        lines += self._body(while_statement.block)
+        self.loops -= 1
+        self.resumptions.pop()
+        return lines
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> list[str]:
+        position = iterate_statement.position
+        if iterate_statement.expression is None:
+            return [self._error("MissingForConditionError", position)]
+        if iterate_statement.type != Shape:
+            return [
+                self._error(
+                    "InvalidIterableTypeError",
+                    position,
+                    self._type(iterate_statement.type),
+                    "Shape",
+                )
+            ]
+
+        code, value_type = self.visit(iterate_statement.expression)
+        iterable = self._name("_t", "")
+        lines = [f"{iterable} = {code}"]
+        if value_type is not Canvas:
+            lines.append(
+                f"if type({iterable}) is not Canvas: "
+                + self._error(
+                    "InvalidIterableTypeError",
+                    position,
+                    f"type({iterable})",
+                    "Canvas",
+                )
+            )
+        identifier = iterate_statement.identifier
+        binding = Binding(
+            self._name("_v", identifier), iterate_statement.type, None
+        )
+        self.scopes.append({identifier: binding})
+        header = f"for {binding.name} in {iterable}:"
+        lines += [
+            f"{iterable} = iter({iterable}.shapes)",
+            *self._invariants(iterate_statement),
+            header,
+        ]
+        self.resumptions.append(
+            Resumption(iterate_statement, 0, len(self.scopes), header)
+        )
+        self.loops += 1
+        lines += self._body(iterate_statement.block)
+        self.loops -= 1
+        self.resumptions.pop()
+        self.scopes.pop()
+        return lines
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> list[str]:
+        if return_statement.expression is None:
+            return [
+                self._error(
+                    "MissingReturnValueError", return_statement.position
+                )
+            ]
+        code, value_type = self.visit(return_statement.expression)
+        resumption = self._resume()
+        if resumption:
+            value_type = None
+        return [f"_value = {code}", *resumption, *self._return(value_type)]
+
+    def _resume(self) -> list[str]:
+        """Translates execution going on after return statement until end
+        of function, only return statements following it in its blocks
+        are run, loops containing it keep iterating over return statements
+        of their bodies and calls evaluate to None"""
+        scopes = self.scopes
+        self.returned = True
+        lines = []
+        for node, index, depth, header in reversed(self.resumptions):
+            self.scopes = scopes[:depth]
+            if isinstance(node, Block):
+                lines += self._returns(node.statements[index:])
+                continue
+            if not header:
+                header = f"while {self._condition(node.condition)}:"
+            body = self._returns(node.block.statements)
+            lines += [header, *(self._indent(body) or ["    pass"])]
+        self.scopes = scopes
+        self.returned = False
+        return lines
+
+    def _returns(self, statements: list[Node]) -> list[str]:
+        """Translates return statements among statements into lines
+        setting _value"""
+        lines = []
+        for statement in statements:
+            if not isinstance(statement, ReturnStatement):
+                continue
+            if statement.expression is None:
+                lines.append(
+                    self._error("MissingReturnValueError", statement.position)
+                )
+            else:
+                lines.append(f"_value = {self.visit(statement.expression)[0]}")
+        return lines
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> list[str]:
+        position = declaration_statement.position
+        identifier = declaration_statement.identifier
+        if declaration_statement.expression is None:
+            return [self._error("MissingDeclarationValueError", position)]
+
+        code, value_type = self.visit(declaration_statement.expression)
+        declaration_type = declaration_statement.type
+        if declaration_type in LITERAL_TYPES:
+            declaration_type = LITERAL_TYPES[declaration_type]
+        binding = Binding(
+            self._name("_v", identifier), declaration_type, declaration_type
+        )
+
+        lines = [f"{binding.name} = {code}"]
+        if value_type != declaration_type:
+            lines.append(
+                f"if type({binding.name}) is not "
+                f"{self._type(declaration_type)}: _check_declaration("
+                f"{self._constant(position)}, {binding.name}, "
+                f"{self._type(declaration_type)})"
+            )
+        if self._find(identifier) is not None:
+            lines.append(
+                self._error("RedeclarationError", position, repr(identifier))
+            )
+        self.scopes[-1][identifier] = binding
+        return lines
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> list[str]:
+        position = assignment_statement.position
+        if assignment_statement.expression is None:
+            return [self._error("MissingAssignmentValueError", position)]
+
+        code, value_type = self.visit(assignment_statement.expression)
+        target = assignment_statement.identifier
+        if not isinstance(target, IdentifierExpression):
+            return [f"_value = {code}", f"{self._constant(target)}.identifier"]
+        binding = self._find(target.identifier)
+        if binding is None:
+            return [
+                f"_value = {code}",
+                self._error(
+                    "MissingVariableDeclarationError",
+                    position,
+                    repr(target.identifier),
+                ),
+            ]
+
+        lines = [f"{binding.name} = {code}"]
+        if value_type != binding.type:
+            lines.append(
+                f"if type({binding.name}) is not {self._type(binding.type)}: "
+                + self._error(
+                    "InvalidAssignmentTypeError",
+                    position,
+                    f"type({binding.name})",
+                    self._type(binding.type),
+                )
+            )
+        return lines
+
+    def _visit_CallExpression(
+        self, call_expression: CallExpression
+    ) -> tuple[str, Optional[type]]:
+        if self.returned:
+            return "None", None
+        if call_expression.root_expression is not None:
+            return self._variable_call(call_expression)
+        if call_expression.called_expression in self.functions:
+            return self._function_call(call_expression)
+        return self._method_call(call_expression)
+
+    def _function_call(
+        self, function_call: CallExpression
+    ) -> tuple[str, Optional[type]]:
+        """Translates call of function defined in program"""
+        name, function = self.functions[function_call.called_expression]
+        if len(function_call.arguments) != len(function.argument_list):
+            return (
+                self._error(
+                    "NumberOfArgumentError",
+                    function_call.position,
+                    repr(function.name),
+                    self._constant(function_call.arguments),
+                    self._constant(function.argument_list),
+                ),
+                None,
+            )
+
+        position = self._constant(function_call.position)
+        arguments = [position]
+        for argument, (parameter_type, _) in zip(
+            function_call.arguments, function.argument_list
+        ):
+            code, value_type = self.visit(argument)
+            parameter_value_type = LITERAL_TYPES.get(
+                parameter_type, parameter_type
+            )
+            if value_type != parameter_value_type:
+                code = (
+                    f"_argument({position}, {code}, "
+                    f"{self._type(parameter_value_type)}, "
+                    f"{self._type(parameter_type)}, {function.name!r})"
+                )
+            arguments.append(code)
+        return_type = function.declaration_type
+        if return_type in LITERAL_TYPES:
+            return_type = LITERAL_TYPES[return_type]
+        return f"{name}({', '.join(arguments)})", return_type
+
+    def _method_call(
+        self, method_call: CallExpression
+    ) -> tuple[str, Optional[type]]:
+        """Translates call of print, object constructor or method name"""
+        name = method_call.called_expression
+        arguments = [
+            self.visit(argument)[0] for argument in method_call.arguments
+        ]
+        if name == "print":
+            output = " + ".join(f"str({argument})" for argument in arguments)
+            return f"print({output or repr('')})", None
+
+        if name in OBJECT_TYPES:
+            object_type = OBJECT_TYPES[name]
+            arguments = [self._constant(method_call.position), name] + (
+                arguments
+            )
+            if len(arguments) - 2 != len(OBJECT_PARAMETERS[object_type]):
+                return f"_create_invalid({', '.join(arguments)})", None
+            return f"_create({', '.join(arguments)})", object_type
+
+        return self._constant((name, method_call.arguments)), tuple
+
+    def _variable_call(
+        self, variable_call: CallExpression
+    ) -> tuple[str, Optional[type]]:
+        """Translates call of method on value of root expression"""
+        position = self._constant(variable_call.position)
+        receiver = self.visit(variable_call.root_expression)[0]
+        called_expression = variable_call.called_expression
+        if (
+            isinstance(called_expression, CallExpression)
+            and called_expression.root_expression is None
+            and called_expression.called_expression != "print"
+            and called_expression.called_expression not in OBJECT_TYPES
+            and called_expression.called_expression not in self.functions
+        ):
+            method = (
+                f"_method({position}, {receiver}, "
+                f"{called_expression.called_expression!r})"
+            )
+            arguments = [position, method] + [
+                self.visit(argument)[0]
+                for argument in called_expression.arguments
+            ]
+            return f"_invoke({', '.join(arguments)})", None
+
+        called = self.visit(called_expression)[0]
+        return f"_dynamic_method({position}, {receiver}, {called})", None
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> tuple[str, Optional[type]]:
+        binding = self._find(identifier_expression.identifier)
+        if binding is None:
+            return (
+                self._error(
+                    "MissingVariableDeclarationError",
+                    identifier_expression.position,
+                    repr(identifier_expression.identifier),
+                ),
+                None,
+            )
+        return binding.name, binding.value_type
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> tuple[str, Optional[type]]:
+        if self.returned:
+            return self.visit(invariant_expression.expression)
+        name = self.invariants[invariant_expression]
+        code, value_type = self.visit(invariant_expression.expression)
+        return (
+            f"({name} if {name} is not None else ({name} := {code}))",
+            value_type,
+        )
+
+    def _visit_CastExpression(
+        self, cast_expression: CastExpression
+    ) -> tuple[str, Optional[type]]:
+        code, value_type = self.visit(cast_expression.expression)
+        cast_type = cast_expression.cast_type
+        if cast_type == Int:
+            if value_type in [float, bool]:
+                return f"int({code})", int
+            return f"_accept_int({code})", int
+        elif cast_type == Dec:
+            if value_type in [int, bool]:
+                return f"float({code})", float
+            return f"_accept_dec({code})", float
+        return f"_cast({self._constant(cast_type)}, {code})", None
+
+    def _visit_IntegerExpression(
+        self, integer_expression: IntegerExpression
+    ) -> tuple[str, Optional[type]]:
+        return repr(int(integer_expression.value)), int
+
+    def _visit_DecimalExpression(
+        self, decimal_expression: DecimalExpression
+    ) -> tuple[str, Optional[type]]:
+        value = float(decimal_expression.value)
+        if math.isfinite(value):
+            return repr(value), float
+        return self._constant(value), float
+
+    def _visit_BooleanExpression(
+        self, boolean_expression: BooleanExpression
+    ) -> tuple[str, Optional[type]]:
+        return repr(bool(boolean_expression.value)), bool
+
+    def _visit_StringExpression(
+        self, string_expression: StringExpression
+    ) -> tuple[str, Optional[type]]:
+        return repr(str(string_expression.value)), str
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> tuple[str, Optional[type]]:
+        position = self._constant(logical_expression.position)
+        left, left_type = self.visit(logical_expression.left)
+        right, right_type = self.visit(logical_expression.right)
+        operator = logical_expression.operator
+
+        if self.short_circuit and operator in SHORT_CIRCUIT_OPERATORS:
+            if left_type != bool:
+                left = f"_check_left_operand({position}, {operator!r}, {left})"
+            if right_type != bool:
+                right = (
+                    f"_check_right_operand({position}, {operator!r}, {right})"
+                )
+            return f"({left} {operator} {right})", bool
+
+        value_type = binary_type(operator, left_type, right_type)
+        if left_type is None or left_type != right_type:
+            return f"_binary({position}, {operator!r}, {left}, {right})", None
+
+        if operator in [TokenType.OR.value, TokenType.AND.value]:
+            if isinstance(
+                logical_expression.right,
+                (IntegerExpression, DecimalExpression, BooleanExpression),
+            ) or (
+                isinstance(logical_expression.right, IdentifierExpression)
+                and self._find(logical_expression.right.identifier)
+            ):
+                return f"({left} {operator} {right})", value_type
+            return f"_{operator}({left}, {right})", value_type
+        elif operator == TokenType.DIVIDE.value:
+            if left_type in NUMERIC_TYPES and (
+                isinstance(
+                    logical_expression.right,
+                    (IntegerExpression, DecimalExpression),
+                )
+                and float(logical_expression.right.value)
+            ):
+                return f"({left} / {right})", value_type
+            return f"_divide({position}, {left}, {right})", value_type
+        return f"({left} {operator} {right})", value_type
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> tuple[str, Optional[type]]:
+        code, value_type = self.visit(negated_expression.expression)
+        operator = negated_expression.operator
+        if operator == "not" and value_type == bool:
+            return f"(not {code})", bool
+        elif operator == "-" and value_type in [int, float]:
+            return f"(-{code})", value_type
+        position = self._constant(negated_expression.position)
+        return f"_negate({position}, {operator!r}, {code})", None
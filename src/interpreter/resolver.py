@@ -0,0 +1,201 @@
+from parser.objects.block import Block
+from parser.objects.expression import (CallExpression, CastExpression,
+                                       IdentifierExpression,
+                                       InvariantExpression, LogicalExpression,
+                                       NegatedExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from typing import NamedTuple, Optional, Union
+
+from interpreter.visitor import Visitor
+
+
+class Slot(NamedTuple):
+    """Place of variable in frames of function call, depth of frame counted
+    from frame of parameters and index in it"""
+
+    depth: int
+    index: int
+
+
+class Resolver(Visitor):
+    """Resolves variables of program to slots of frames, which are created
+    for parameters of every function call, for every block declaring
+    variables and for every loop with invariants, whose values are kept in
+    frame of loop"""
+
+    slots: dict[Node, Slot]
+    invariant_slots: dict[InvariantExpression, Slot]
+    frame_sizes: dict[Node, int]
+    redeclarations: set[DeclarationStatement]
+    scopes: list[dict[str, int]]
+
+    def __init__(self) -> None:
+        self.slots = {}
+        self.invariant_slots = {}
+        self.frame_sizes = {}
+        self.redeclarations = set()
+        self.scopes = []
+
+    def resolve(self, program: Program) -> None:
+        self.visit(program)
+
+    def get_slot(self, node: Node) -> Optional[Slot]:
+        """Returns slot of variable used or declared by node, None if no
+        variable with its name is declared before it"""
+        return self.slots.get(node)
+
+    def get_invariant_slot(
+        self, invariant_expression: InvariantExpression
+    ) -> Slot:
+        """Returns slot holding value of invariant, which is None until it
+        is evaluated after entry of its loop"""
+        return self.invariant_slots[invariant_expression]
+
+    def _find(self, name: str) -> Optional[Slot]:
+        for depth in range(len(self.scopes) - 1, -1, -1):
+            if name in self.scopes[depth]:
+                return Slot(depth, self.scopes[depth][name])
+        return None
+
+    def _declare(self, node: Node, name: str) -> None:
+        scope = self.scopes[-1]
+        scope[name] = len(scope)
+        self.slots[node] = Slot(len(self.scopes) - 1, scope[name])
+
+    def _declare_invariants(
+        self, loop: Union[WhileStatement, IterateStatement]
+    ) -> None:
+        """Invariants get unnamed slots in frame of their loop"""
+        scope = self.scopes[-1]
+        for invariant in loop.invariants:
+            index = len(scope)
+            scope[f"#{index}"] = index
+            self.invariant_slots[invariant] = Slot(len(self.scopes) - 1, index)
+
+    def _visit_Program(self, program: Program) -> None:
+        for object in program.objects:
+            self.visit(object)
+
+    def _visit_Function(self, function: Function) -> None:
+        parameters = {}
+        for index, (_, name) in enumerate(function.argument_list):
+            parameters[name] = index
+        self.scopes = [parameters]
+        self.visit(function.block)
+        self.scopes = []
+
+    def _visit_Block(self, block: Block) -> None:
+        """Blocks without declarations get no frame, their statements use
+        frame of enclosing block"""
+        has_frame = any(
+            isinstance(statement, DeclarationStatement)
+            for statement in block.statements
+        )
+        if has_frame:
+            self.scopes.append({})
+        for statement in block.statements:
+            self.visit(statement)
+        if has_frame:
+            self.frame_sizes[block] = len(self.scopes.pop())
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> None:
+        if if_statement.condition is not None:
+            self.visit(if_statement.condition)
+        self.visit(if_statement.block)
+        if if_statement.else_block:
+            self.visit(if_statement.else_block)
+
+    def _visit_WhileStatement(self, while_statement: WhileStatement) -> None:
+        if while_statement.invariants:
+            self.scopes.append({})
+            self._declare_invariants(while_statement)
+        if while_statement.condition is not None:
+            self.visit(while_statement.condition)
+        self.visit(while_statement.block)
+        if while_statement.invariants:
+            self.frame_sizes[while_statement] = len(self.scopes.pop())
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> None:
+        if iterate_statement.expression is not None:
+            self.visit(iterate_statement.expression)
+        self.scopes.append({})
+        self._declare(iterate_statement, iterate_statement.identifier)
+        self._declare_invariants(iterate_statement)
+        self.visit(iterate_statement.block)
+        self.frame_sizes[iterate_statement] = len(self.scopes.pop())
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> None:
+        if return_statement.expression is not None:
+            self.visit(return_statement.expression)
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> None:
+        if declaration_statement.expression is None:
+            return
+        self.visit(declaration_statement.expression)
+        identifier = declaration_statement.identifier
+        if self._find(identifier) is not None:
+            self.redeclarations.add(declaration_statement)
+            return
+        self._declare(declaration_statement, identifier)
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> None:
+        if assignment_statement.expression is not None:
+            self.visit(assignment_statement.expression)
+        self.visit(assignment_statement.identifier)
+
+    def _visit_CallExpression(self, call_expression: CallExpression) -> None:
+        if call_expression.root_expression is not None:
+            self.visit(call_expression.root_expression)
+        if isinstance(call_expression.called_expression, Node):
+            self.visit(call_expression.called_expression)
+        for argument in call_expression.arguments or []:
+            self.visit(argument)
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> None:
+        slot = self._find(identifier_expression.identifier)
+        if slot is not None:
+            self.slots[identifier_expression] = slot
+
+    def _visit_CastExpression(self, cast_expression: CastExpression) -> None:
+        self.visit(cast_expression.expression)
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> None:
+        self.visit(logical_expression.left)
+        self.visit(logical_expression.right)
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> None:
+        self.visit(negated_expression.expression)
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> None:
+        self.visit(invariant_expression.expression)
+
+    def invalid_visit(self, node: Node) -> None:
+        """Literals and other nodes without variables are left unresolved"""
@@ -0,0 +1,193 @@
+import operator
+from parser.objects.type import Dec, Int, Type
+from typing import Any, Callable, NoReturn, Optional
+
+from error.error_interpreter import (DivisionByZeroError,
+                                     InvalidCallTypeError,
+                                     InvalidDeclarationTypeError,
+                                     InvalidUnaryOperatorError,
+                                     MismatchedCallTypeError,
+                                     MismatchedTypeError,
+                                     MissingFunctionDeclarationError,
+                                     NumberOfArgumentError)
+from lexer.token_manager import TokenType
+from utility.utility import ALL_TYPES, OBJECT_PARAMETERS, Position
+
+MISSING = object()
+
+OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    TokenType.OR.value: lambda left, right: left or right,
+    TokenType.AND.value: lambda left, right: left and right,
+    TokenType.EQUAL.value: operator.eq,
+    TokenType.NOT_EQUAL.value: operator.ne,
+    TokenType.GREATER.value: operator.gt,
+    TokenType.LESS.value: operator.lt,
+    TokenType.GREATER_EQUAL.value: operator.ge,
+    TokenType.LESS_EQUAL.value: operator.le,
+    TokenType.ADD.value: operator.add,
+    TokenType.SUBTRACT.value: operator.sub,
+    TokenType.MULTIPLY.value: operator.mul,
+}
+
+SHORT_CIRCUIT_OPERATORS: list[str] = [TokenType.OR.value, TokenType.AND.value]
+
+ARITHMETIC_TYPES: dict[type, type] = {int: int, float: float, bool: int}
+NUMERIC_TYPES: list[type] = [int, float, bool]
+
+
+def accept_int(value: float) -> int:
+    if type(value) not in [float, bool]:
+        raise InvalidCallTypeError(Position(0, 0), value)
+    return int(value)
+
+
+def accept_dec(value: int) -> float:
+    if type(value) not in [int, bool]:
+        raise InvalidCallTypeError(Position(0, 0), value)
+    return float(value)
+
+
+CAST_FUNCTIONS: dict[Type, Callable[[Any], Any]] = {
+    Int: accept_int,
+    Dec: accept_dec,
+}
+
+
+def binary_type(
+    operator: str, left_type: Optional[type], right_type: Optional[type]
+) -> Optional[type]:
+    """Returns type of binary expression result if it is known from types
+    of operands, otherwise None"""
+    if left_type is None or left_type != right_type:
+        return None
+    if operator in [TokenType.OR.value, TokenType.AND.value]:
+        return left_type
+    elif operator == TokenType.DIVIDE.value:
+        return float if left_type in NUMERIC_TYPES else None
+    elif operator not in [
+        TokenType.ADD.value,
+        TokenType.SUBTRACT.value,
+        TokenType.MULTIPLY.value,
+    ]:
+        return bool
+    elif left_type == str and operator == TokenType.ADD.value:
+        return str
+    return ARITHMETIC_TYPES.get(left_type)
+
+
+def check_argument(
+    position: Position, value: Any, parameter_type: Type, name: str
+) -> None:
+    if ALL_TYPES[type(value)] != ALL_TYPES[parameter_type]:
+        raise MismatchedCallTypeError(
+            position, type(value), parameter_type, name
+        )
+
+
+def argument(
+    position: Position,
+    value: Any,
+    value_type: type,
+    parameter_type: Type,
+    name: str,
+) -> Any:
+    """Returns value of argument after checking its type"""
+    if type(value) is not value_type:
+        check_argument(position, value, parameter_type, name)
+    return value
+
+
+def check_declaration(
+    position: Position, value: Any, declaration_type: type
+) -> None:
+    if value is None:
+        raise InvalidDeclarationTypeError(position, None, declaration_type)
+    elif type(value) == tuple:
+        raise MissingFunctionDeclarationError(position, value[0])
+    elif declaration_type != type(value):
+        raise InvalidDeclarationTypeError(
+            position, type(value), declaration_type
+        )
+
+
+def binary(position: Position, operator: str, left: Any, right: Any) -> Any:
+    if type(left) != type(right):
+        raise MismatchedTypeError(
+            position, type(left), type(right), operator
+        )
+    if operator == TokenType.DIVIDE.value:
+        return divide(position, left, right)
+    return OPERATORS[operator](left, right)
+
+
+def check_left_operand(position: Position, operator: str, value: Any) -> bool:
+    """Checks that left operand of short-circuit operator is bool"""
+    if type(value) != bool:
+        raise MismatchedTypeError(position, type(value), bool, operator)
+    return value
+
+
+def check_right_operand(
+    position: Position, operator: str, value: Any
+) -> bool:
+    """Checks that right operand of short-circuit operator is bool"""
+    if type(value) != bool:
+        raise MismatchedTypeError(position, bool, type(value), operator)
+    return value
+
+
+def divide(position: Position, left: Any, right: Any) -> Any:
+    if right == 0:
+        raise DivisionByZeroError(position)
+    return left / right
+
+
+def negate(position: Position, operator: str, value: Any) -> Any:
+    if operator == "not":
+        if type(value) == bool:
+            return not value
+    elif operator == "-":
+        if type(value) in [int, float]:
+            return -value
+    raise InvalidUnaryOperatorError(position, operator)
+
+
+def cast(cast_type: Type, value: Any) -> Any:
+    return CAST_FUNCTIONS[cast_type](value)
+
+
+def create(position: Position, object_type: type, *arguments: Any) -> Any:
+    try:
+        return object_type(*arguments)
+    except Exception as e:
+        raise InvalidCallTypeError(position, e)
+
+
+def create_invalid(
+    position: Position, object_type: type, *arguments: Any
+) -> NoReturn:
+    raise NumberOfArgumentError(
+        position,
+        object_type.__name__,
+        list(arguments),
+        OBJECT_PARAMETERS[object_type],
+    )
+
+
+def method(position: Position, receiver: Any, name: str) -> Any:
+    function = getattr(receiver, name, MISSING)
+    if function is MISSING:
+        raise MissingFunctionDeclarationError(position, name)
+    return function
+
+
+def invoke(position: Position, function: Any, *arguments: Any) -> Any:
+    try:
+        return function(*arguments)
+    except Exception as e:
+        raise InvalidCallTypeError(position, e)
+
+
+def dynamic_method(position: Position, receiver: Any, called: Any) -> Any:
+    name, arguments = called
+    return invoke(position, method(position, receiver, name), *arguments)
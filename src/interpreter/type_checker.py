@@ -0,0 +1,380 @@
+from parser.objects.expression import (CallExpression, IdentifierExpression,
+                                       LogicalExpression, NegatedExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from parser.objects.type import Canvas, Shape
+from typing import Optional
+
+from error.error_interpreter import (InvalidAssignmentTypeError,
+                                     InvalidDeclarationTypeError,
+                                     InvalidIterableTypeError,
+                                     InvalidReturnTypeError,
+                                     InvalidUnaryOperatorError,
+                                     MismatchedCallTypeError,
+                                     MismatchedTypeError,
+                                     MissingAssignmentValueError,
+                                     MissingDeclarationValueError,
+                                     MissingForConditionError,
+                                     MissingFunctionDeclarationError,
+                                     MissingIfConditionError,
+                                     MissingMainFunctionError,
+                                     MissingReturnValueError,
+                                     MissingVariableDeclarationError,
+                                     MissingWhileConditionError,
+                                     NumberOfArgumentError, RedeclarationError)
+from error.error_manager import ErrorManager
+from interpreter.resolver import Resolver, Slot
+from interpreter.runtime import SHORT_CIRCUIT_OPERATORS, binary_type
+from interpreter.type_inference import TypeInferrer
+from utility.utility import (ALL_TYPES, LITERAL_TYPES, OBJECT_PARAMETERS,
+                             OBJECT_TYPES, Position)
+
+
+class TypeChecker(TypeInferrer):
+    """Reports errors of program, which are certain to be raised when
+    erroneous statement is executed, to error manager without executing it.
+    Calls are typed with return types of called functions, which their
+    values have in declarations, assignments and arguments"""
+
+    error_manager: ErrorManager
+    short_circuit: bool
+    functions: dict[str, Function]
+    variable_types: dict[Slot, Optional[type]]
+    return_type: Optional[type]
+    verified: set[Node]
+
+    def __init__(
+        self,
+        resolver: Resolver,
+        error_manager: ErrorManager,
+        short_circuit: bool = False,
+    ) -> None:
+        super().__init__(resolver)
+        self.error_manager = error_manager
+        self.short_circuit = short_circuit
+        self.functions = {}
+        self.variable_types = {}
+        self.return_type = None
+        self.verified = set()
+
+    def check(self, program: Program) -> bool:
+        """Checks program, returns True if no error was found. Declarations,
+        assignments and calls which types are proven correct are stored in
+        verified set"""
+        error_count = len(self.error_manager.errors)
+        self.infer(program)
+        return len(self.error_manager.errors) == error_count
+
+    def _visit_Program(self, program: Program) -> None:
+        self.functions = {
+            object.name: object
+            for object in program.objects
+            if isinstance(object, Function)
+        }
+        for object in program.objects:
+            self.visit(object)
+        if "main" not in self.functions:
+            self.error_manager.add_error(
+                MissingMainFunctionError(Position(0, 0))
+            )
+
+    def _visit_Function(self, function: Function) -> None:
+        return_type = function.declaration_type
+        self.return_type = LITERAL_TYPES.get(return_type, return_type)
+        self.variable_types = {
+            Slot(0, index): parameter_type
+            for index, (parameter_type, _) in enumerate(
+                function.argument_list
+            )
+        }
+        super()._visit_Function(function)
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> None:
+        if if_statement.condition is None:
+            self.error_manager.add_error(
+                MissingIfConditionError(if_statement.position)
+            )
+        super()._visit_IfStatement(if_statement)
+
+    def _visit_WhileStatement(self, while_statement: WhileStatement) -> None:
+        if while_statement.condition is None:
+            self.error_manager.add_error(
+                MissingWhileConditionError(while_statement.position)
+            )
+        super()._visit_WhileStatement(while_statement)
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> None:
+        position = iterate_statement.position
+        if iterate_statement.expression is None:
+            self.error_manager.add_error(MissingForConditionError(position))
+        else:
+            iterable_type = self._expression(iterate_statement.expression)
+            if iterate_statement.type != Shape:
+                self.error_manager.add_error(
+                    InvalidIterableTypeError(
+                        position, iterate_statement.type, Shape
+                    )
+                )
+            elif iterable_type is not None and iterable_type != Canvas:
+                self.error_manager.add_error(
+                    InvalidIterableTypeError(position, iterable_type, Canvas)
+                )
+        slot = self.resolver.get_slot(iterate_statement)
+        self.slot_types[slot] = None
+        self.variable_types[slot] = iterate_statement.type
+        self.visit(iterate_statement.block)
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> None:
+        if return_statement.expression is None:
+            self.error_manager.add_error(
+                MissingReturnValueError(return_statement.position)
+            )
+            return
+        value_type = self._expression(return_statement.expression)
+        if (
+            self.return_type is not None
+            and value_type is not None
+            and value_type != self.return_type
+        ):
+            self.error_manager.add_error(
+                InvalidReturnTypeError(
+                    return_statement.position, value_type, self.return_type
+                )
+            )
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> None:
+        position = declaration_statement.position
+        if declaration_statement.expression is None:
+            self.error_manager.add_error(
+                MissingDeclarationValueError(position)
+            )
+            return
+        expression = declaration_statement.expression
+        value_type = self._expression(expression)
+        declaration_type = declaration_statement.type
+        declaration_type = LITERAL_TYPES.get(
+            declaration_type, declaration_type
+        )
+        name = self._method_name(expression)
+        if name == "print":
+            self.error_manager.add_error(
+                InvalidDeclarationTypeError(position, None, declaration_type)
+            )
+        elif name is not None and name not in OBJECT_TYPES:
+            self.error_manager.add_error(
+                MissingFunctionDeclarationError(position, name)
+            )
+        elif value_type is not None and value_type != declaration_type:
+            self.error_manager.add_error(
+                InvalidDeclarationTypeError(
+                    position, value_type, declaration_type
+                )
+            )
+        elif value_type is not None:
+            self.verified.add(declaration_statement)
+
+        if declaration_statement in self.resolver.redeclarations:
+            self.error_manager.add_error(
+                RedeclarationError(
+                    position, declaration_statement.identifier
+                )
+            )
+            return
+        slot = self.resolver.get_slot(declaration_statement)
+        self.slot_types[slot] = declaration_type
+        self.variable_types[slot] = declaration_type
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> None:
+        position = assignment_statement.position
+        if assignment_statement.expression is None:
+            self.error_manager.add_error(
+                MissingAssignmentValueError(position)
+            )
+            return
+        value_type = self._expression(assignment_statement.expression)
+        slot = self.resolver.get_slot(assignment_statement.identifier)
+        if slot is None:
+            self.error_manager.add_error(
+                MissingVariableDeclarationError(
+                    position, assignment_statement.identifier.identifier
+                )
+            )
+            return
+        variable_type = self.variable_types.get(slot)
+        if value_type is None or variable_type is None:
+            return
+        if value_type != variable_type:
+            self.error_manager.add_error(
+                InvalidAssignmentTypeError(
+                    position, value_type, variable_type
+                )
+            )
+        else:
+            self.verified.add(assignment_statement)
+
+    def _method_name(self, expression: Node) -> Optional[str]:
+        """Returns name called by expression if it does not call function
+        of program, None otherwise"""
+        if (
+            isinstance(expression, CallExpression)
+            and expression.root_expression is None
+            and expression.called_expression not in self.functions
+        ):
+            return expression.called_expression
+        return None
+
+    def _visit_CallExpression(
+        self, call_expression: CallExpression
+    ) -> Optional[type]:
+        if call_expression.root_expression is not None:
+            return self._check_method_call(call_expression)
+        argument_types = [
+            self._expression(argument)
+            for argument in call_expression.arguments
+        ]
+        name = call_expression.called_expression
+        if name in self.functions:
+            return self._check_function_call(call_expression, argument_types)
+        elif name in OBJECT_TYPES:
+            object_type = OBJECT_TYPES[name]
+            parameters = OBJECT_PARAMETERS[object_type]
+            if len(argument_types) != len(parameters):
+                self.error_manager.add_error(
+                    NumberOfArgumentError(
+                        call_expression.position,
+                        object_type.__name__,
+                        argument_types,
+                        parameters,
+                    )
+                )
+            return object_type
+        return None
+
+    def _check_function_call(
+        self,
+        call_expression: CallExpression,
+        argument_types: list[Optional[type]],
+    ) -> Optional[type]:
+        function = self.functions[call_expression.called_expression]
+        position = call_expression.position
+        if len(argument_types) != len(function.argument_list):
+            self.error_manager.add_error(
+                NumberOfArgumentError(
+                    position,
+                    function.name,
+                    call_expression.arguments,
+                    function.argument_list,
+                )
+            )
+        else:
+            verified = True
+            for argument_type, (parameter_type, _) in zip(
+                argument_types, function.argument_list
+            ):
+                if argument_type is None:
+                    verified = False
+                elif ALL_TYPES[argument_type] != ALL_TYPES[parameter_type]:
+                    verified = False
+                    self.error_manager.add_error(
+                        MismatchedCallTypeError(
+                            position,
+                            argument_type,
+                            parameter_type,
+                            function.name,
+                        )
+                    )
+            if verified:
+                self.verified.add(call_expression)
+        return_type = function.declaration_type
+        return LITERAL_TYPES.get(return_type, return_type)
+
+    def _check_method_call(
+        self, call_expression: CallExpression
+    ) -> Optional[type]:
+        """Checks that method called on value of known type exists"""
+        root_type = self._expression(call_expression.root_expression)
+        called_expression = call_expression.called_expression
+        self._expression(called_expression)
+        name = self._method_name(called_expression)
+        if (
+            root_type is not None
+            and name is not None
+            and name != "print"
+            and name not in OBJECT_TYPES
+            and not hasattr(root_type, name)
+        ):
+            self.error_manager.add_error(
+                MissingFunctionDeclarationError(call_expression.position, name)
+            )
+        return None
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> Optional[type]:
+        if self.resolver.get_slot(identifier_expression) is None:
+            self.error_manager.add_error(
+                MissingVariableDeclarationError(
+                    identifier_expression.position,
+                    identifier_expression.identifier,
+                )
+            )
+            return None
+        return super()._visit_IdentifierExpression(identifier_expression)
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> Optional[type]:
+        position = logical_expression.position
+        operator = logical_expression.operator
+        left_type = self._expression(logical_expression.left)
+        right_type = self._expression(logical_expression.right)
+        if self.short_circuit and operator in SHORT_CIRCUIT_OPERATORS:
+            if left_type is not None and left_type != bool:
+                self.error_manager.add_error(
+                    MismatchedTypeError(position, left_type, bool, operator)
+                )
+            return bool
+        if (
+            left_type is not None
+            and right_type is not None
+            and left_type != right_type
+        ):
+            self.error_manager.add_error(
+                MismatchedTypeError(position, left_type, right_type, operator)
+            )
+        return binary_type(operator, left_type, right_type)
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> Optional[type]:
+        value_type = self._expression(negated_expression.expression)
+        operator = negated_expression.operator
+        if value_type is None:
+            return None
+        elif operator == "not" and value_type == bool:
+            return bool
+        elif operator == "-" and value_type in [int, float]:
+            return value_type
+        self.error_manager.add_error(
+            InvalidUnaryOperatorError(negated_expression.position, operator)
+        )
+        return None
@@ -0,0 +1,187 @@
+from parser.objects.block import Block
+from parser.objects.expression import (BooleanExpression, CallExpression,
+                                       CastExpression, DecimalExpression,
+                                       Expression, IdentifierExpression,
+                                       IntegerExpression, InvariantExpression,
+                                       LogicalExpression, NegatedExpression,
+                                       StringExpression)
+from parser.objects.function import Function
+from parser.objects.node import Node
+from parser.objects.program import Program
+from parser.objects.statement import (AssignmentStatement,
+                                      DeclarationStatement, IfStatement,
+                                      IterateStatement, ReturnStatement,
+                                      WhileStatement)
+from typing import Optional
+
+from interpreter.resolver import Resolver, Slot
+from interpreter.runtime import binary_type
+from interpreter.visitor import Visitor
+from utility.utility import LITERAL_TYPES
+
+
+class TypeInferrer(Visitor):
+    """Infers types of expressions from declarations of variables, type of
+    expression is known if its value has it whenever evaluation succeeds"""
+
+    resolver: Resolver
+    types: dict[Expression, Optional[type]]
+    slot_types: dict[Slot, Optional[type]]
+
+    def __init__(self, resolver: Resolver) -> None:
+        self.resolver = resolver
+        self.types = {}
+        self.slot_types = {}
+
+    def infer(self, program: Program) -> None:
+        """Infers types of expressions of program resolved by resolver"""
+        self.visit(program)
+
+    def get_type(self, expression: Expression) -> Optional[type]:
+        """Returns type of expression, None if it is not known"""
+        return self.types.get(expression)
+
+    def _expression(self, expression: Expression) -> Optional[type]:
+        expression_type = self.visit(expression)
+        self.types[expression] = expression_type
+        return expression_type
+
+    def invalid_visit(self, node: Node) -> None:
+        return None
+
+    def _visit_Program(self, program: Program) -> None:
+        for object in program.objects:
+            self.visit(object)
+
+    def _visit_Function(self, function: Function) -> None:
+        self.slot_types = {
+            Slot(0, index): LITERAL_TYPES.get(parameter_type, parameter_type)
+            for index, (parameter_type, _) in enumerate(
+                function.argument_list
+            )
+        }
+        self.visit(function.block)
+
+    def _visit_Block(self, block: Block) -> None:
+        for statement in block.statements:
+            self.visit(statement)
+
+    def _visit_IfStatement(self, if_statement: IfStatement) -> None:
+        if if_statement.condition is not None:
+            self._expression(if_statement.condition)
+        self.visit(if_statement.block)
+        if if_statement.else_block:
+            self.visit(if_statement.else_block)
+
+    def _visit_WhileStatement(self, while_statement: WhileStatement) -> None:
+        if while_statement.condition is not None:
+            self._expression(while_statement.condition)
+        self.visit(while_statement.block)
+
+    def _visit_IterateStatement(
+        self, iterate_statement: IterateStatement
+    ) -> None:
+        if iterate_statement.expression is not None:
+            self._expression(iterate_statement.expression)
+        self.slot_types[self.resolver.get_slot(iterate_statement)] = None
+        self.visit(iterate_statement.block)
+
+    def _visit_ReturnStatement(
+        self, return_statement: ReturnStatement
+    ) -> None:
+        if return_statement.expression is not None:
+            self._expression(return_statement.expression)
+
+    def _visit_DeclarationStatement(
+        self, declaration_statement: DeclarationStatement
+    ) -> None:
+        if declaration_statement.expression is None:
+            return
+        self._expression(declaration_statement.expression)
+        slot = self.resolver.get_slot(declaration_statement)
+        if slot is not None:
+            declaration_type = declaration_statement.type
+            self.slot_types[slot] = LITERAL_TYPES.get(
+                declaration_type, declaration_type
+            )
+
+    def _visit_AssignmentStatement(
+        self, assignment_statement: AssignmentStatement
+    ) -> None:
+        if assignment_statement.expression is not None:
+            self._expression(assignment_statement.expression)
+
+    def _visit_CallExpression(
+        self, call_expression: CallExpression
+    ) -> Optional[type]:
+        """Calls evaluate to None after return statement, so their type is
+        never known"""
+        if call_expression.root_expression is not None:
+            self._expression(call_expression.root_expression)
+        if isinstance(call_expression.called_expression, Expression):
+            self._expression(call_expression.called_expression)
+        for argument in call_expression.arguments or []:
+            self._expression(argument)
+        return None
+
+    def _visit_IdentifierExpression(
+        self, identifier_expression: IdentifierExpression
+    ) -> Optional[type]:
+        slot = self.resolver.get_slot(identifier_expression)
+        return self.slot_types.get(slot)
+
+    def _visit_CastExpression(
+        self, cast_expression: CastExpression
+    ) -> Optional[type]:
+        self._expression(cast_expression.expression)
+        return LITERAL_TYPES.get(cast_expression.cast_type)
+
+    def _visit_IntegerExpression(
+        self, integer_expression: IntegerExpression
+    ) -> Optional[type]:
+        return int
+
+    def _visit_DecimalExpression(
+        self, decimal_expression: DecimalExpression
+    ) -> Optional[type]:
+        return float
+
+    def _visit_BooleanExpression(
+        self, boolean_expression: BooleanExpression
+    ) -> Optional[type]:
+        return bool
+
+    def _visit_StringExpression(
+        self, string_expression: StringExpression
+    ) -> Optional[type]:
+        return str
+
+    def _visit_LogicalExpression(
+        self, logical_expression: LogicalExpression
+    ) -> Optional[type]:
+        return binary_type(
+            logical_expression.operator,
+            self._expression(logical_expression.left),
+            self._expression(logical_expression.right),
+        )
+
+    _visit_OrExpression = _visit_LogicalExpression
+    _visit_AndExpression = _visit_LogicalExpression
+    _visit_RelativeExpression = _visit_LogicalExpression
+    _visit_SumExpression = _visit_LogicalExpression
+    _visit_MulExpression = _visit_LogicalExpression
+
+    def _visit_NegatedExpression(
+        self, negated_expression: NegatedExpression
+    ) -> Optional[type]:
+        expression_type = self._expression(negated_expression.expression)
+        if negated_expression.operator == "not":
+            return bool if expression_type == bool else None
+        elif negated_expression.operator == "-":
+            return expression_type if expression_type in [int, float] else None
+        return None
+
+    def _visit_InvariantExpression(
+        self, invariant_expression: InvariantExpression
+    ) -> Optional[type]:
+        return self._expression(invariant_expression.expression)
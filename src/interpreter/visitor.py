@@ -1,13 +1,31 @@
 from __future__ import annotations
 
 from parser.objects.node import Node
+from typing import Any, Callable
 
 
 class Visitor:
+    dispatch_table: dict[type[Node], Callable[[Visitor, Node], Any]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.dispatch_table = {}
+
     def visit(self, node: Node) -> Visitor:
-        method = "_visit_" + node.__class__.__name__
-        visitor = getattr(self, method, self.invalid_visit)
-        return visitor(node)
+        visitor = self.dispatch_table.get(node.__class__)
+        if visitor is None:
+            visitor = self._resolve_visit(node.__class__)
+        return visitor(self, node)
+
+    @classmethod
+    def _resolve_visit(
+        cls, node_class: type[Node]
+    ) -> Callable[[Visitor, Node], Any]:
+        """Finds visit method of node class and caches it in dispatch table"""
+        method = "_visit_" + node_class.__name__
+        visitor = getattr(cls, method, cls.invalid_visit)
+        cls.dispatch_table[node_class] = visitor
+        return visitor
 
     def invalid_visit(self, node: Node) -> Exception:
         raise Exception(f"No visit_{node.__class__.__name__} method defined")
@@ -1,3 +1,5 @@
+import re
+import sys
 from io import TextIOBase
 from typing import Union
 
@@ -10,22 +12,26 @@ from error.error_lexer import (CommentOverflowError, DecimalOverflowError,
                                UnterminatedStringError)
 from error.error_manager import ErrorManager
 from lexer.token_manager import Token, TokenType
-from utility.utility import (DOUBLE_TOKENS, EOF_CHARS, KEYWORDS,
-                             MAX_IDENTIFIER_LENGTH, MAX_INT, MAX_STRING_LENGTH,
-                             NL_TYPES, SINGLE_TOKENS, Position)
+from utility.utility import (COMMENT_RUNS, DOUBLE_TOKENS, EOF_CHARS,
+                             IDENTIFIER_RUN, KEYWORDS, MAX_IDENTIFIER_LENGTH,
+                             MAX_INT, MAX_STRING_LENGTH, NL_TYPES,
+                             SINGLE_TOKENS, STRING_RUN, WHITE_RUNS, Position)
 
 
 class Lexer:
     stream: TextIOBase
     error_manager: ErrorManager
     character: str
-    position: Position
-    token_position: Position
+    line: int
+    column: int
     token: Token
     new_line_char: str
     max_identifier_length: int
     max_string_length: int
     max_int: int
+    buffer_size: int
+    buffer: str
+    buffer_index: int
 
     def __init__(
         self,
@@ -34,24 +40,34 @@ class Lexer:
         max_identifier_length: int = MAX_IDENTIFIER_LENGTH,
         max_string_length: int = MAX_STRING_LENGTH,
         max_int: int = MAX_INT,
+        buffer_size: int = 0,
     ) -> None:
         self.stream = stream
         self.error_manager = error_manager
-        self.character = self.stream.read(1)
-        self.position = Position(1, 0)
-        self.token_position = Position(1, 0)
+        self.buffer_size = buffer_size
+        if self.buffer_size:
+            self._fill_buffer()
+        else:
+            self.character = self.stream.read(1)
+        self.line = 1
+        self.column = 0
         self.new_line_char = None
-        self.token = Token(TokenType.UNDEFINED, "", self.token_position)
+        self.token = Token(TokenType.UNDEFINED, "", self.line, self.column)
         self.max_identifier_length = max_identifier_length
         self.max_string_length = max_string_length
         self.max_int = max_int
 
+    @property
+    def position(self) -> Position:
+        """Returns current position of lexer"""
+        return Position(self.line, self.column)
+
     def _check_new_line(self) -> bool:
         """Checks if current character is new line symbol"""
         if self.new_line_char:
             if self.character == self.new_line_char:
-                self.position.line += 1
-                self.position.column = 0
+                self.line += 1
+                self.column = 0
                 self._next_char()
                 return True
             elif self.character.isspace() and self.character not in NL_TYPES:
@@ -78,8 +94,8 @@ class Lexer:
                 UnexpectedNewLineSymbolError, new_line_char, self.new_line_char
             )
             return True
-        self.position.line += 1
-        self.position.column = 0
+        self.line += 1
+        self.column = 0
         return True
 
     def _is_white(self) -> bool:
@@ -87,11 +103,26 @@ class Lexer:
         if self.character in EOF_CHARS or not self.character.isspace():
             return False
         while self.character not in EOF_CHARS and self.character.isspace():
+            if self.buffer_size and (
+                self.character not in NL_TYPES
+                or self.character == self.new_line_char
+            ):
+                self._read_white_run()
+                continue
             if self._check_new_line():
                 continue
             self._next_char()
         return True
 
+    def _read_white_run(self) -> None:
+        """Reads run of white spaces and known new line symbols from buffer"""
+        value = self._read_run(WHITE_RUNS[self.new_line_char])
+        if self.new_line_char and self.new_line_char in value:
+            self.line += value.count(self.new_line_char)
+            self.column = len(value) - value.rindex(
+                self.new_line_char
+            )
+
     def _raise_error(
         self,
         error: LexerError,
@@ -100,7 +131,7 @@ class Lexer:
     ) -> None:
         """Raises error and builds token"""
         self._next_char()
-        self.token = Token(TokenType.UNDEFINED, value, self.token_position)
+        self.token = Token(TokenType.UNDEFINED, value, self.line, self.column)
         self.error_manager.add_error(
             error(self.position, value, expected)
             if expected
@@ -111,7 +142,7 @@ class Lexer:
         """Tries to build EOF token"""
         if self.character:
             return False
-        self.token = Token(TokenType.EOF, "", self.token_position)
+        self.token = Token(TokenType.EOF, "", self.line, self.column)
         return True
 
     def _try_build_single_tokens(self) -> bool:
@@ -119,10 +150,9 @@ class Lexer:
         if self.character not in SINGLE_TOKENS:
             return False
 
-        self.token = Token(
-            SINGLE_TOKENS[self.character], self.character, self.token_position
-        )
+        value = self.character
         self._next_char()
+        self.token = Token(SINGLE_TOKENS[value], value, self.line, self.column)
         return True
 
     def _try_build_double_tokens(self) -> bool:
@@ -133,15 +163,17 @@ class Lexer:
         first_char = self.character
         self._next_char()
         if self.character == DOUBLE_TOKENS[first_char][0]:
+            value = first_char + self.character
+            self._next_char()
             self.token = Token(
-                DOUBLE_TOKENS[first_char][2],
-                first_char + self.character,
-                self.token_position,
+                DOUBLE_TOKENS[first_char][2], value, self.line, self.column
             )
-            self._next_char()
         else:
             self.token = Token(
-                DOUBLE_TOKENS[first_char][1], first_char, self.token_position
+                DOUBLE_TOKENS[first_char][1],
+                first_char,
+                self.line,
+                self.column,
             )
         return True
 
@@ -151,18 +183,27 @@ class Lexer:
             return False
 
         value = self.character
-        while self._next_char().isalnum() or self.character == "_":
-            if len(value) < self.max_identifier_length:
-                value += self.character
-            else:
+        if self.buffer_size:
+            self._next_char()
+            value += self._read_run(
+                IDENTIFIER_RUN, self.max_identifier_length - len(value)
+            )
+            if self.character.isalnum() or self.character == "_":
                 self._raise_error(TooLongIdentifierError, value)
                 return True
+        else:
+            while self._next_char().isalnum() or self.character == "_":
+                if len(value) < self.max_identifier_length:
+                    value += self.character
+                else:
+                    self._raise_error(TooLongIdentifierError, value)
+                    return True
 
         if value in KEYWORDS:
-            self.token = Token(KEYWORDS[value], value, self.token_position)
+            self.token = Token(KEYWORDS[value], value, self.line, self.column)
         else:
             self.token = Token(
-                TokenType.IDENTIFIER, value, self.token_position
+                TokenType.IDENTIFIER, sys.intern(value), self.line, self.column
             )
         return True
 
@@ -206,11 +247,14 @@ class Lexer:
             self.token = Token(
                 TokenType.DECIMAL_VALUE,
                 value + fraction / (10**number_of_digits),
-                self.token_position,
+                self.line,
+                self.column,
             )
             return True
 
-        self.token = Token(TokenType.INTEGER_VALUE, value, self.token_position)
+        self.token = Token(
+            TokenType.INTEGER_VALUE, value, self.line, self.column
+        )
         return True
 
     def _try_build_comment_token(self) -> bool:
@@ -220,13 +264,25 @@ class Lexer:
         value = ""
         number_of_chars = 0
         new_line = self.new_line_char if self.new_line_char else NL_TYPES
+        if self.buffer_size:
+            self._next_char()
+            value = self._read_run(
+                COMMENT_RUNS[self.new_line_char], self.max_string_length
+            )
+            if self.character not in new_line and self.character:
+                self._raise_error(CommentOverflowError, value)
+                return True
+            self.token = Token(
+                TokenType.COMMENT, value, self.line, self.column
+            )
+            return True
         while self._next_char() not in new_line and self.character:
             if number_of_chars == self.max_string_length:
                 self._raise_error(CommentOverflowError, value)
                 return True
             value += self.character
             number_of_chars += 1
-        self.token = Token(TokenType.COMMENT, value, self.token_position)
+        self.token = Token(TokenType.COMMENT, value, self.line, self.column)
         return True
 
     def _try_build_string_token(self) -> bool:
@@ -236,6 +292,14 @@ class Lexer:
         value = ""
         number_of_chars = 0
         while self._next_char() != '"':
+            if self.buffer_size and number_of_chars < self.max_string_length:
+                run = self._read_run(
+                    STRING_RUN, self.max_string_length - number_of_chars
+                )
+                value += run
+                number_of_chars += len(run)
+                if self.character == '"':
+                    break
             if self.character in EOF_CHARS:
                 self._raise_error(UnterminatedStringError, value)
                 return True
@@ -253,21 +317,63 @@ class Lexer:
             number_of_chars += 1
 
         self._next_char()
-        self.token = Token(TokenType.STRING_VALUE, value, self.token_position)
+        self.token = Token(
+            TokenType.STRING_VALUE, value, self.line, self.column
+        )
         return True
 
+    def _fill_buffer(self) -> None:
+        """Reads next block of characters from stream into buffer"""
+        self.buffer = self.stream.read(self.buffer_size)
+        self.buffer_index = 0
+        self.character = self.buffer[:1]
+
+    def _read_run(self, pattern: re.Pattern, limit: int = None) -> str:
+        """Reads run of characters matching pattern from buffer, starting
+        with current character and refilling buffer while the run goes on,
+        returns read characters"""
+        pieces = []
+        while True:
+            start = self.buffer_index
+            end = len(self.buffer)
+            if limit is not None:
+                end = min(end, start + max(limit, 0))
+            index = pattern.match(self.buffer, start, end).end()
+            self.column += index - start
+            self.buffer_index = index
+            pieces.append(self.buffer[start:index])
+            if index < len(self.buffer):
+                self.character = self.buffer[index]
+                break
+            if self.buffer_size < 0:
+                self.character = ""
+                break
+            self._fill_buffer()
+            if limit is not None:
+                limit -= index - start
+            if not self.character or (limit is not None and limit <= 0):
+                break
+        return "".join(pieces)
+
     def _next_char(self) -> str:
-        """Reads next character from stream"""
-        self.character = self.stream.read(1)
-        self.position.column += 1
+        """Reads next character from stream or buffer"""
+        if self.buffer_size:
+            self.buffer_index += 1
+            try:
+                self.character = self.buffer[self.buffer_index]
+            except IndexError:
+                if self.buffer_size > 0:
+                    self._fill_buffer()
+                else:
+                    self.character = ""
+        else:
+            self.character = self.stream.read(1)
+        self.column += 1
         return self.character
 
     def next_token(self) -> Token:
         """Returns next token from stream"""
-        while self._is_white():
-            pass
-
-        self.token_position = self.position
+        self._is_white()
 
         if (
             self._try_build_eof()
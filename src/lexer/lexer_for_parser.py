@@ -2,6 +2,8 @@ from io import TextIOBase
 
 from error.error_manager import ErrorManager
 from lexer.lexer import Lexer
+from lexer.mmap_lexer import MmapLexer
+from lexer.regex_lexer import RegexLexer
 from lexer.token_manager import Token, TokenType
 from utility.utility import MAX_IDENTIFIER_LENGTH, MAX_INT, MAX_STRING_LENGTH
 
@@ -14,6 +16,7 @@ class LexerForParser(Lexer):
         max_identifier_length: int = MAX_IDENTIFIER_LENGTH,
         max_string_length: int = MAX_STRING_LENGTH,
         max_int: int = MAX_INT,
+        buffer_size: int = 0,
     ) -> None:
         super().__init__(
             stream,
@@ -21,6 +24,7 @@ class LexerForParser(Lexer):
             max_identifier_length,
             max_string_length,
             max_int,
+            buffer_size,
         )
 
     def next_token(self) -> Token:
@@ -29,3 +33,11 @@ class LexerForParser(Lexer):
         while token.token_type == TokenType.COMMENT:
             token = super().next_token()
         return token
+
+
+class RegexLexerForParser(LexerForParser, RegexLexer):
+    """Regex backend skipping comments, see RegexLexer"""
+
+
+class MmapLexerForParser(LexerForParser, MmapLexer):
+    """Memory mapped backend skipping comments, see MmapLexer"""
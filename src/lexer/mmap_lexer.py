@@ -0,0 +1,182 @@
+import mmap
+import os
+import re
+import sys
+from typing import BinaryIO, Union
+
+from error.error_manager import ErrorManager
+from lexer.regex_lexer import RegexLexer
+from lexer.token_manager import Token, TokenType
+from utility.utility import (DOUBLE_TOKENS, KEYWORDS, LEXER_BUFFER_SIZE,
+                             MAX_IDENTIFIER_LENGTH, MAX_INT,
+                             MAX_STRING_LENGTH, MMAP_COMMENT_RUNS,
+                             MMAP_TOKEN_PATTERN, SINGLE_TOKENS)
+
+
+class MmapLexer(RegexLexer):
+    """Regex lexer scanning memory mapped UTF-8 file.
+
+    The file is never read nor decoded as a whole, pattern is matched
+    directly against mapped bytes and only values of identifiers, strings
+    and comments are decoded. Already lexed pages are released every
+    buffer_size bytes, so resident memory does not grow with file size.
+    Tokens left to Lexer are built from characters decoded one at a time.
+    """
+
+    stream: BinaryIO
+    buffer: Union[mmap.mmap, bytes]
+    character_end: int
+    release_size: int
+    released: int
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        error_manager: ErrorManager,
+        max_identifier_length: int = MAX_IDENTIFIER_LENGTH,
+        max_string_length: int = MAX_STRING_LENGTH,
+        max_int: int = MAX_INT,
+        buffer_size: int = LEXER_BUFFER_SIZE,
+    ) -> None:
+        self.release_size = buffer_size or LEXER_BUFFER_SIZE
+        if self.release_size < 0 or not hasattr(mmap, "MADV_DONTNEED"):
+            self.release_size = os.fstat(stream.fileno()).st_size + 1
+        super().__init__(
+            stream,
+            error_manager,
+            max_identifier_length,
+            max_string_length,
+            max_int,
+            -1,
+        )
+        self.buffer_size = 0
+        self.token_pattern = MMAP_TOKEN_PATTERN
+
+    def _fill_buffer(self) -> None:
+        """Maps whole stream into memory"""
+        if os.fstat(self.stream.fileno()).st_size:
+            self.buffer = mmap.mmap(
+                self.stream.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        else:
+            self.buffer = b""
+        self.released = 0
+        self._move_to(0)
+
+    def _release_pages(self) -> None:
+        """Releases mapped pages before current character"""
+        end = self.buffer_index - self.buffer_index % mmap.PAGESIZE
+        if end > self.released:
+            self.buffer.madvise(
+                mmap.MADV_DONTNEED, self.released, end - self.released
+            )
+            self.released = end
+
+    def _move_to(self, index: int) -> None:
+        """Moves to character starting at given byte index"""
+        self.buffer_index = index
+        if index - self.released >= self.release_size:
+            self._release_pages()
+        if index >= len(self.buffer):
+            self.character = ""
+            self.character_end = index
+            return
+        lead = self.buffer[index]
+        if lead < 0x80:
+            self.character = chr(lead)
+            self.character_end = index + 1
+            return
+        size = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+        try:
+            self.character = self.buffer[index : index + size].decode()
+            self.character_end = index + size
+        except UnicodeDecodeError:
+            self.character = "\N{REPLACEMENT CHARACTER}"
+            self.character_end = index + 1
+
+    def _next_char(self) -> str:
+        """Decodes next character from mapped file"""
+        self._move_to(self.character_end)
+        self.column += 1
+        return self.character
+
+    def _skip_white(self, white: bytes) -> bool:
+        """Moves position over white spaces matched before token, returns
+        False if they have to be checked by Lexer"""
+        return super()._skip_white(white.decode("ascii"))
+
+    def _decode(self, raw: bytes) -> Union[str, None]:
+        """Decodes token value, returns None if it is not valid UTF-8"""
+        try:
+            return raw.decode()
+        except UnicodeDecodeError:
+            return None
+
+    def _build_identifier(self, match: re.Match) -> int:
+        """Builds identifier or keyword token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("identifier").decode("ascii")
+        if len(value) > self.max_identifier_length:
+            return 0
+        self.token = Token(
+            KEYWORDS.get(value, TokenType.IDENTIFIER),
+            sys.intern(value),
+            self.line,
+            self.column,
+        )
+        return match.end()
+
+    def _build_double(self, match: re.Match) -> int:
+        """Builds double or single character token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("double").decode("ascii")
+        self.token = Token(
+            DOUBLE_TOKENS[value[0]][len(value)], value, self.line, self.column
+        )
+        return match.end()
+
+    def _build_single(self, match: re.Match) -> int:
+        """Builds single character token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = chr(match.group("single")[0])
+        self.token = Token(SINGLE_TOKENS[value], value, self.line, self.column)
+        return match.end()
+
+    def _build_string(self, match: re.Match) -> int:
+        """Builds string token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        raw = match.group("string")
+        if len(raw) > 4 * self.max_string_length:
+            return 0
+        value = self._decode(raw)
+        if value is None or len(value) > self.max_string_length:
+            return 0
+        self.column -= len(raw) - len(value)
+        self.token = Token(
+            TokenType.STRING_VALUE,
+            value.replace("\\\\", "\\"),
+            self.line,
+            self.column,
+        )
+        return match.end()
+
+    def _build_comment(self, match: re.Match) -> int:
+        """Builds comment token from match and comment body after it,
+        returns index after it or 0 if it has to be built by Lexer"""
+        body = MMAP_COMMENT_RUNS[self.new_line_char].match(
+            self.buffer,
+            match.end(),
+            match.end() + 4 * self.max_string_length + 1,
+        )
+        raw = body.group()
+        if (
+            len(raw) > 4 * self.max_string_length
+            or body.end() >= len(self.buffer)
+        ):
+            return 0
+        value = self._decode(raw)
+        if value is None or len(value) > self.max_string_length:
+            return 0
+        self.column -= len(raw) - len(value)
+        self.token = Token(TokenType.COMMENT, value, self.line, self.column)
+        return body.end()
@@ -0,0 +1,11 @@
+from typing import NamedTuple
+
+
+class Position(NamedTuple):
+    """Immutable position in source, shared between tokens and nodes"""
+
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        return f"{self.line}, {self.column}"
@@ -0,0 +1,191 @@
+import re
+import sys
+from io import TextIOBase
+from typing import Callable
+
+from error.error_manager import ErrorManager
+from lexer.lexer import Lexer
+from lexer.token_manager import Token, TokenType
+from utility.utility import (COMMENT_RUNS, DOUBLE_TOKENS, KEYWORDS,
+                             LEXER_BUFFER_SIZE, MAX_IDENTIFIER_LENGTH, MAX_INT,
+                             MAX_STRING_LENGTH, SINGLE_TOKENS, TOKEN_PATTERN)
+
+
+class RegexLexer(Lexer):
+    """Lexer matching tokens with single compiled pattern.
+
+    Tokens which are matched whole inside the buffer and fit in the limits
+    are built directly from the match. Everything else (errors, overflows,
+    tokens split between buffer blocks) is handed to the character by
+    character builders of Lexer, so both produce the same tokens.
+    """
+
+    token_pattern: re.Pattern
+    builders: dict[str, Callable[[re.Match], int]]
+
+    def __init__(
+        self,
+        stream: TextIOBase,
+        error_manager: ErrorManager,
+        max_identifier_length: int = MAX_IDENTIFIER_LENGTH,
+        max_string_length: int = MAX_STRING_LENGTH,
+        max_int: int = MAX_INT,
+        buffer_size: int = LEXER_BUFFER_SIZE,
+    ) -> None:
+        super().__init__(
+            stream,
+            error_manager,
+            max_identifier_length,
+            max_string_length,
+            max_int,
+            buffer_size or LEXER_BUFFER_SIZE,
+        )
+        self.token_pattern = TOKEN_PATTERN
+        self.builders = {
+            "identifier": self._build_identifier,
+            "decimal": self._build_decimal,
+            "integer": self._build_integer,
+            "double": self._build_double,
+            "single": self._build_single,
+            "string": self._build_string,
+            "comment": self._build_comment,
+        }
+
+    def _move_to(self, index: int) -> None:
+        """Moves to character at given buffer index"""
+        self.buffer_index = index
+        self.character = self.buffer[index]
+
+    def _build_identifier(self, match: re.Match) -> int:
+        """Builds identifier or keyword token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("identifier")
+        if len(value) > self.max_identifier_length:
+            return 0
+        self.token = Token(
+            KEYWORDS.get(value, TokenType.IDENTIFIER),
+            sys.intern(value),
+            self.line,
+            self.column,
+        )
+        return match.end()
+
+    def _fits_integer(self, digits: str) -> bool:
+        """Checks if integer digits pass every overflow check of Lexer"""
+        return (
+            len(digits) == 1
+            or (self.max_int - ord("9") - ord("0")) / 10 - int(digits[:-1])
+            > 0
+        )
+
+    def _build_integer(self, match: re.Match) -> int:
+        """Builds integer token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("integer")
+        if not self._fits_integer(value):
+            return 0
+        self.token = Token(
+            TokenType.INTEGER_VALUE, int(value), self.line, self.column
+        )
+        return match.end()
+
+    def _build_decimal(self, match: re.Match) -> int:
+        """Builds decimal token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        integer = match.group("integer_part")
+        fraction = match.group("fraction")
+        if not self._fits_integer(integer) or (
+            len(fraction) > 1 and self.max_int / 10 - int(fraction[:-1]) <= 0
+        ):
+            return 0
+        self.token = Token(
+            TokenType.DECIMAL_VALUE,
+            int(integer) + int(fraction) / (10 ** len(fraction)),
+            self.line,
+            self.column,
+        )
+        return match.end()
+
+    def _build_double(self, match: re.Match) -> int:
+        """Builds double or single character token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("double")
+        self.token = Token(
+            DOUBLE_TOKENS[value[0]][len(value)], value, self.line, self.column
+        )
+        return match.end()
+
+    def _build_single(self, match: re.Match) -> int:
+        """Builds single character token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("single")
+        self.token = Token(SINGLE_TOKENS[value], value, self.line, self.column)
+        return match.end()
+
+    def _build_string(self, match: re.Match) -> int:
+        """Builds string token from match,
+        returns index after it or 0 if it has to be built by Lexer"""
+        value = match.group("string")
+        if len(value) > self.max_string_length:
+            return 0
+        self.token = Token(
+            TokenType.STRING_VALUE,
+            value.replace("\\\\", "\\"),
+            self.line,
+            self.column,
+        )
+        return match.end()
+
+    def _build_comment(self, match: re.Match) -> int:
+        """Builds comment token from match and comment body after it,
+        returns index after it or 0 if it has to be built by Lexer"""
+        body = COMMENT_RUNS[self.new_line_char].match(
+            self.buffer, match.end()
+        )
+        if (
+            body.end() - match.end() > self.max_string_length
+            or body.end() >= len(self.buffer)
+        ):
+            return 0
+        self.token = Token(
+            TokenType.COMMENT, body.group(), self.line, self.column
+        )
+        return body.end()
+
+    def _skip_white(self, white: str) -> bool:
+        """Moves position over white spaces matched before token, returns
+        False if they have to be checked by Lexer"""
+        if self.new_line_char in ("\n", "\r"):
+            if (
+                self.new_line_char == "\n" and "\r" in white
+                or self.new_line_char == "\r" and "\n" in white
+            ):
+                return False
+        elif "\n" in white or "\r" in white:
+            return False
+        if self.new_line_char and self.new_line_char in white:
+            self.line += white.count(self.new_line_char)
+            self.column = len(white) - white.rindex(
+                self.new_line_char
+            )
+        else:
+            self.column += len(white)
+        return True
+
+    def next_token(self) -> Token:
+        """Returns next token from buffer"""
+        match = self.token_pattern.match(self.buffer, self.buffer_index)
+        if match and match.end() < len(self.buffer):
+            white_end = match.end(1)
+            if white_end == self.buffer_index or self._skip_white(
+                match.group(1)
+            ):
+                end = self.builders[match.lastgroup](match)
+                if end:
+                    self.column += end - white_end
+                    self.token.column = self.column
+                    self._move_to(end)
+                    return self.token
+                self._move_to(white_end)
+
+        return super().next_token()
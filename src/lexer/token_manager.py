@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from array import array
 from enum import Enum
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
+
+from lexer.position import Position
 
 if TYPE_CHECKING:
-    from utility.utility import Position
+    from lexer.lexer import Lexer
 
 
 class TokenType(Enum):
@@ -78,19 +81,89 @@ class TokenType(Enum):
 
 
 class Token:
+    """Token of given type with its value and position stored as numbers"""
+
+    __slots__ = ("token_type", "value", "line", "column")
+
     token_type: TokenType
     value: Union[str, int, float, bool]
-    position: Position
+    line: int
+    column: int
 
     def __init__(
         self,
         token_type: TokenType,
         value: Union[str, int, float, bool],
-        position: Position
+        line: int,
+        column: int,
     ) -> None:
         self.token_type = token_type
         self.value = value
-        self.position = position
+        self.line = line
+        self.column = column
+
+    @property
+    def position(self) -> Position:
+        """Returns position of token"""
+        return Position(self.line, self.column)
 
     def __str__(self) -> str:
         return f"Token({self.token_type.name}, {self.value})"
+
+
+TOKEN_TYPES: list[TokenType] = list(TokenType)
+TOKEN_TYPE_CODES: dict[TokenType, int] = {
+    token_type: code for code, token_type in enumerate(TOKEN_TYPES)
+}
+
+
+class TokenTape:
+    """Tokens of whole file stored column by column in parallel arrays"""
+
+    types: bytearray
+    values: list[Union[str, int, float, bool]]
+    lines: array
+    columns: array
+
+    def __init__(self) -> None:
+        self.types = bytearray()
+        self.values = []
+        self.lines = array("L")
+        self.columns = array("L")
+
+    @classmethod
+    def from_lexer(cls, lexer: Lexer) -> TokenTape:
+        """Reads tokens from lexer until EOF token, including it"""
+        tape = cls()
+        token = lexer.next_token()
+        while token.token_type != TokenType.EOF:
+            tape.append(token)
+            token = lexer.next_token()
+        tape.append(token)
+        return tape
+
+    def append(self, token: Token) -> None:
+        """Appends token at the end of tape"""
+        self.types.append(TOKEN_TYPE_CODES[token.token_type])
+        self.values.append(token.value)
+        self.lines.append(token.line)
+        self.columns.append(token.column)
+
+    def token_type(self, index: int) -> TokenType:
+        """Returns type of token at given index without building it"""
+        return TOKEN_TYPES[self.types[index]]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(
+            TOKEN_TYPES[self.types[index]],
+            self.values[index],
+            self.lines[index],
+            self.columns[index],
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self[index]
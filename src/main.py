@@ -3,10 +3,32 @@ from argparse import ArgumentParser
 from parser.parser import Parser
 
 from error.error_manager import ErrorManager
+from interpreter.bytecode_interpreter import BytecodeInterpreter
+from interpreter.closure_interpreter import ClosureInterpreter
 from interpreter.interpreter import Interpreter
-from lexer.lexer_for_parser import LexerForParser
-from utility.utility import (MAX_IDENTIFIER_LENGTH, MAX_INT, MAX_REC_DEPTH,
-                             MAX_STRING_LENGTH)
+from interpreter.memoization import print_cache_statistics
+from interpreter.optimizer import OptimizingParser
+from interpreter.python_interpreter import PythonInterpreter
+from interpreter.resolver import Resolver
+from interpreter.type_checker import TypeChecker
+from interpreter.visitor import Visitor
+from lexer.lexer_for_parser import (LexerForParser, MmapLexerForParser,
+                                    RegexLexerForParser)
+from utility.utility import (LEXER_BUFFER_SIZE, MAX_IDENTIFIER_LENGTH,
+                             MAX_INT, MAX_REC_DEPTH, MAX_STRING_LENGTH)
+
+LEXER_BACKENDS: dict[str, type[LexerForParser]] = {
+    "sequential": LexerForParser,
+    "regex": RegexLexerForParser,
+    "mmap": MmapLexerForParser,
+}
+
+INTERPRETERS: dict[str, type[Visitor]] = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "python": PythonInterpreter,
+    "bytecode": BytecodeInterpreter,
+}
 
 
 def main() -> None:
@@ -34,29 +56,129 @@ def main() -> None:
         "--max_rec_depth",
         type=int,
         default=MAX_REC_DEPTH,
-        help="max rec depth",
+        help="max rec depth (engines other than bytecode are also limited "
+        "by recursion limit of Python)",
+    )
+    arg_parser.add_argument(
+        "-bs",
+        "--buffer_size",
+        type=int,
+        default=LEXER_BUFFER_SIZE,
+        help="lexer buffer size (0 - read by character, -1 - whole file), "
+        "for mmap backend number of bytes lexed before releasing memory",
+    )
+    arg_parser.add_argument(
+        "-lb",
+        "--lexer_backend",
+        choices=LEXER_BACKENDS,
+        default="sequential",
+        help="lexer backend",
+    )
+    arg_parser.add_argument(
+        "-e",
+        "--engine",
+        choices=INTERPRETERS,
+        default="tree",
+        help="execution engine (tree - walk tree, closure - compile tree "
+        "into closures before execution, python - translate program into "
+        "Python source and execute it, bytecode - compile program into "
+        "bytecode run by virtual machine)",
+    )
+    arg_parser.add_argument(
+        "-sc",
+        "--short_circuit",
+        action="store_true",
+        help="evaluate right operand of or/and only when left one does not "
+        "decide result, both operands have to be bool",
+    )
+    arg_parser.add_argument(
+        "-co",
+        "--check_only",
+        action="store_true",
+        help="report type errors found without executing program",
+    )
+    arg_parser.add_argument(
+        "-tc",
+        "--type_check",
+        action="store_true",
+        help="check types of program before execution, program is executed "
+        "only if no error is found, without runtime checks proven by checker "
+        "(tree engine only)",
+    )
+    arg_parser.add_argument(
+        "-O",
+        "--optimize",
+        action="store_true",
+        help="fold constant expressions, remove dead branches of if "
+        "statements and hoist loop invariants before execution",
+    )
+    arg_parser.add_argument(
+        "-mc",
+        "--memo_cache",
+        type=int,
+        default=0,
+        help="memoize values of pure functions in LRU caches of given size "
+        "(0 - disabled), numbers of cache hits and misses are printed to "
+        "standard error at exit, memoized calls are not executed, so they "
+        "do not count to max rec depth",
+    )
+    arg_parser.add_argument(
+        "-dt",
+        "--dump_tree",
+        action="store_true",
+        help="print optimized tree before execution (implies -O)",
     )
 
     args = arg_parser.parse_args()
+    if args.type_check and args.engine != "tree":
+        arg_parser.error("type check is supported only by tree engine")
     if os.path.isfile(args.file) is False:
         print("File does not exist.")
         return
 
-    with open(args.file, "r") as file:
+    lexer_type = LEXER_BACKENDS[args.lexer_backend]
+    mode = "rb" if issubclass(lexer_type, MmapLexerForParser) else "r"
+    with open(args.file, mode) as file:
         error_manager = ErrorManager()
-        lexer = LexerForParser(
-            file, error_manager, args.max_id, args.max_str, args.max_int
+        lexer = lexer_type(
+            file,
+            error_manager,
+            args.max_id,
+            args.max_str,
+            args.max_int,
+            args.buffer_size,
         )
         parser = Parser(lexer, error_manager)
-        interpreter = Interpreter(parser, args.max_rec_depth)
+        if args.optimize or args.dump_tree:
+            parser = OptimizingParser(parser, args.dump_tree)
+        if args.check_only:
+            program = parser.parse_program()
+            resolver = Resolver()
+            resolver.resolve(program)
+            TypeChecker(resolver, error_manager, args.short_circuit).check(
+                program
+            )
+            error_manager.print_errors()
+            return
+        options = {"memo_size": args.memo_cache}
+        if args.type_check:
+            options["type_check"] = True
+        interpreter = INTERPRETERS[args.engine](
+            parser, args.max_rec_depth, args.short_circuit, **options
+        )
         interpreter_error = None
         try:
             interpreter.interpret()
         except Exception as e:
             interpreter_error = e
         lexer.error_manager.print_errors()
-        if interpreter_error is not None:
+        reported = [str(error) for error in lexer.error_manager.errors]
+        if (
+            interpreter_error is not None
+            and str(interpreter_error) not in reported
+        ):
             print(interpreter_error)
+        print_cache_statistics(interpreter.caches)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ from parser.objects.statement import Statement
 
 
 class Block(Node):
+    __slots__ = ("statements",)
+
     statements: list[Statement]
 
     def __init__(self, statements: list[Statement]) -> None:
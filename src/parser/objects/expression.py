@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from parser.objects.node import Node
 from parser.objects.type import Dec, Int
 from typing import TYPE_CHECKING, Union
@@ -10,13 +9,17 @@ if TYPE_CHECKING:
 
 
 class Expression(Node):
+    __slots__ = ("position",)
+
     position: Position
 
     def __init__(self, position: Position) -> None:
-        self.position = deepcopy(position)
+        self.position = position
 
 
 class LiteralExpression(Expression):
+    __slots__ = ("value",)
+
     value: Union[int, float, bool, str]
 
     def __init__(
@@ -30,6 +33,8 @@ class LiteralExpression(Expression):
 
 
 class LogicalExpression(Expression):
+    __slots__ = ("left", "operator", "right")
+
     left: Expression
     operator: str
     right: Expression
@@ -46,6 +51,8 @@ class LogicalExpression(Expression):
 
 
 class OrExpression(LogicalExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         position: Position,
@@ -57,6 +64,8 @@ class OrExpression(LogicalExpression):
 
 
 class AndExpression(LogicalExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         position: Position,
@@ -68,6 +77,8 @@ class AndExpression(LogicalExpression):
 
 
 class RelativeExpression(LogicalExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         position: Position,
@@ -79,6 +90,8 @@ class RelativeExpression(LogicalExpression):
 
 
 class SumExpression(LogicalExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         position: Position,
@@ -90,6 +103,8 @@ class SumExpression(LogicalExpression):
 
 
 class MulExpression(LogicalExpression):
+    __slots__ = ()
+
     def __init__(
         self,
         position: Position,
@@ -101,6 +116,8 @@ class MulExpression(LogicalExpression):
 
 
 class NegatedExpression(Expression):
+    __slots__ = ("operator", "expression")
+
     expression: Expression
     operator: str
 
@@ -116,26 +133,36 @@ class NegatedExpression(Expression):
 
 
 class IntegerExpression(LiteralExpression):
+    __slots__ = ()
+
     def __init__(self, position: Position, value: int) -> None:
         super().__init__(position, value)
 
 
 class DecimalExpression(LiteralExpression):
+    __slots__ = ()
+
     def __init__(self, position: Position, value: float) -> None:
         super().__init__(position, value)
 
 
 class StringExpression(LiteralExpression):
+    __slots__ = ()
+
     def __init__(self, position: Position, value: str) -> None:
         super().__init__(position, value)
 
 
 class BooleanExpression(LiteralExpression):
+    __slots__ = ()
+
     def __init__(self, position: Position, value: bool) -> None:
         super().__init__(position, value)
 
 
 class CallExpression(Expression):
+    __slots__ = ("root_expression", "called_expression", "arguments")
+
     position: Position
     root_expression: Expression
     called_expression: Expression
@@ -163,6 +190,8 @@ class CallExpression(Expression):
 
 
 class IdentifierExpression(Expression):
+    __slots__ = ("identifier",)
+
     identifier: str
 
     def __init__(self, position: Position, identifier: str) -> None:
@@ -174,6 +203,8 @@ class IdentifierExpression(Expression):
 
 
 class CastExpression(Expression):
+    __slots__ = ("cast_type", "expression")
+
     cast_type: Union[Int, Dec]
     expression: Expression
 
@@ -184,3 +215,16 @@ class CastExpression(Expression):
 
     def __str__(self) -> str:
         return f"CastExpression({self.cast_type}, {self.expression})"
+
+
+class InvariantExpression(Expression):
+    __slots__ = ("expression",)
+
+    expression: Expression
+
+    def __init__(self, position: Position, expression: Expression) -> None:
+        super().__init__(position)
+        self.expression = expression
+
+    def __str__(self) -> str:
+        return f"InvariantExpression({self.expression})"
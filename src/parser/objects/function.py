@@ -1,4 +1,3 @@
-from copy import deepcopy
 from parser.objects.block import Block
 from parser.objects.expression import Expression
 from parser.objects.node import Node
@@ -8,6 +7,14 @@ from utility.utility import Position
 
 
 class Function(Node):
+    __slots__ = (
+        "position",
+        "name",
+        "block",
+        "argument_list",
+        "declaration_type",
+    )
+
     name: str
     block: Block
     argument_list: list[Expression]
@@ -22,7 +29,7 @@ class Function(Node):
         argument_list: list[Expression],
         declaration_type: Type,
     ) -> None:
-        self.position = deepcopy(position)
+        self.position = position
         self.name = name
         self.block = block
         self.argument_list = argument_list
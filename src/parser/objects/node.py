@@ -1,3 +1,5 @@
 class Node:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
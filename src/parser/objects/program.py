@@ -3,6 +3,8 @@ from parser.objects.node import Node
 
 
 class Program(Node):
+    __slots__ = ("objects",)
+
     objects: list[Function]
 
     def __init__(self, objects: list[Function]) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from parser.objects.expression import Expression, IdentifierExpression
+from parser.objects.expression import (Expression, IdentifierExpression,
+                                       InvariantExpression)
 from parser.objects.node import Node
 from parser.objects.type import Type
 from typing import TYPE_CHECKING, Union
@@ -13,13 +13,17 @@ if TYPE_CHECKING:
 
 
 class Statement(Node):
+    __slots__ = ("position",)
+
     position: Position
 
     def __init__(self, position: Position) -> None:
-        self.position = deepcopy(position)
+        self.position = position
 
 
 class IfStatement(Statement):
+    __slots__ = ("condition", "block", "else_block")
+
     condition: Expression
     block: Block
     else_block: Block
@@ -42,8 +46,11 @@ class IfStatement(Statement):
 
 
 class WhileStatement(Statement):
+    __slots__ = ("condition", "block", "invariants")
+
     condition: Expression
     block: Block
+    invariants: list[InvariantExpression]
 
     def __init__(
         self, position: Position, condition: Expression, block: Block
@@ -51,16 +58,20 @@ class WhileStatement(Statement):
         super().__init__(position)
         self.condition = condition
         self.block = block
+        self.invariants = []
 
     def __str__(self) -> str:
         return f"WhileStatement({self.condition})   \n \t\t{self.block}"
 
 
 class IterateStatement(Statement):
+    __slots__ = ("type", "identifier", "expression", "block", "invariants")
+
     type: Type
     identifier: Union[str, int, float, bool]
     expression: Expression
     block: Block
+    invariants: list[InvariantExpression]
 
     def __init__(
         self,
@@ -74,6 +85,7 @@ class IterateStatement(Statement):
         self.identifier = declaration[1]
         self.expression = expression
         self.block = block
+        self.invariants = []
 
     def __str__(self) -> str:
         return f"""IterateStatement({self.type}, {self.identifier},
@@ -81,6 +93,8 @@ class IterateStatement(Statement):
 
 
 class ReturnStatement(Statement):
+    __slots__ = ("expression",)
+
     expression: Expression
 
     def __init__(self, position: Position, expression: Expression) -> None:
@@ -92,6 +106,8 @@ class ReturnStatement(Statement):
 
 
 class DeclarationStatement(Statement):
+    __slots__ = ("type", "identifier", "expression")
+
     type: Type
     identifier: Union[str, int, float, bool]
     expression: Expression
@@ -113,6 +129,8 @@ class DeclarationStatement(Statement):
 
 
 class AssignmentStatement(Statement):
+    __slots__ = ("identifier", "expression")
+
     identifier: IdentifierExpression
     expression: Expression
 
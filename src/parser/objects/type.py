@@ -1,5 +1,8 @@
 import math
 from parser.objects.node import Node
+from operator import attrgetter
+from typing import Any, Callable, Iterator, Optional, Sequence
+from weakref import ref
 
 import numpy
 from matplotlib import patches
@@ -33,6 +36,7 @@ class String(Type):
 class Shape(Type):
     x: float
     y: float
+    bindings: Sequence[tuple["ShapeColumns", int]] = ()
 
     def __init__(self, x: float = 0, y: float = 0) -> None:
         if not isinstance(x, float):
@@ -45,6 +49,13 @@ class Shape(Type):
     def __str__(self) -> str:
         return "Shape"
 
+    def __copy__(self) -> "Shape":
+        """Copy is not bound to rows of canvases its original is in"""
+        shape = object.__new__(type(self))
+        shape.__dict__.update(self.__dict__)
+        shape.__dict__.pop("bindings", None)
+        return shape
+
     def move(self, x: float, y: float) -> None:
         if not isinstance(x, float):
             raise Exception("move(): 1. argument x must be dec")
@@ -52,6 +63,8 @@ class Shape(Type):
             raise Exception("move(): 2. argument y must be dec")
         self.x += x
         self.y += y
+        for columns, row in self.bindings:
+            columns.move(row, self.x, self.y)
 
     def area(self) -> float:
         pass
@@ -73,6 +86,8 @@ class Circle(Shape):
         radius: float,
     ) -> None:
         super().__init__(x, y)
+        if not isinstance(radius, float):
+            raise Exception("Circle(): 1. argument radius must be dec")
         self.radius = radius
 
     def __str__(self) -> str:
@@ -495,11 +510,206 @@ class Polygon(Shape):
         )
 
 
+class ShapeColumns:
+    """Values of shapes of one kind kept in columns of NumPy arrays, one
+    array for dec fields and one for int fields, grown by doubling. Shapes
+    in program are handles bound to rows, there is at most one living handle
+    of row, so that moving shape is seen by all its aliases. Rows of shape
+    pushed more than once share list of its bindings, so that its handle is
+    bound to all of them even after the pushed shape is gone. Handles are
+    weak references, dead ones are dropped when their number doubles"""
+
+    __slots__ = (
+        "kind",
+        "fields",
+        "get_floats",
+        "get_ints",
+        "floats",
+        "ints",
+        "size",
+        "handles",
+        "limit",
+        "aliases",
+    )
+
+    kind: type[Shape]
+    fields: tuple[str, ...]
+    get_floats: Callable[[Shape], Any]
+    get_ints: Optional[Callable[[Shape], Any]]
+    floats: numpy.ndarray
+    ints: Optional[numpy.ndarray]
+    size: int
+    handles: dict[int, ref]
+    limit: int
+    aliases: dict[int, list[tuple["ShapeColumns", int]]]
+
+    def __init__(self, kind: type[Shape], capacity: int = 8) -> None:
+        field_types = {}
+        for base in reversed(kind.__mro__):
+            field_types.update(vars(base).get("__annotations__", {}))
+        float_fields = [
+            field
+            for field, field_type in field_types.items()
+            if field_type is float
+        ]
+        int_fields = [
+            field
+            for field, field_type in field_types.items()
+            if field_type is int
+        ]
+        self.kind = kind
+        self.fields = (*float_fields, *int_fields, "bindings")
+        self.get_floats = attrgetter(*float_fields)
+        self.floats = numpy.empty((len(float_fields), capacity))
+        self.get_ints = None
+        self.ints = None
+        if int_fields:
+            self.get_ints = attrgetter(*int_fields)
+            self.ints = numpy.empty((len(int_fields), capacity), numpy.int64)
+        self.size = 0
+        self.handles = {}
+        self.limit = 64
+        self.aliases = {}
+
+    def append(self, shape: Shape) -> int:
+        """Stores values of shape in new row and binds shape to it, returns
+        index of row"""
+        row = self.size
+        if row == self.floats.shape[1]:
+            self.floats = numpy.concatenate(
+                (self.floats, numpy.empty_like(self.floats)), axis=1
+            )
+            if self.ints is not None:
+                self.ints = numpy.concatenate(
+                    (self.ints, numpy.empty_like(self.ints)), axis=1
+                )
+        self.floats[:, row] = self.get_floats(shape)
+        if self.ints is not None:
+            self.ints[:, row] = self.get_ints(shape)
+        self.size = row + 1
+        bindings = shape.bindings
+        if not bindings:
+            bindings = shape.bindings = []
+        bindings.append((self, row))
+        if len(bindings) > 1:
+            for columns, alias in bindings:
+                columns.aliases[alias] = bindings
+        self._register(row, shape)
+        return row
+
+    def handle(self, row: int) -> Shape:
+        """Returns shape bound to row, creating it from values of row if no
+        shape bound to it is alive, created shape is bound to all rows of
+        shape pushed to them"""
+        reference = self.handles.get(row)
+        if reference is not None:
+            shape = reference()
+            if shape is not None:
+                return shape
+        bindings = self.aliases.get(row)
+        if bindings is None:
+            bindings = [(self, row)]
+        values = self.floats[:, row].tolist()
+        if self.ints is not None:
+            values += self.ints[:, row].tolist()
+        values.append(bindings)
+        shape = object.__new__(self.kind)
+        shape.__dict__.update(zip(self.fields, values))
+        for columns, alias in bindings:
+            columns._register(alias, shape)
+        return shape
+
+    def remove_last(self) -> Shape:
+        """Removes last row, returns shape with its values, which is no
+        longer bound to it"""
+        row = self.size - 1
+        shape = self.handle(row)
+        del self.handles[row]
+        self.aliases.pop(row, None)
+        shape.bindings.remove((self, row))
+        self.size = row
+        return shape
+
+    def move(self, row: int, x: float, y: float) -> None:
+        self.floats[0, row] = x
+        self.floats[1, row] = y
+
+    def _register(self, row: int, shape: Shape) -> None:
+        handles = self.handles
+        handles[row] = ref(shape)
+        if len(handles) > self.limit:
+            self.handles = {
+                row: reference
+                for row, reference in handles.items()
+                if reference() is not None
+            }
+            self.limit = 2 * len(self.handles) + 64
+
+
+class ShapeStore:
+    """Shapes of canvas kept as columns grouped by kind of shape, with kind
+    and row of every shape in order of pushing. Iteration yields handles of
+    shapes, so changes made through them are stored. Values are kept as
+    float64 and int64, so that results are unchanged, which limits saving
+    of memory to about 4x of list of shape objects"""
+
+    __slots__ = ("columns", "kinds", "rows", "size", "kind_indices")
+
+    columns: list[ShapeColumns]
+    kinds: numpy.ndarray
+    rows: numpy.ndarray
+    size: int
+    kind_indices: dict[type[Shape], int]
+
+    def __init__(self, capacity: int = 8) -> None:
+        self.columns = []
+        self.kinds = numpy.empty(capacity, numpy.int8)
+        self.rows = numpy.empty(capacity, numpy.int32)
+        self.size = 0
+        self.kind_indices = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Shape]:
+        columns = self.columns
+        index = 0
+        while index < self.size:
+            yield columns[self.kinds.item(index)].handle(
+                self.rows.item(index)
+            )
+            index += 1
+
+    def push(self, shape: Shape) -> None:
+        kind = self.kind_indices.get(type(shape))
+        if kind is None:
+            kind = len(self.columns)
+            self.columns.append(ShapeColumns(type(shape)))
+            self.kind_indices[type(shape)] = kind
+        index = self.size
+        if index == len(self.kinds):
+            self.kinds = numpy.concatenate(
+                (self.kinds, numpy.empty_like(self.kinds))
+            )
+            self.rows = numpy.concatenate(
+                (self.rows, numpy.empty_like(self.rows))
+            )
+        self.kinds[index] = kind
+        self.rows[index] = self.columns[kind].append(shape)
+        self.size = index + 1
+
+    def pop(self) -> Shape:
+        if not self.size:
+            raise IndexError("pop from empty list")
+        self.size -= 1
+        return self.columns[self.kinds.item(self.size)].remove_last()
+
+
 class Canvas(Type):
-    shapes: list[Shape]
+    shapes: ShapeStore
 
     def __init__(self) -> None:
-        self.shapes = []
+        self.shapes = ShapeStore()
 
     def __str__(self) -> str:
         return "Canvas"
@@ -507,7 +717,7 @@ class Canvas(Type):
     def push(self, shape: Shape) -> None:
         if not isinstance(shape, Shape):
             raise Exception("push(): 1. argument shape must be Shape")
-        self.shapes.append(shape)
+        self.shapes.push(shape)
 
     def pop(self) -> Shape:
         return self.shapes.pop()
@@ -1,4 +1,11 @@
 import io
+import operator
+import sys
+from copy import copy
+from inspect import signature
+from parser.objects.block import Block
+from parser.objects.expression import CallExpression
+from parser.objects.type import Canvas, Circle, Polygon, Square
 
 import pytest
 
@@ -24,9 +31,25 @@ from error.error_interpreter import (DivisionByZeroError,
                                      MissingWhileConditionError,
                                      NumberOfArgumentError, RedeclarationError)
 from error.error_manager import ErrorManager
+from interpreter.bytecode import BytecodeCompiler, Opcode
+from interpreter.bytecode_interpreter import BytecodeInterpreter
+from interpreter.closure_interpreter import ClosureInterpreter
+from interpreter.environment import Environment
+from interpreter.memoization import (FunctionCache, PurityAnalyzer,
+                                     print_cache_statistics)
+from interpreter.optimizer import OptimizingParser
+from interpreter.python_interpreter import PythonInterpreter
+from interpreter.resolver import Resolver
+from interpreter.runtime import MISSING
+from interpreter.type_checker import TypeChecker
+from interpreter.type_inference import TypeInferrer
+from interpreter.variable import Variable
+from interpreter.visitor import Visitor
+from main import main
 from src.interpreter.interpreter import Interpreter
 from src.lexer.lexer_for_parser import LexerForParser
 from src.parser.parser import Parser
+from utility.utility import OBJECT_PARAMETERS, OBJECT_TYPES
 
 TEST_INTERPRETER_DATA: list[tuple[str, str]] = [
     (
@@ -305,6 +328,59 @@ TEST_INTERPRETER_DATA: list[tuple[str, str]] = [
         """,
         "AAA\n",
     ),
+    (
+        """
+        def main(){
+            int i = 0;
+            while (i < 3) {
+                int k = i * 2;
+                if (True) {
+                    int j = k + 1;
+                    i = i + 1;
+                    print(j);
+                }
+            }
+            if (True) {
+                int k = 7;
+                print(k, i);
+            }
+        }
+        """,
+        "1\n3\n5\n73\n",
+    ),
+    (
+        """
+        def int g(int x){
+            return x * 2;
+        }
+        def int h(int x){
+            g(x);
+        }
+        def main(){
+            print(h(3));
+        }
+        """,
+        "6\n",
+    ),
+    (
+        """
+        def main(){
+            Canvas c = Canvas();
+            Circle a = Circle(0.0, 0.0, 1.0);
+            c.push(a);
+            c.push(Circle(0.0, 0.0, 2.0));
+            c.push(a);
+            for (Shape shape : c) {
+                print(shape == a, shape.d());
+                shape.move(1.0, 1.0);
+            }
+            Circle last = c.pop();
+            Circle other = c.pop();
+            print(last == a, other == a, other.r(), c.pop() == a);
+        }
+        """,
+        "True2.0\nFalse4.0\nTrue2.0\nTrueFalse2.0True\n",
+    ),
 ]
 
 
@@ -327,6 +403,28 @@ ERROR_INTERPRETER_DATA: list[tuple[str, Exception]] = [
         """,
         DivisionByZeroError,
     ),
+    (
+        """
+        def main(){
+            int a = 1;
+            dec b = 2.0;
+            print(a * 2 + b);
+        }
+        """,
+        MismatchedTypeError,
+    ),
+    (
+        """
+        def f(){
+            print(a);
+        }
+        def main(){
+            int a = 1;
+            f();
+        }
+        """,
+        MissingVariableDeclarationError,
+    ),
     (
         """
         def a(){
@@ -518,6 +616,51 @@ ERROR_INTERPRETER_DATA: list[tuple[str, Exception]] = [
         """,
         InvalidCallTypeError,
     ),
+    (
+        """
+        def main(){
+            Canvas c = Canvas();
+            c.push(Circle(0.0, 0.0, 1.0));
+            c.push(Square(0.0, 0.0, 1.0));
+            for (Shape shape : c) {
+                print(shape.r());
+            }
+            c.push(Rectangle(0.0, 0.0, 1.0, 2.0));
+            for (Shape shape : c) {
+                print(shape.r());
+            }
+        }
+        """,
+        MissingFunctionDeclarationError,
+    ),
+    (
+        """
+        def main(){
+            Canvas c = Canvas();
+            c.push(Circle(0.0, 0.0, 1.0));
+            c.push(Circle(0.0, 0.0, 1.0));
+            int i = 0;
+            for (Shape shape : c) {
+                if (i == 1) {
+                    shape.move(1, 1);
+                } else {
+                    shape.move(1.0, 1.0);
+                }
+                i = i + 1;
+            }
+        }
+        """,
+        InvalidCallTypeError,
+    ),
+    (
+        """
+        def main(){
+            Canvas c = Canvas();
+            c.push(Circle(0.0, 0.0, "abc"));
+        }
+        """,
+        InvalidCallTypeError,
+    ),
 ]
 
 
@@ -528,3 +671,1242 @@ def test_interpreter_error(stream, expected, capfd):
         parser = Parser(lexer, ErrorManager())
         with pytest.raises(expected):
             Interpreter(parser).interpret()
+
+
+@pytest.mark.parametrize("object_type", OBJECT_TYPES.values())
+def test_object_parameters_match_constructors(object_type):
+    parameters = signature(object_type).parameters
+    assert OBJECT_PARAMETERS[object_type] == tuple(
+        (parameter.annotation, name) for name, parameter in parameters.items()
+    )
+
+
+def test_resolver_assigns_frame_slots():
+    program = """
+        def f(int a, int b){
+            int c = a;
+            if (True) {
+                int d = c;
+                c = d;
+            }
+        }
+        def main(){}
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        tree = Parser(lexer, ErrorManager()).parse_program()
+    resolver = Resolver()
+    resolver.resolve(tree)
+    block = tree.objects[0].block
+    declaration, if_statement = block.statements
+    inner_declaration, assignment = if_statement.block.statements
+    assert resolver.get_slot(declaration) == (1, 0)
+    assert resolver.get_slot(declaration.expression) == (0, 0)
+    assert resolver.get_slot(inner_declaration) == (2, 0)
+    assert resolver.get_slot(assignment.identifier) == (1, 0)
+    assert resolver.frame_sizes[block] == 1
+    assert resolver.frame_sizes[if_statement.block] == 1
+
+
+def test_resolver_skips_frames_of_blocks_without_declarations():
+    program = """
+        def main(){
+            int a = 0;
+            while (a < 3) {
+                a = a + 1;
+            }
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        tree = Parser(lexer, ErrorManager()).parse_program()
+    resolver = Resolver()
+    resolver.resolve(tree)
+    block = tree.objects[0].block
+    assert resolver.frame_sizes[block] == 1
+    assert block.statements[1].block not in resolver.frame_sizes
+
+
+def test_environment_reuses_cleared_frames():
+    environment = Environment()
+    frame = environment.create_frame(2)
+    frame[1] = Variable(int, "a", 1)
+    environment.destroy_frame()
+    assert environment.create_frame(2) is frame
+    assert frame == [None, None]
+
+
+def test_interpreter_resolves_operator_once_per_node(capfd):
+    program = """
+        def int one(){
+            return (int) 1.0;
+        }
+        def main(){
+            int i = 0;
+            while (i < 3) {
+                i = i + one();
+            }
+            print(i);
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        interpreter = Interpreter(Parser(lexer, ErrorManager()))
+        interpreter.interpret()
+    out, err = capfd.readouterr()
+    assert out == "3\n"
+    handlers = sorted(
+        handler.__name__ for handler in interpreter.handlers.values()
+    )
+    assert handlers == ["_accept_add", "_accept_int"]
+    assert list(interpreter.typed_handlers.values()) == [
+        (operator.lt, (1, 0), None)
+    ]
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("a + b * 2", int),
+        ("a / b", float),
+        ("x - (dec) a", float),
+        ("a < b and x > 1.0", bool),
+        ("a + x", None),
+        ("-x", float),
+        ("c + a", None),
+        ("one() + a", None),
+    ],
+)
+def test_type_inferrer_infers_expression_types(expression, expected):
+    program = f"""
+        def int one(){{
+            return 1;
+        }}
+        def f(int a, Canvas c){{
+            int b = a;
+            dec x = 1.0;
+            print({expression});
+        }}
+        def main(){{}}
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        tree = Parser(lexer, ErrorManager()).parse_program()
+    resolver = Resolver()
+    resolver.resolve(tree)
+    inferrer = TypeInferrer(resolver)
+    inferrer.infer(tree)
+    printed = tree.objects[1].block.statements[-1].arguments[0]
+    assert inferrer.get_type(printed) == expected
+
+
+@pytest.mark.parametrize("stream,expected", TEST_INTERPRETER_DATA)
+def test_interpreter_type_check_accept(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        Interpreter(parser, type_check=True).interpret()
+        out, err = capfd.readouterr()
+        assert out == expected
+
+
+TYPE_CHECKER_ERROR_DATA: list[tuple[str, list[type[Exception]]]] = [
+    (
+        """
+        def main(){
+            print("executed");
+            int a = 1.0;
+            dec b = "text";
+        }
+        """,
+        [InvalidDeclarationTypeError, InvalidDeclarationTypeError],
+    ),
+    (
+        """
+        def main(){
+            int a = 1;
+            a = 2.0;
+            b = 1;
+        }
+        """,
+        [InvalidAssignmentTypeError, MissingVariableDeclarationError],
+    ),
+    (
+        """
+        def f(int a, Circle c){}
+        def main(){
+            f(1.0, Circle(1.0, 1.0, 1.0));
+            f(1);
+        }
+        """,
+        [MismatchedCallTypeError, NumberOfArgumentError],
+    ),
+    (
+        """
+        def int f(){
+            return 1.0;
+        }
+        def dec g(){
+            print(1);
+        }
+        def main(){
+            int a = g();
+        }
+        """,
+        [InvalidReturnTypeError, InvalidDeclarationTypeError],
+    ),
+    (
+        """
+        def main(){
+            Circle c = Circle(1.0, 1.0, 1.0);
+            print(c.area());
+            c.push(c);
+            int a = missing();
+            Canvas v = Canvas(1);
+        }
+        """,
+        [
+            MissingFunctionDeclarationError,
+            MissingFunctionDeclarationError,
+            NumberOfArgumentError,
+        ],
+    ),
+    (
+        """
+        def main(){
+            int a = 1;
+            for (Shape s : a) {
+                print(-"text", a + 1.0);
+            }
+            int a = 2;
+        }
+        """,
+        [
+            InvalidIterableTypeError,
+            InvalidUnaryOperatorError,
+            MismatchedTypeError,
+            RedeclarationError,
+        ],
+    ),
+    (
+        """
+        def f(){}
+        """,
+        [MissingMainFunctionError],
+    ),
+]
+
+
+@pytest.mark.parametrize("stream,expected", TYPE_CHECKER_ERROR_DATA)
+def test_type_checker_reports_all_errors(stream, expected, capfd):
+    error_manager = ErrorManager()
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, error_manager)
+        parser = Parser(lexer, error_manager)
+        Interpreter(parser, type_check=True).interpret()
+    out, err = capfd.readouterr()
+    assert out == ""
+    assert [type(error) for error in error_manager.errors] == expected
+
+
+@pytest.mark.parametrize(
+    "program,expected",
+    [
+        (
+            """
+            def int double(int x){
+                return x * 2;
+            }
+            def int last(int x){
+                double(x);
+            }
+            def main(){
+                int a = last(3);
+                print(a);
+            }
+            """,
+            "6\n",
+        ),
+        (
+            """
+            def main(){
+                print("executed");
+                int a = 1.0;
+            }
+            """,
+            "InterpreterError [5, 14]: Invalid declaration type. : [dec] "
+            "expected: [int]\n",
+        ),
+    ],
+)
+def test_main_runs_type_checked_program(
+    program, expected, tmp_path, monkeypatch, capfd
+):
+    path = tmp_path / "program.txt"
+    path.write_text(program)
+    monkeypatch.setattr(sys, "argv", ["main.py", "-f", str(path), "-tc"])
+    main()
+    out, _ = capfd.readouterr()
+    assert out == expected
+
+
+def test_type_checker_verifies_statements():
+    program = """
+        def int f(int a){
+            return a;
+        }
+        def main(Canvas c){
+            int a = f(1);
+            int b = f(a);
+            a = b + f(b);
+            for (Shape s : c) {
+                dec x = s.area();
+                x = s.area();
+            }
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        tree = Parser(lexer, ErrorManager()).parse_program()
+    resolver = Resolver()
+    resolver.resolve(tree)
+    checker = TypeChecker(resolver, ErrorManager())
+    assert checker.check(tree)
+    first, second, assignment, iterate_statement = tree.objects[
+        1
+    ].block.statements
+    assert checker.verified == {
+        first,
+        first.expression,
+        second,
+        second.expression,
+        assignment,
+        assignment.expression.right,
+    }
+
+
+def test_visit_dispatch_is_cached(capfd):
+    with io.StringIO(TEST_INTERPRETER_DATA[0][0]) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        Interpreter(Parser(lexer, ErrorManager())).interpret()
+    assert Interpreter.dispatch_table[Block] is Interpreter._visit_Block
+    assert Block not in Visitor.dispatch_table
+
+
+@pytest.mark.parametrize("stream,expected", TEST_INTERPRETER_DATA)
+def test_closure_interpreter_accept(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        ClosureInterpreter(parser).interpret()
+        out, err = capfd.readouterr()
+        assert out == expected
+
+
+@pytest.mark.parametrize("stream,expected", ERROR_INTERPRETER_DATA)
+def test_closure_interpreter_error(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        with pytest.raises(expected):
+            ClosureInterpreter(parser).interpret()
+
+
+@pytest.mark.parametrize("stream,expected", TEST_INTERPRETER_DATA)
+def test_python_interpreter_accept(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        PythonInterpreter(parser).interpret()
+        out, err = capfd.readouterr()
+        assert out == expected
+
+
+@pytest.mark.parametrize("stream,expected", ERROR_INTERPRETER_DATA)
+def test_python_interpreter_error(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        with pytest.raises(expected):
+            PythonInterpreter(parser).interpret()
+
+
+def test_python_interpreter_returns_from_function(capfd):
+    program = """
+        def int sum(int n){
+            if (n < 1) {
+                return 0;
+            } else {
+                return n + sum(n - 1);
+            }
+        }
+        def main(){
+            print(sum(50));
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        PythonInterpreter(Parser(lexer, ErrorManager())).interpret()
+    out, err = capfd.readouterr()
+    assert out == "1275\n"
+
+
+@pytest.mark.parametrize("stream,expected", TEST_INTERPRETER_DATA)
+def test_bytecode_interpreter_accept(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        BytecodeInterpreter(parser).interpret()
+        out, err = capfd.readouterr()
+        assert out == expected
+
+
+@pytest.mark.parametrize("stream,expected", ERROR_INTERPRETER_DATA)
+def test_bytecode_interpreter_error(stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        with pytest.raises(expected):
+            BytecodeInterpreter(parser).interpret()
+
+
+def test_bytecode_interpreter_recursion_depth(capfd):
+    program = """
+        def int sum(int n){
+            if (n < 1) {
+                return 0;
+            } else {
+                return n + sum(n - 1);
+            }
+        }
+        def main(){
+            print(sum(98));
+            print(sum(99));
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        with pytest.raises(MaximumRecursionDepthError):
+            BytecodeInterpreter(parser).interpret()
+    out, err = capfd.readouterr()
+    assert out == "4851\n"
+
+
+TAIL_CALL_PROGRAM = """
+    def int count(int n, int total){
+        if (n == 0) {
+            return total;
+        } else {
+            return count(n - 1, total + 2);
+        }
+    }
+    def int depth(int n){
+        if (n == 0) {
+            return 0;
+        } else {
+            return depth(n - 1) + 1;
+        }
+    }
+    def dec half(int n){
+        return count(n, 0);
+    }
+    def main(){
+        print(count(20000, 0));
+        print(depth(20000));
+    }
+    """
+
+
+def test_bytecode_interpreter_deep_recursion(capfd):
+    with io.StringIO(TAIL_CALL_PROGRAM) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        BytecodeInterpreter(parser, max_rec_depth=20002).interpret()
+    out, err = capfd.readouterr()
+    assert out == "40000\n20000\n"
+
+
+def test_bytecode_interpreter_tail_calls_count_to_depth(capfd):
+    with io.StringIO(TAIL_CALL_PROGRAM) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        with pytest.raises(MaximumRecursionDepthError):
+            BytecodeInterpreter(parser, max_rec_depth=20001).interpret()
+    out, err = capfd.readouterr()
+    assert out == ""
+
+
+def test_bytecode_compiler_eliminates_tail_calls():
+    with io.StringIO(TAIL_CALL_PROGRAM) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        tree = Parser(lexer, ErrorManager()).parse_program()
+    compiler = BytecodeCompiler()
+    compiler.compile(tree)
+    opcodes = {
+        name: [instruction[0] for instruction in code.instructions]
+        for name, (code, _) in compiler.functions.items()
+    }
+    assert Opcode.TAIL_CALL in opcodes["count"]
+    assert Opcode.CALL not in opcodes["count"]
+    assert Opcode.TAIL_CALL not in opcodes["depth"]
+    assert Opcode.TAIL_CALL not in opcodes["half"]
+
+
+SHORT_CIRCUIT_PROGRAM = """
+    def bool loud(bool value){
+        print("called");
+        return value;
+    }
+    def main(){
+        print(True or loud(1 > 2));
+        print(1 > 2 and loud(True));
+        print(1 > 2 or loud(True));
+        print(True and loud(1 > 2));
+    }
+    """
+
+ENGINES: list[type[Visitor]] = [
+    Interpreter,
+    ClosureInterpreter,
+    PythonInterpreter,
+    BytecodeInterpreter,
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "short_circuit,expected",
+    [
+        (True, "True\nFalse\ncalled\nTrue\ncalled\nFalse\n"),
+        (False, "called\nTrue\ncalled\nFalse\ncalled\nTrue\ncalled\nFalse\n"),
+    ],
+)
+def test_short_circuit_skips_right_operand(
+    engine, short_circuit, expected, capfd
+):
+    with io.StringIO(SHORT_CIRCUIT_PROGRAM) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = Parser(lexer, ErrorManager())
+        engine(parser, short_circuit=short_circuit).interpret()
+    out, err = capfd.readouterr()
+    assert out == expected
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("True or 1", "True\n"),
+        ("1 > 2 and 1", "False\n"),
+        ("1 or True", MismatchedTypeError),
+        ("1 > 2 or 1", MismatchedTypeError),
+        ("True and \"a\"", MismatchedTypeError),
+    ],
+)
+def test_short_circuit_operands_are_bool(engine, expression, expected, capfd):
+    program = f"def main(){{ print({expression}); }}"
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        interpreter = engine(Parser(lexer, ErrorManager()), short_circuit=True)
+        if isinstance(expected, str):
+            interpreter.interpret()
+            out, err = capfd.readouterr()
+            assert out == expected
+        else:
+            with pytest.raises(expected):
+                interpreter.interpret()
+
+
+EARLY_RETURN_DATA = [
+    (
+        """
+        def dec f(dec x){
+            if (x > 0.0) { return x; }
+            return 0.0 - x;
+        }
+        def main(){ print(f(2.0), f(-3.0)); }
+        """,
+        "-2.03.0\n",
+    ),
+    (
+        """
+        def dec f(dec x){
+            if (x > 0.0) { return x; } else { return 0.0 - x; }
+        }
+        def main(){ print(f(2.0), f(-3.0)); }
+        """,
+        "2.03.0\n",
+    ),
+    (
+        """
+        def int f(int x){ return x; int y = 3; return x + 1; }
+        def main(){ print(f(2)); }
+        """,
+        "3\n",
+    ),
+    (
+        """
+        def int f(int x){ return x; int y = 3; return y; }
+        def main(){ print(f(2)); }
+        """,
+        MissingVariableDeclarationError,
+    ),
+    (
+        """
+        def int fib(int n){
+            if (n < 2) { return n; }
+            return fib(n - 1) + fib(n - 2);
+        }
+        def main(){ print(fib(5)); }
+        """,
+        TypeError,
+    ),
+    (
+        """
+        def int g(){ return 5; }
+        def int f(int x){
+            if (x > 1) { if (x > 2) { return x; } return 100; }
+            return g();
+        }
+        def main(){ print(f(3)); }
+        """,
+        MissingReturnTypeError,
+    ),
+    (
+        """
+        def bool more(int i){ return i < 3; }
+        def int f(){
+            int i = 0;
+            while (more(i)) {
+                if (i == 1) { return i; }
+                i = i + 1;
+            }
+            return 7;
+        }
+        def int g(){
+            int i = 0;
+            while (more(i)) { i = i + 1; return i * 10; }
+            return 7;
+        }
+        def main(){ print(f(), g()); }
+        """,
+        "77\n",
+    ),
+    (
+        """
+        def dec f(Canvas c){
+            for (Shape s : c) { return s.r(); }
+            return 1.0;
+        }
+        def dec g(Canvas c){
+            dec r = 0.0;
+            for (Shape s : c) { r = s.r(); }
+            return r;
+        }
+        def main(){
+            Canvas c = Canvas();
+            c.push(Circle(0.0, 0.0, 2.0));
+            print(f(c), g(c));
+        }
+        """,
+        "1.02.0\n",
+    ),
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("program,expected", EARLY_RETURN_DATA)
+def test_statements_after_return(engine, program, expected, capfd):
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        interpreter = engine(Parser(lexer, ErrorManager()))
+        if isinstance(expected, str):
+            interpreter.interpret()
+            out, err = capfd.readouterr()
+            assert out == expected
+        else:
+            with pytest.raises(expected):
+                interpreter.interpret()
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "arguments,expected",
+    [("True, g()", ""), ("g(), 1.5", "side effect\n")],
+)
+def test_arguments_are_checked_when_evaluated(
+    engine, arguments, expected, capfd
+):
+    program = f"""
+        def int g() {{ print("side effect"); return 1; }}
+        def int f(int a, int b) {{ return a; }}
+        def main() {{ print(f({arguments})); }}
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        with pytest.raises(MismatchedCallTypeError):
+            engine(Parser(lexer, ErrorManager())).interpret()
+    out, err = capfd.readouterr()
+    assert out == expected
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_deeply_nested_statements(engine, capfd):
+    loops = "total = total + 1; if (total == 1) { return total * 10; }"
+    for depth in range(45):
+        loops = (
+            f"int i{depth} = 0; "
+            f"while (more(i{depth})) {{ {loops} i{depth} = i{depth} + 1; }}"
+        )
+    ifs = "return x;"
+    for depth in range(120):
+        ifs = f"if (x > {depth}) {{ {ifs} }}"
+    program = f"""
+        def bool more(int i){{ return i < 1; }}
+        def int f(){{ int total = 0; {loops} }}
+        def int g(int x){{ {ifs} }}
+        def main(){{ print(f(), g(200)); }}
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        engine(Parser(lexer, ErrorManager())).interpret()
+    out, err = capfd.readouterr()
+    assert out == "10200\n"
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("stream,expected", TEST_INTERPRETER_DATA)
+def test_optimized_program_accept(engine, stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = OptimizingParser(Parser(lexer, ErrorManager()))
+        engine(parser).interpret()
+    out, err = capfd.readouterr()
+    assert out == expected
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("a + 2.0 * 4.0", "SumExpression(IdentifierExpression(a), +"),
+        ("1 + 2 * 3 - -4", "IntegerExpression(11)"),
+        ("7 / 2", "DecimalExpression(3.5)"),
+        ("(int) 2.5", "IntegerExpression(2)"),
+        ("not (1 > 2) and 2 > 1", "BooleanExpression(True)"),
+        ("\"a\" + \"b\"", "StringExpression(ab)"),
+        ("1 + 2.0", "SumExpression(IntegerExpression(1), +"),
+        ("1 or 2", "OrExpression(IntegerExpression(1), or"),
+        ("(int) 3", "CastExpression(<class"),
+    ],
+)
+def test_optimizer_folds_constant_expressions(expression, expected):
+    program = f"def main(dec a){{ print({expression}); }}"
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = OptimizingParser(Parser(lexer, ErrorManager()))
+        tree = parser.parse_program()
+    printed = tree.objects[0].block.statements[0].arguments[0]
+    assert str(printed).startswith(expected)
+
+
+def test_optimizer_removes_dead_branches():
+    program = """
+        def int main(){
+            if (1 == 2) {
+                print("dead");
+            }
+            if (2 > 1) {
+                print("inlined");
+            } else {
+                print("dead");
+            }
+            if (1 == 2) {
+                print("dead");
+            } else {
+                int a = 1;
+                return a;
+            }
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = OptimizingParser(Parser(lexer, ErrorManager()))
+        tree = parser.parse_program()
+    printed, if_statement = tree.objects[0].block.statements
+    assert str(printed.arguments[0]) == "StringExpression(inlined)"
+    assert str(if_statement.condition) == "BooleanExpression(True)"
+    assert if_statement.else_block is None
+    assert len(if_statement.block.statements) == 2
+
+
+def test_optimizer_reports_division_by_zero(capfd):
+    program = """
+        def main(){
+            print(1);
+            dec a = 1.0 / (2.0 - 2.0);
+        }
+        """
+    error_manager = ErrorManager()
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, error_manager)
+        parser = OptimizingParser(Parser(lexer, error_manager), dump=True)
+        with pytest.raises(DivisionByZeroError):
+            Interpreter(parser).interpret()
+    out, err = capfd.readouterr()
+    assert out.startswith("Program() <>\n")
+    assert out.endswith("\n1\n")
+    assert [type(error) for error in error_manager.errors] == [
+        DivisionByZeroError
+    ]
+
+
+def test_optimizer_skips_dead_branches_when_reporting():
+    program = """
+        def main(){
+            if (1 == 2) {
+                int x = 1 / 0;
+            }
+            if (2 > 1) {
+                print(1);
+            } else {
+                print(1 / 0);
+            }
+            while (1 > 2) {
+                print(1 / 0);
+            }
+        }
+        """
+    error_manager = ErrorManager()
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, error_manager)
+        parser = OptimizingParser(Parser(lexer, error_manager))
+        parser.parse_program()
+    assert error_manager.errors == []
+
+
+def test_main_reports_division_by_zero_once(tmp_path, monkeypatch, capfd):
+    path = tmp_path / "program.txt"
+    path.write_text("def main(){ print(1 / 0); }")
+    monkeypatch.setattr(sys, "argv", ["main.py", "-f", str(path), "-O"])
+    main()
+    out, _ = capfd.readouterr()
+    assert out == "InterpreterError [1, 24]: Division by zero.\n"
+
+
+HOISTING_DATA = [
+    (
+        """
+        def main(){
+            Circle circle = Circle(0.0, 0.0, 2.0);
+            dec total = 0.0;
+            while (total < circle.area() * 2.0) {
+                total = total + circle.r() * circle.d();
+            }
+            print(total);
+        }
+        """,
+        "32.0\n",
+    ),
+    (
+        """
+        def int area_sum(Circle circle, int n){
+            int i = 0;
+            dec total = 0.0;
+            while (i < n) {
+                total = total + circle.r();
+                if (i == 0 and n > 1) {
+                    total = total + (dec) area_sum(Circle(0.0, 0.0, 5.0), 1);
+                }
+                i = i + 1;
+            }
+            return (int) total;
+        }
+        def main(){
+            print(area_sum(Circle(0.0, 0.0, 1.0), 3));
+        }
+        """,
+        "8\n",
+    ),
+    (
+        """
+        def main(){
+            Canvas canvas = Canvas();
+            Rectangle rectangle = Rectangle(0.0, 0.0, 1.0, 2.0);
+            for (Shape shape : canvas) {
+                print(rectangle.d());
+            }
+            Circle circle = Circle(0.0, 0.0, 1.0);
+            int i = 0;
+            while (i < 2) {
+                print(circle.r());
+                circle = Circle(0.0, 0.0, 2.0);
+                i = i + 1;
+            }
+        }
+        """,
+        "1.0\n2.0\n",
+    ),
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("stream,expected", HOISTING_DATA)
+def test_hoisted_program_accept(engine, stream, expected, capfd):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = OptimizingParser(Parser(lexer, ErrorManager()))
+        engine(parser).interpret()
+    out, err = capfd.readouterr()
+    assert out == expected
+
+
+def test_hoister_wraps_loop_invariants():
+    program = """
+        def move(Circle circle){
+            circle.move(1.0, 1.0);
+        }
+        def main(){
+            Circle a = Circle(0.0, 0.0, 1.0);
+            Circle b = Circle(0.0, 0.0, 1.0);
+            Circle c = Circle(0.0, 0.0, 1.0);
+            Circle d = Circle(0.0, 0.0, 1.0);
+            int i = 0;
+            while (i < 2) {
+                print(a.area() * 2.0 + b.area(), c.d(), d.r());
+                int j = 0;
+                while (j < 2) {
+                    print(a.perimeter(), b.r());
+                    j = j + 1;
+                }
+                b.move(1.0, 1.0);
+                c = d;
+                move(d);
+                i = i + 1;
+            }
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        parser = OptimizingParser(Parser(lexer, ErrorManager()))
+        tree = parser.parse_program()
+    loop = tree.objects[1].block.statements[5]
+    printed, _, nested_loop = loop.block.statements[:3]
+    assert loop.invariants == [
+        printed.arguments[0].left,
+        nested_loop.block.statements[0].arguments[0],
+    ]
+    assert str(loop.invariants[0]).startswith("InvariantExpression(MulExp")
+    assert isinstance(printed.arguments[0].right, CallExpression)
+    assert isinstance(printed.arguments[1], CallExpression)
+    assert isinstance(printed.arguments[2], CallExpression)
+    assert nested_loop.invariants == [
+        nested_loop.block.statements[0].arguments[1]
+    ]
+
+
+MEMOIZATION_DATA = [
+    (
+        """
+        def int fib(int n){
+            if (n < 2) {
+                return n;
+            } else {
+                return fib(n - 1) + fib(n - 2);
+            }
+        }
+        def main(){
+            print(fib(20));
+            print(fib(20));
+        }
+        """,
+        100,
+        "6765\n6765\n",
+        "fib: 19 hits, 21 misses\n",
+    ),
+    (
+        """
+        def Circle circle(dec r){
+            return Circle(0.0, 0.0, r);
+        }
+        def main(){
+            Circle a = circle(1.0);
+            a.move(1.0, 1.0);
+            Circle b = circle(1.0);
+            b.move(2.0, 2.0);
+            print(a, circle(1.0), b);
+        }
+        """,
+        100,
+        "CircleCircleCircle\n",
+        "circle: 2 hits, 1 misses\n",
+    ),
+    (
+        """
+        def dec negate(dec x){
+            return -x;
+        }
+        def dec logged(dec x){
+            print(x);
+            return x;
+        }
+        def dec twice(dec x){
+            return logged(x) * 2.0;
+        }
+        def main(){
+            print(negate(0.0), negate(-0.0), negate(0.0));
+            print(twice(1.0), twice(1.0));
+        }
+        """,
+        100,
+        "-0.00.0-0.0\n1.0\n1.0\n2.02.0\n",
+        "negate: 1 hits, 2 misses\n",
+    ),
+    (
+        """
+        def int square(int n){
+            return n * n;
+        }
+        def main(){
+            print(square(2), square(3), square(2), square(2));
+        }
+        """,
+        1,
+        "4944\n",
+        "square: 1 hits, 3 misses\n",
+    ),
+    (
+        """
+        def int same(int n){
+            return n;
+        }
+        def int last(){
+            same(1);
+        }
+        def main(){
+            print(same(1), last());
+        }
+        """,
+        4,
+        "11\n",
+        "same: 1 hits, 1 misses\nlast: 0 hits, 1 misses\n",
+    ),
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("stream,size,expected,statistics", MEMOIZATION_DATA)
+def test_memoized_program_accept(
+    engine, stream, size, expected, statistics, capfd
+):
+    with io.StringIO(stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        interpreter = engine(Parser(lexer, ErrorManager()), memo_size=size)
+        interpreter.interpret()
+        print_cache_statistics(interpreter.caches)
+    out, err = capfd.readouterr()
+    assert out == expected
+    assert err == statistics
+
+
+def test_interpreter_binds_call_sites_and_reuses_frames(capfd):
+    program = """
+        def int fib(int n){
+            if (n < 2) {
+                return n;
+            } else {
+                return fib(n - 1) + fib(n - 2);
+            }
+        }
+        def main(){
+            print(fib(10));
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        interpreter = Interpreter(Parser(lexer, ErrorManager()))
+        interpreter.interpret()
+    out, _ = capfd.readouterr()
+    assert out == "55\n"
+    target = interpreter.targets["fib"]
+    assert target.value_types == (int,)
+    assert target.return_type is int
+    assert len(target.free_frames) == 10
+    sites = [
+        site
+        for site in interpreter.call_sites.values()
+        if site is not None and site.target is target
+    ]
+    assert len(sites) == 3
+
+
+def test_interpreter_caches_methods_per_class(capfd):
+    program = """
+        def main(){
+            Canvas c = Canvas();
+            c.push(Circle(0.0, 0.0, 1.0));
+            c.push(Square(0.0, 0.0, 2.0));
+            c.push(Circle(0.0, 0.0, 2.0));
+            for (Shape shape : c) {
+                print(shape.perimeter());
+            }
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        interpreter = Interpreter(Parser(lexer, ErrorManager()))
+        interpreter.interpret()
+    out, _ = capfd.readouterr()
+    assert out == (
+        f"{Circle(0.0, 0.0, 1.0).perimeter()}\n8.0\n"
+        f"{Circle(0.0, 0.0, 2.0).perimeter()}\n"
+    )
+    method_site = next(
+        method_site
+        for method_site in interpreter.method_sites.values()
+        if method_site is not None and method_site.name == "perimeter"
+    )
+    assert method_site.root_slot is not None
+    assert method_site.functions == {
+        Circle: Circle.perimeter,
+        Square: Square.perimeter,
+    }
+
+
+def test_shape_store_keeps_aliases_of_shapes():
+    canvas = Canvas()
+    circle = Circle(0.0, 0.0, 1.0)
+    canvas.push(circle)
+    canvas.push(Square(1.0, 2.0, 3.0))
+    canvas.push(circle)
+    circle.move(1.0, 1.0)
+    first, square, last = canvas.shapes
+    assert first is circle and last is circle
+    assert type(square) is Square
+    assert (square.x, square.y, square.side_a) == (1.0, 2.0, 3.0)
+    square.move(1.0, 1.0)
+    del first, square, last
+    _, square, _ = canvas.shapes
+    assert (square.x, square.y) == (2.0, 3.0)
+    assert copy(circle).bindings == ()
+    assert canvas.pop() is circle
+    assert len(circle.bindings) == 1
+    assert canvas.pop() is square
+    assert not square.bindings
+    square.move(1.0, 1.0)
+    assert (square.x, square.y) == (3.0, 4.0)
+
+
+def test_shape_store_keeps_aliases_of_dropped_shapes():
+    first, second = Canvas(), Canvas()
+    circle = Circle(0.0, 0.0, 1.0)
+    first.push(circle)
+    first.push(circle)
+    second.push(circle)
+    del circle
+    for shape in first.shapes:
+        shape.move(1.0, 0.0)
+    assert [shape.x for shape in first.shapes] == [2.0, 2.0]
+    assert [shape.x for shape in second.shapes] == [2.0]
+    shapes = [*first.shapes, *second.shapes]
+    assert all(shape is shapes[0] for shape in shapes)
+    del shape, shapes
+    popped = first.pop()
+    assert first.pop() is popped and len(first.shapes) == 0
+    popped.move(1.0, 0.0)
+    assert [shape.x for shape in second.shapes] == [3.0]
+
+
+def test_shape_store_grows_and_pops_in_order():
+    canvas = Canvas()
+    shapes = [
+        Polygon(float(index), 0.5, 1.0, index + 3)
+        if index % 3
+        else Circle(float(index), 0.5, 2.0)
+        for index in range(100)
+    ]
+    for shape in shapes:
+        canvas.push(shape)
+    pushed = [vars(shape) for shape in shapes]
+    del shape, shapes
+    assert len(canvas.shapes) == 100
+    assert [vars(shape) for shape in canvas.shapes] == pushed
+    assert type(next(iter(canvas.shapes)).x) is float
+    popped = [vars(canvas.pop()) for _ in range(100)]
+    assert popped == [
+        {**values, "bindings": []} for values in reversed(pushed)
+    ]
+    assert type(popped[1]["num_n"]) is int
+    with pytest.raises(IndexError):
+        canvas.pop()
+
+
+def test_function_cache_copies_shapes():
+    cache = FunctionCache("circle", 1, copy=True)
+    circle = Circle(0.0, 0.0, 1.0)
+    cache.put((1.0,), circle)
+    circle.move(1.0, 1.0)
+    first, second = cache.get((1.0,)), cache.get((1.0,))
+    assert first is not second
+    assert (first.x, first.y, first.radius) == (0.0, 0.0, 1.0)
+    cache.put((2.0,), circle)
+    assert cache.get((1.0,)) is MISSING
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_purity_analyzer_finds_memoizable_functions():
+    program = """
+        def dec size(Circle circle){
+            return circle.area();
+        }
+        def dec moved(Circle circle){
+            circle.move(1.0, 1.0);
+            return circle.area();
+        }
+        def Circle unit(){
+            return Circle(0.0, 0.0, 1.0);
+        }
+        def Circle same(Circle circle){
+            return circle;
+        }
+        def int count(Canvas canvas){
+            int n = 0;
+            for (Shape shape : canvas) {
+                n = n + 1;
+            }
+            return n;
+        }
+        def int even(int n){
+            if (n == 0) {
+                return 1;
+            } else {
+                return odd(n - 1);
+            }
+        }
+        def int odd(int n){
+            if (n == 0) {
+                return 0;
+            } else {
+                return even(n - 1);
+            }
+        }
+        def int shown(int n){
+            print(n);
+            return n;
+        }
+        def int hidden(int n){
+            return shown(n);
+        }
+        def main(){
+            print(size(unit()));
+        }
+        """
+    with io.StringIO(program) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        tree = Parser(lexer, ErrorManager()).parse_program()
+    assert PurityAnalyzer().memoizable(tree) == [
+        "size",
+        "unit",
+        "even",
+        "odd",
+    ]
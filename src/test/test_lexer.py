@@ -1,4 +1,7 @@
+import glob
 import io
+import os
+import random
 
 import pytest
 
@@ -9,8 +12,11 @@ from error.error_lexer import (CommentOverflowError, DecimalOverflowError,
                                UnexpectedCharacterError,
                                UnexpectedNewLineSymbolError,
                                UnterminatedStringError)
+from lexer.token_manager import TokenTape
 from src.error.error_manager import ErrorManager
 from src.lexer.lexer import Lexer
+from src.lexer.mmap_lexer import MmapLexer
+from src.lexer.regex_lexer import RegexLexer
 from src.lexer.token_manager import TokenType
 
 TestCorrectTokensData: list[tuple[str, TokenType]] = [
@@ -210,3 +216,132 @@ def test_error_types(stream, expected):
         while lexer.next_token().token_type.name != TokenType.EOF.name:
             pass
         assert type(lexer.error_manager.errors[0]) == expected
+
+
+def _collect_tokens(lexer: Lexer) -> list[tuple[str, str, str]]:
+    tokens = []
+    while True:
+        token = lexer.next_token()
+        tokens.append(
+            (token.token_type.name, token.value, str(token.position))
+        )
+        if token.token_type.name == TokenType.EOF.name:
+            return tokens
+
+
+EXAMPLES_PATH: str = os.path.join(
+    os.path.dirname(__file__), "..", "..", "examples", "*.txt"
+)
+
+TestExamplesData: list[str] = [
+    open(path).read() for path in sorted(glob.glob(EXAMPLES_PATH))
+]
+
+TestBufferedData: list[str] = (
+    [stream for stream, _ in TestCorrectTokensData]
+    + [stream for stream, _ in TestMultiTokensData]
+    + [stream for stream, _ in TestErrorsData]
+    + TestUndefinedTokensData
+    + TestExamplesData
+    + ["a\r\n  b\r\n\tc", "a\rb\r\r c # x\r", "x\n\n\r y", "\n\r  z\n\r"]
+)
+
+
+def _lex(
+    lexer_type: type[Lexer], stream: str, buffer_size: int
+) -> tuple[list[tuple[str, str, str]], list[str]]:
+    with io.StringIO(stream) as stream_input:
+        return _lex_stream(lexer_type, stream_input, buffer_size)
+
+
+def _lex_stream(
+    lexer_type: type[Lexer], stream: io.IOBase, buffer_size: int
+) -> tuple[list[tuple[str, str, str]], list[str]]:
+    lexer = lexer_type(stream, ErrorManager(), 20, 20, 300, buffer_size)
+    lexer.error_manager.errors = []
+    tokens = _collect_tokens(lexer)
+    errors = [str(error) for error in lexer.error_manager.errors]
+    return tokens, errors
+
+
+@pytest.mark.parametrize("buffer_size", [1, 2, 7, 4096, -1])
+@pytest.mark.parametrize("stream", TestBufferedData)
+def test_buffered_lexer(stream, buffer_size):
+    assert _lex(Lexer, stream, buffer_size) == _lex(Lexer, stream, 0)
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        " " * 5000 + "abc",
+        "x = 1; #" + "c" * 5000 + "\ny",
+        "a" * 5000 + " b",
+        '"' + "s" * 5000 + '" b',
+    ],
+)
+def test_buffered_lexer_long_runs(stream):
+    assert _lex(Lexer, stream, 1) == _lex(Lexer, stream, 0)
+
+
+FRAGMENTS: list[str] = [
+    "abc", "_x", "x_1", "Circle", "and", "0", "007", "12", "2147483647",
+    "99999999999", "1.5", "1.", "1.5.3", "3.14159265358979", "\u0663",
+    "x\u0663", "\u00b2", '"str"', '"a\\"b"', '"a\\\\"', '"unterminated',
+    "#comment", "# c2", ">", ">=", "=", "==", "!", "!=", "<", "<=", "+",
+    "-", "(", ")", "{", "}", ";", ".", ",", ":", "[", "]", "@", "$", " ",
+    "  ", "\t", "\n", "\r\n", "\r", "\x0b", "\u2028", "\u00e9", "\u0105",
+    "\U0001f600", "averyveryverylongidentifier", '"' + "s" * 25 + '"',
+    '"za\u017c\u00f3\u0142\u0107"', "# komentarz \u0105", '"\\\u0105"', "\x1c",
+]
+
+random.seed(2023)
+TestRandomData: list[str] = [
+    "".join(random.choices(FRAGMENTS, k=random.randint(1, 30)))
+    for _ in range(300)
+]
+
+
+@pytest.mark.parametrize("buffer_size", [2, 7, 4096, -1])
+@pytest.mark.parametrize("stream", TestBufferedData + TestRandomData)
+def test_regex_lexer(stream, buffer_size):
+    assert _lex(RegexLexer, stream, buffer_size) == _lex(Lexer, stream, 0)
+
+
+@pytest.mark.parametrize("buffer_size", [1, -1])
+@pytest.mark.parametrize("stream", TestBufferedData + TestRandomData)
+def test_mmap_lexer(stream, buffer_size, tmp_path):
+    path = tmp_path / "code.txt"
+    path.write_bytes(stream.encode())
+    with open(path, "rb") as file:
+        tokens = _lex_stream(MmapLexer, file, buffer_size)
+    assert tokens == _lex(Lexer, stream, 0)
+
+
+def test_mmap_lexer_releases_pages(tmp_path):
+    stream = "\n".join(TestExamplesData) * 20
+    path = tmp_path / "code.txt"
+    path.write_bytes(stream.encode())
+    with open(path, "rb") as file:
+        tokens = _lex_stream(MmapLexer, file, 4096)
+    assert tokens == _lex(Lexer, stream, 0)
+
+
+@pytest.mark.parametrize("stream", TestBufferedData)
+def test_token_tape(stream):
+    with io.StringIO(stream) as stream_input:
+        tape = TokenTape.from_lexer(
+            Lexer(stream_input, ErrorManager(), 20, 20, 300)
+        )
+    tokens = [
+        (token.token_type.name, token.value, str(token.position))
+        for token in tape
+    ]
+    assert tokens == _lex(Lexer, stream, 0)[0]
+    assert tape.token_type(len(tape) - 1).name == "EOF"
+
+
+def test_identifiers_are_interned():
+    with io.StringIO("shape_name = shape_name_2;" * 2) as stream_input:
+        tape = TokenTape.from_lexer(Lexer(stream_input, ErrorManager()))
+    assert tape[0].value is tape[4].value
+    assert not hasattr(tape[0], "__dict__")
@@ -883,3 +883,33 @@ def test_missing_argument_error_statement():
         parser.error_manager.errors = []
         parser.parse_program()
         assert type(parser.error_manager.errors[0]) == MissingArgumentError
+
+
+def test_node_positions():
+    main_stream = "def main() {\n    x = 1 + y;\n    print(x);\n}"
+    with io.StringIO(main_stream) as stream_input:
+        lexer = LexerForParser(stream_input, ErrorManager())
+        function = Parser(lexer, ErrorManager()).parse_program().objects[0]
+    assignment, call = function.block.statements
+    assert function.position == Position(4, 2)
+    assert assignment.position == Position(3, 10)
+    assert call.position == Position(3, 14)
+    assert assignment.expression.position == Position(2, 14)
+    assert assignment.expression.left.position == Position(2, 9)
+    with pytest.raises(AttributeError):
+        assignment.position.line = 1
+
+
+@pytest.mark.parametrize(
+    "node_class",
+    [
+        AndExpression, BooleanExpression, CallExpression, CastExpression,
+        DecimalExpression, IdentifierExpression, IntegerExpression,
+        MulExpression, NegatedExpression, OrExpression, RelativeExpression,
+        StringExpression, SumExpression, AssignmentStatement,
+        DeclarationStatement, IfStatement, IterateStatement, ReturnStatement,
+        WhileStatement, Block,
+    ],
+)
+def test_nodes_have_no_instance_dict(node_class):
+    assert node_class.__dictoffset__ == 0
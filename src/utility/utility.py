@@ -1,7 +1,10 @@
+import re
+from inspect import signature
 from parser.objects.type import (Bool, Canvas, Circle, Dec, Int, Polygon,
                                  Rectangle, Rhomb, Shape, Square, String,
                                  Trapeze, Triangle, Type)
 
+from lexer.position import Position
 from lexer.token_manager import TokenType
 
 MAX_INT: int = 2**31 - 1
@@ -11,6 +14,24 @@ MAX_IDENTIFIER_LENGTH: int = 200
 NL_TYPES: list[str] = ["\n", "\r", "\r\n", "\n\r"]
 EOF_CHARS: list[str] = ["", None]
 MAX_REC_DEPTH: int = 100
+LEXER_BUFFER_SIZE: int = 2**16
+
+WHITE_RUNS: dict[str, re.Pattern] = {
+    None: re.compile(r"[^\S\r\n]*"),
+    "\n": re.compile(r"[^\S\r]*"),
+    "\r": re.compile(r"[^\S\n]*"),
+    "\r\n": re.compile(r"[^\S\r\n]*"),
+    "\n\r": re.compile(r"[^\S\r\n]*"),
+}
+IDENTIFIER_RUN: re.Pattern = re.compile(r"\w*")
+STRING_RUN: re.Pattern = re.compile(r'[^"\\]*')
+COMMENT_RUNS: dict[str, re.Pattern] = {
+    None: re.compile(r"[^\r\n]*"),
+    "\n": re.compile(r"[^\n]*"),
+    "\r": re.compile(r"[^\r]*"),
+    "\r\n": re.compile(r"[^\r\n]*"),
+    "\n\r": re.compile(r"[^\r\n]*"),
+}
 
 SINGLE_TOKENS: dict[str, TokenType] = {
     "+": TokenType.ADD,
@@ -36,6 +57,35 @@ DOUBLE_TOKENS: dict[str, tuple[str, TokenType, TokenType]] = {
     "!": ("=", TokenType.NOT, TokenType.NOT_EQUAL),
 }
 
+TOKEN_PATTERN: re.Pattern = re.compile(
+    r"(\s*)"
+    r"(?:(?P<identifier>[A-Za-z]\w*)"
+    r"|(?P<decimal>(?P<integer_part>[0-9]+)\.(?P<fraction>[0-9]+))"
+    r"(?!\d)"
+    r"|(?P<integer>[0-9]+)(?![\d.])"
+    rf"|(?P<double>[{re.escape(''.join(DOUBLE_TOKENS))}]=?)"
+    rf"|(?P<single>[{re.escape(''.join(SINGLE_TOKENS))}])"
+    r'|"(?P<string>(?:[^"\\]|\\.)*)"'
+    r"|(?P<comment>\#))",
+    re.DOTALL,
+)
+MMAP_TOKEN_PATTERN: re.Pattern = re.compile(
+    rb"([ \t\n\r\f\v]*)"
+    rb"(?:(?P<identifier>[A-Za-z]\w*)(?![\w\x80-\xff])"
+    rb"|(?P<decimal>(?P<integer_part>[0-9]+)\.(?P<fraction>[0-9]+))"
+    rb"(?![0-9\x80-\xff])"
+    rb"|(?P<integer>[0-9]+)(?![0-9.\x80-\xff])"
+    + rf"|(?P<double>[{re.escape(''.join(DOUBLE_TOKENS))}]=?)".encode()
+    + rf"|(?P<single>[{re.escape(''.join(SINGLE_TOKENS))}])".encode()
+    + rb'|"(?P<string>(?:[^"\\]|\\.)*)"'
+    rb"|(?P<comment>\#))",
+    re.DOTALL,
+)
+MMAP_COMMENT_RUNS: dict[str, re.Pattern] = {
+    new_line_char: re.compile(pattern.pattern.encode())
+    for new_line_char, pattern in COMMENT_RUNS.items()
+}
+
 KEYWORDS: dict[str, TokenType] = {
     "and": TokenType.AND,
     "or": TokenType.OR,
@@ -122,6 +172,14 @@ OBJECT_TYPES: dict[Type, type] = {
     "Canvas": Canvas,
 }
 
+OBJECT_PARAMETERS: dict[type, tuple[tuple[type, str], ...]] = {
+    object_type: tuple(
+        (parameter.annotation, name)
+        for name, parameter in signature(object_type).parameters.items()
+    )
+    for object_type in OBJECT_TYPES.values()
+}
+
 ALL_TYPES: dict[type, str] = {
     int: "int",
     float: "dec",
@@ -142,15 +200,3 @@ ALL_TYPES: dict[type, str] = {
     Bool: "bool",
     String: "String",
 }
-
-
-class Position:
-    line: int
-    column: int
-
-    def __init__(self, line: int, column: int) -> None:
-        self.line = line
-        self.column = column
-
-    def __str__(self) -> str:
-        return f"{self.line}, {self.column}"